@@ -0,0 +1,61 @@
+"""
+Shared setup for the benchmark scripts in this directory.
+
+Importing this module puts the repository root on sys.path and gives main
+the environment it needs, so `python bench/<script>.py` works from anywhere.
+"""
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+os.environ.setdefault("TRANSCRIPT_WAL_DIR", "")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def webhook_words(text: str, start: float, end: float) -> List[Dict]:
+    """Recall.ai-style word dicts with evenly spaced timings."""
+    tokens = text.split()
+    step = (end - start) / max(len(tokens), 1)
+    return [
+        {
+            "text": token,
+            "start_timestamp": {"relative": start + step * i, "absolute": f"2024-01-01T00:00:{(start + step * i) % 60:06.3f}Z"},
+            "end_timestamp": {"relative": start + step * (i + 1), "absolute": f"2024-01-01T00:00:{(start + step * (i + 1)) % 60:06.3f}Z"},
+        }
+        for i, token in enumerate(tokens)
+    ]
+
+def transcript_event(bot_id: str, text: str, start: float, end: float, participant_id: int = 1,
+                     event: str = "transcript.data") -> Dict:
+    """A Recall.ai transcript webhook payload."""
+    participant = {"id": participant_id, "name": f"Speaker {participant_id}", "is_host": participant_id == 1}
+    data = {"words": webhook_words(text, start, end), "participant": participant}
+    return {"event": event, "data": {"bot": {"id": bot_id}, "data": data}}
+
+def timed(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Best wall time of `repeat` runs of fn, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+async def fill_bot(bot_id: str, count: int, words: int = 12, batch_size: int = 100):
+    """Ingest `count` final segments for a bot through the same path as webhooks."""
+    import main
+
+    for first in range(0, count, batch_size):
+        events = []
+        for i in range(first, min(first + batch_size, count)):
+            text = " ".join(f"word{i}-{w}" for w in range(words))
+            data = transcript_event(bot_id, text, i * 4.0, i * 4.0 + 3.5, participant_id=1 + i % 3)["data"]["data"]
+            events.append(("transcript.data", data["words"], data["participant"], data))
+        await main.process_transcript_batch(bot_id, events)
+
+def percentiles(samples: List[float]):
+    """(p50, p99) of a list of durations."""
+    samples = sorted(samples)
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
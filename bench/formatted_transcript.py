@@ -0,0 +1,68 @@
+"""
+Formatted transcript request cost at 10k segments: joining the stream lines
+and SRT / WebVTT cues cached at ingest against formatting every segment on
+each request, then the end-to-end time of the endpoints that serve them.
+
+    python bench/formatted_transcript.py [--segments 10000] [--rounds 50]
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+import common
+import main
+from segments import format_srt_cue, format_stream_line, format_vtt_cue
+
+BOT_ID = "bench-formatted"
+
+def time_calls(fn, rounds: int):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return common.percentiles(samples)
+
+async def time_requests(client: httpx.AsyncClient, url: str, rounds: int):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        resp = await client.get(url)
+        samples.append(time.perf_counter() - started)
+        assert resp.status_code == 200
+    return common.percentiles(samples)
+
+def report(name: str, p50: float, p99: float):
+    print(f"{name:46s} p50 {p50 * 1e3:7.2f} ms  p99 {p99 * 1e3:7.2f} ms")
+
+async def run(count: int, rounds: int):
+    await common.fill_bot(BOT_ID, count)
+    page = await main.transcript_store.read(BOT_ID)
+    segments = page.segments()
+
+    cases = {
+        "stream lines, formatted per request": lambda: "\n".join(format_stream_line(seg) for seg in segments),
+        "stream lines, cached": lambda: "\n".join(page.stream_lines()),
+        "SRT cues, formatted per request": lambda: "\n".join(f"{i}\n{format_srt_cue(seg)}" for i, seg in enumerate(segments, 1)),
+        "SRT cues, cached": lambda: "\n".join(f"{i}\n{cue}" for i, cue in enumerate(page.srt_cues(), 1)),
+        "WebVTT cues, formatted per request": lambda: "".join(format_vtt_cue(seg) for seg in segments),
+        "WebVTT cues, cached": lambda: "".join(page.vtt_cues()),
+    }
+    for name, fn in cases.items():
+        report(name, *time_calls(fn, rounds))
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for url in [f"/bot/{BOT_ID}/live-transcript/stream",
+                    f"/bots/{BOT_ID}/transcript/export?format=srt",
+                    f"/bots/{BOT_ID}/transcript/export?format=vtt&stream=true"]:
+            report(f"GET {url.split(BOT_ID)[1]}", *await time_requests(client, url, rounds))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segments", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.segments, args.rounds))
@@ -0,0 +1,59 @@
+"""
+Ingest throughput: events/sec of the batched ingest workers against the old
+path, which spawned one task per webhook event and wrote each event to the
+store on its own.
+
+    python bench/ingest_throughput.py [--events 20000] [--bots 20]
+"""
+import argparse
+import asyncio
+import time
+
+import common
+import main
+
+def make_events(run: str, count: int, bots: int):
+    """Four partials for every final, spread round-robin over the bots."""
+    events = []
+    for i in range(count):
+        bot_id = f"bench-{run}-{i % bots}"
+        turn = i // (bots * 5)
+        final = i % 5 == 4
+        event_type = "transcript.data" if final else "transcript.partial_data"
+        payload = common.transcript_event(bot_id, f"turn {turn} word {i % 5} " * 4, turn, turn + 1, event=event_type)
+        data = payload["data"]["data"]
+        events.append((bot_id, (event_type, data["words"], data["participant"], data)))
+    return events
+
+async def per_event_tasks(events) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        asyncio.create_task(main.process_transcript_batch(bot_id, [event]))
+        for bot_id, event in events
+    ])
+    return time.perf_counter() - started
+
+async def ingest_pipeline(events) -> float:
+    pipeline = main.ingest_pipeline
+    pipeline.capacity = len(events)
+    pipeline.start()
+    started = time.perf_counter()
+    for bot_id, event in events:
+        pipeline.offer(bot_id, event, high_priority=event[0] != "transcript.partial_data")
+    await pipeline.join()
+    elapsed = time.perf_counter() - started
+    await pipeline.stop()
+    return elapsed
+
+async def run(count: int, bots: int):
+    for name, path in [("per-event tasks", per_event_tasks), ("ingest pipeline", ingest_pipeline)]:
+        events = make_events(name.split()[0], count, bots)
+        elapsed = await path(events)
+        print(f"{name:16s} {count / elapsed:10.0f} events/s  ({elapsed * 1e3:.0f} ms for {count} events)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--bots", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.bots))
@@ -0,0 +1,79 @@
+"""
+Per-request JSON cost of /live-transcript at 10k segments: splicing the
+segment bytes serialized once at ingest (json_envelope; words are rendered
+per request from the compact word buffers) against encoding every segment
+dict on each request the way a plain dict response was, measured in CPU
+time, with and without words, then the end-to-end endpoint time.
+
+    python bench/json_serialization.py [--segments 10000] [--rounds 10]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+
+import common
+import main
+from segments import orjson
+
+BOT_ID = "bench-json"
+
+def cpu_time(fn, rounds: int):
+    samples = []
+    for _ in range(rounds):
+        started = time.process_time()
+        fn()
+        samples.append(time.process_time() - started)
+    return common.percentiles(samples)
+
+def report(name: str, p50: float, p99: float):
+    print(f"{name:42s} p50 {p50 * 1e3:7.2f} ms  p99 {p99 * 1e3:7.2f} ms")
+
+async def run(count: int, rounds: int):
+    await common.fill_bot(BOT_ID, count)
+    page = await main.transcript_store.read(BOT_ID)
+    segments = page.segments()
+    fields = {"total_segments": page.total, "next_cursor": page.next_cursor(0), "has_more": page.has_more}
+
+    def encode_per_request():
+        # What FastAPI did for the dict response: jsonable_encoder, then json.dumps
+        content = jsonable_encoder({"transcript": [seg.to_dict() for seg in segments], **fields})
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def encode_per_request_without_words():
+        content = jsonable_encoder({"transcript": [seg.to_dict(include_words=False) for seg in segments], **fields})
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def splice_cached():
+        return main.json_envelope("transcript", page.fragments(), fields).body
+
+    def splice_cached_without_words():
+        return main.json_envelope("transcript", page.fragments(include_words=False), fields).body
+
+    assert json.loads(encode_per_request()) == json.loads(splice_cached())
+    assert json.loads(encode_per_request_without_words()) == json.loads(splice_cached_without_words())
+    print(f"orjson {'installed' if orjson is not None else 'not installed, stdlib encoder'}")
+    report("CPU, encode segment dicts per request", *cpu_time(encode_per_request, rounds))
+    report("CPU, splice cached segment bytes", *cpu_time(splice_cached, rounds))
+    report("CPU, encode dicts per request, no words", *cpu_time(encode_per_request_without_words, rounds))
+    report("CPU, splice cached bytes, no words", *cpu_time(splice_cached_without_words, rounds))
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            resp = await client.get(f"/bot/{BOT_ID}/live-transcript")
+            samples.append(time.perf_counter() - started)
+            assert resp.status_code == 200
+        report("GET /live-transcript", *common.percentiles(samples))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segments", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.segments, args.rounds))
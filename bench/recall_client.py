@@ -0,0 +1,98 @@
+"""
+Recall.ai client latency: calls to a local fake Recall API through the
+shared pooled client (main.recall_request) against the old pattern of one
+httpx.AsyncClient per call. The fake server charges a simulated TCP/TLS
+handshake on every new connection and a fixed processing time per request.
+
+    python bench/recall_client.py [--requests 500] [--concurrency 20] [--handshake-ms 30] [--latency-ms 20]
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+import common  # noqa: F401  (puts the repo on sys.path)
+import main
+
+class FakeRecall:
+    """Minimal HTTP/1.1 keep-alive server standing in for the Recall.ai API."""
+
+    def __init__(self, handshake: float, latency: float):
+        self.handshake = handshake
+        self.latency = latency
+        self.connections = 0
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.serve, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        await asyncio.sleep(self.handshake)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(self.latency)
+                body = b'{"id":"bot-bench","status_changes":[]}'
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+async def client_per_call(base_url: str):
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        return await client.get(f"{base_url}/bot/bot-bench")
+
+async def shared_client(base_url: str):
+    return await main.recall_request("get_bot", "GET", "/bot/bot-bench")
+
+async def run(args):
+    fake = FakeRecall(args.handshake_ms / 1000, args.latency_ms / 1000)
+    base_url = await fake.start()
+    main.recall_rate_limiter = main.TokenBucket(0, 1)
+    main.recall_client = main.create_recall_client()
+    main.recall_client.base_url = httpx.URL(base_url)
+
+    for name, call in [("client per call", client_per_call), ("shared client", shared_client)]:
+        fake.connections = 0
+        latencies = []
+
+        async def timed_call():
+            started = time.perf_counter()
+            resp = await call(base_url)
+            latencies.append(time.perf_counter() - started)
+            assert resp.status_code == 200
+
+        started = time.perf_counter()
+        await main.gather_bounded([timed_call() for _ in range(args.requests)], args.concurrency)
+        wall = time.perf_counter() - started
+        latencies.sort()
+        print(f"{name:16s} p50 {latencies[len(latencies) // 2] * 1e3:6.1f} ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:6.1f} ms  "
+              f"{args.requests / wall:7.1f} req/s  {fake.connections} connections")
+
+    await main.recall_client.aclose()
+    await fake.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,75 @@
+"""
+Search query latency over a 1M-word index: build a SearchIndex from
+synthetic meetings with a Zipf-like vocabulary, then time BM25 queries
+for common, mid-frequency and rare terms, across all bots and for one bot.
+Also times removing half the bots, which compacts the index.
+
+    python bench/search_latency.py [--words 1000000] [--bots 50]
+"""
+import argparse
+import itertools
+import random
+import time
+
+import common
+from search_index import SearchIndex
+from segments import TranscriptSegment
+
+WORDS_PER_SEGMENT = 20
+VOCABULARY = 20000
+
+def build_index(words: int, bots: int, rng: random.Random) -> SearchIndex:
+    vocabulary = [f"term{rank}" for rank in range(VOCABULARY)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY)))
+    index = SearchIndex()
+    segment_count = words // WORDS_PER_SEGMENT
+    per_bot = segment_count // bots
+    for b in range(bots):
+        batch = []
+        for seq in range(1, per_bot + 1):
+            text = " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=WORDS_PER_SEGMENT))
+            data = common.transcript_event(f"bot-{b}", text, seq, seq + 1)["data"]["data"]
+            seg = TranscriptSegment.from_webhook("transcript.data", data["words"], data["participant"], data)
+            seg.seq = seq
+            batch.append(seg)
+        index.add(f"bot-{b}", batch)
+    return index
+
+def time_queries(index: SearchIndex, queries, bot_id=None, rounds: int = 20):
+    samples = []
+    for _ in range(rounds):
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, bot_id, 10)
+            samples.append(time.perf_counter() - started)
+    return common.percentiles(samples)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--bots", type=int, default=50)
+    args = parser.parse_args()
+    rng = random.Random(18)
+
+    started = time.perf_counter()
+    index = build_index(args.words, args.bots, rng)
+    print(f"indexed {sum(index.doc_length)} words in {len(index)} docs, {len(index.postings)} terms "
+          f"in {time.perf_counter() - started:.1f} s")
+
+    query_sets = {
+        "common terms": ["term0 term1", "term2 term5 term9"],
+        "mid-frequency terms": ["term100 term250", "term500 term900 term1500"],
+        "rare terms": ["term15000", "term12000 term19000"],
+    }
+    for name, queries in query_sets.items():
+        for scope, bot_id in [("all bots", None), ("one bot", "bot-0")]:
+            p50, p99 = time_queries(index, queries, bot_id)
+            print(f"{name:20s} {scope:9s} p50 {p50 * 1e3:7.2f} ms  p99 {p99 * 1e3:7.2f} ms")
+
+    started = time.perf_counter()
+    for b in range(0, args.bots, 2):
+        index.remove_bot(f"bot-{b}")
+    print(f"removed {args.bots // 2} bots in {time.perf_counter() - started:.2f} s, "
+          f"{len(index.doc_seq)} doc ids left for {len(index)} live docs")
+    p50, p99 = time_queries(index, query_sets["common terms"])
+    print(f"{'common terms':20s} {'all bots':9s} p50 {p50 * 1e3:7.2f} ms  p99 {p99 * 1e3:7.2f} ms  (after removal)")
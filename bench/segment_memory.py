@@ -0,0 +1,83 @@
+"""
+Transcript segment memory: tracemalloc-measured bytes per stored final of
+a TranscriptLog (compact segments plus the cached JSON, stream line and
+SRT / WebVTT cues it keeps for reads) against the list of plain dicts, with
+the webhook's word dicts, that was stored before. Bare TranscriptSegments
+are listed for reference.
+
+    python bench/segment_memory.py [--segments 10000] [--words 20]
+"""
+import argparse
+import json
+import tracemalloc
+
+import common
+from segments import TranscriptSegment
+from transcript_log import TranscriptLog
+
+def make_payloads(count: int, words: int):
+    """Webhook data as decoded JSON, so each payload owns its objects."""
+    return json.loads(json.dumps([
+        common.transcript_event("bench", " ".join(f"word{i}-{w}" for w in range(words)), i * 5.0, i * 5.0 + 4.0)["data"]["data"]
+        for i in range(count)
+    ]))
+
+def as_dict(data):
+    """The pre-compaction segment shape: one dict holding the webhook's word dicts."""
+    words = data["words"]
+    participant = data["participant"]
+    return {
+        "text": " ".join(word["text"] for word in words),
+        "speaker": participant.get("name"),
+        "participant_id": participant.get("id"),
+        "is_host": participant.get("is_host", False),
+        "start_timestamp": words[0]["start_timestamp"]["relative"],
+        "end_timestamp": words[-1]["end_timestamp"]["relative"],
+        "is_partial": False,
+        "timestamp": data.get("timestamp"),
+        "event_type": "transcript.data",
+        "words": words,
+    }
+
+def as_segment(data):
+    return TranscriptSegment.from_webhook("transcript.data", data["words"], data["participant"], data)
+
+def dict_list(payloads):
+    return [as_dict(data) for data in payloads]
+
+def segment_list(payloads):
+    return [as_segment(data) for data in payloads]
+
+def transcript_log(payloads):
+    log = TranscriptLog("bench")
+    for seq, data in enumerate(payloads, 1):
+        seg = as_segment(data)
+        seg.seq = seq
+        log.extend([seg])
+    return log
+
+def measure(store, count: int, words: int) -> int:
+    """Bytes still allocated after storing `count` segments."""
+    tracemalloc.start()
+    payloads = make_payloads(count, words)
+    kept = store(payloads)
+    del payloads  # only what the stored shape still references stays allocated
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segments", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=20)
+    args = parser.parse_args()
+
+    sample = make_payloads(1, args.words)[0]
+    assert as_segment(sample).words() == sample["words"], "segments must round-trip the webhook words"
+
+    cases = [("dict list", dict_list), ("TranscriptLog", transcript_log), ("bare segments", segment_list)]
+    results = {name: measure(store, args.segments, args.words) for name, store in cases}
+    for name, size in results.items():
+        print(f"{name:14s} {size / args.segments:8.0f} bytes/segment  ({size / 2**20:.1f} MiB for {args.segments})")
+    print(f"reduction      {results['dict list'] / results['TranscriptLog']:8.1f}x  (dict list / TranscriptLog)")
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from metrics import INGEST_QUEUE_WAIT
+
+logger = logging.getLogger(__name__)
+
+# handler(bot_id, events) processes one micro-batch of events for a single bot
+BatchHandler = Callable[[str, List[Any]], Awaitable[None]]
+
+class IngestPipeline:
+    """
+    Bounded webhook ingest queues drained by a fixed pool of worker coroutines.
+
+    Every bot is routed to one worker by a hash of its bot_id, so a bot's
+    events are always processed by the same worker in arrival order, and an
+    older batch can never land after a newer one. Each worker takes whatever
+    is queued for it (up to batch_size events), groups it by bot and hands
+    every group to the handler, so a burst of webhooks for one meeting costs
+    one store write instead of one task per event.
+
+    offer() is the admission-controlled entry point: events in flight
+    (queued or being processed) are capped at queue_size, and low-priority
+    events are refused earlier, once low_priority_ratio of that budget is
+    used, so they are shed before anything important is.
+    """
+
+    def __init__(self, handler: BatchHandler, workers: int = 4, queue_size: int = 10000,
+                 batch_size: int = 100, low_priority_ratio: float = 0.5):
+        self.handler = handler
+        self.worker_count = workers
+        self.batch_size = batch_size
+        # One queue per worker; their total size is bounded by in_flight
+        self.queues: List[asyncio.Queue] = [asyncio.Queue() for _ in range(workers)]
+        self.capacity = queue_size
+        self.low_priority_ratio = low_priority_ratio
+        self.in_flight = 0  # admitted events not processed yet
+        self.events_shed: Dict[str, int] = {"low_priority": 0, "high_priority": 0}
+        self._workers: List[asyncio.Task] = []
+
+        # Throughput / latency counters
+        self.started_at = time.monotonic()
+        self.events_received = 0
+        self.events_processed = 0
+        self.events_failed = 0
+        self.batches_processed = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.qsize() for queue in self.queues)
+
+    def start(self):
+        """Spawn the worker coroutines on the running event loop."""
+        if self._workers:
+            return
+        self.started_at = time.monotonic()
+        self._workers = [
+            asyncio.create_task(self._worker(queue), name=f"ingest-worker-{i}")
+            for i, queue in enumerate(self.queues)
+        ]
+
+    async def join(self):
+        """Wait until every queued event has been processed."""
+        for queue in self.queues:
+            await queue.join()
+
+    async def stop(self, timeout: float = 10.0):
+        """Let the workers drain queued events (up to timeout), then cancel them."""
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Ingest queue not drained within {timeout}s, {self.queue_depth} events dropped")
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def queue_for(self, bot_id: str) -> asyncio.Queue:
+        """The queue of the worker that owns bot_id."""
+        return self.queues[hash(bot_id) % len(self.queues)]
+
+    def offer(self, bot_id: str, event: Any, high_priority: bool = True) -> bool:
+        """
+        Queue one event without waiting. Returns False, counting the event
+        as shed, if the in-flight budget for its priority is used up.
+        """
+        limit = self.capacity if high_priority else int(self.capacity * self.low_priority_ratio)
+        if self.in_flight >= limit:
+            self.events_shed["high_priority" if high_priority else "low_priority"] += 1
+            return False
+        self.events_received += 1
+        self.in_flight += 1
+        self.queue_for(bot_id).put_nowait((bot_id, event, time.monotonic()))
+        return True
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._process_batch(batch)
+            finally:
+                self.in_flight -= len(batch)
+                for _ in batch:
+                    queue.task_done()
+
+    async def _process_batch(self, batch: List[Tuple[str, Any, float]]):
+        # Group per bot, keeping arrival order inside each group
+        grouped: Dict[str, List[Any]] = {}
+        for bot_id, event, _ in batch:
+            grouped.setdefault(bot_id, []).append(event)
+
+        for bot_id, events in grouped.items():
+            try:
+                await self.handler(bot_id, events)
+                self.events_processed += len(events)
+            except Exception as e:
+                self.events_failed += len(events)
+                logger.error(f"Ingest batch failed for bot {bot_id}: {str(e)}")
+
+        now = time.monotonic()
+        for _, _, enqueued_at in batch:
+            latency = now - enqueued_at
+            INGEST_QUEUE_WAIT.observe(latency)
+            self.latency_total += latency
+            if latency > self.latency_max:
+                self.latency_max = latency
+        self.batches_processed += 1
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        done = self.events_processed + self.events_failed
+        return {
+            "workers": len(self._workers),
+            "queue_depth": self.queue_depth,
+            "queue_capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "events_shed": dict(self.events_shed),
+            "events_received": self.events_received,
+            "events_processed": self.events_processed,
+            "events_failed": self.events_failed,
+            "batches_processed": self.batches_processed,
+            "avg_batch_size": round(done / self.batches_processed, 2) if self.batches_processed else None,
+            "events_per_second": round(self.events_processed / elapsed, 2),
+            "avg_latency_ms": round(self.latency_total / done * 1000, 3) if done else None,
+            "max_latency_ms": round(self.latency_max * 1000, 3),
+        }
@@ -0,0 +1,102 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from typing import Optional
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; fields passed via `extra=` become top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class SamplingFilter(logging.Filter):
+    """
+    Let through only a fraction of records below WARNING.
+    Used on hot-path loggers that would otherwise log on every webhook event.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return self.rate > 0.0 and random.random() < self.rate
+
+class TranscriptText:
+    """
+    Lazily rendered transcript text for log arguments.
+    Redacted to its length unless text logging is enabled, and only
+    rendered if the record is actually emitted.
+    """
+
+    __slots__ = ("text",)
+    log_text = False
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __str__(self) -> str:
+        if TranscriptText.log_text:
+            return self.text
+        return f"<redacted {len(self.text)} chars>"
+
+def configure_logging(level: str = "INFO", mode: str = "plain", log_transcript_text: bool = False):
+    """
+    Configure root logging.
+
+    mode="plain" keeps the classic basicConfig text output. mode="structured"
+    emits JSON lines, and handler I/O moves to a background listener thread
+    behind a QueueHandler so request coroutines never block on log writes.
+    """
+    global _listener
+    TranscriptText.log_text = log_transcript_text
+
+    if mode != "structured":
+        logging.basicConfig(level=level)
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Flush and stop the background log listener, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def hot_path_logger(name: str, sample_rate: float) -> logging.Logger:
+    """Return a child logger whose sub-WARNING records are sampled at sample_rate."""
+    hot_logger = logging.getLogger(name)
+    hot_logger.filters[:] = [SamplingFilter(sample_rate)]
+    return hot_logger
@@ -1,34 +1,583 @@
-from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Request, Response, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from pydantic import BaseModel
+from contextlib import asynccontextmanager
+from collections import OrderedDict
+import hashlib
+import random
+import tempfile
+import time
+import zlib
 import httpx
 import os
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set
 import asyncio
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+import metrics
+from ingest import IngestPipeline
+from log_config import TranscriptText, configure_logging, hot_path_logger
+from search_index import SearchIndex, make_snippet
+from segments import TranscriptSegment, dump_json
+from speaker_analytics import MeetingAnalytics
+from transcript_log import TranscriptLog
+from transcript_store import InMemoryTranscriptStore, PartialSlot, RedisTranscriptStore, TranscriptStore
+from wal import TranscriptWAL
 
 load_dotenv()
 
+# Configure logging (LOG_MODE=structured emits JSON through a background listener thread)
+configure_logging(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    mode=os.getenv("LOG_MODE", "plain"),
+    log_transcript_text=os.getenv("LOG_TRANSCRIPT_TEXT", "false").lower() in ("1", "true", "yes")
+)
+logger = logging.getLogger(__name__)
+
+# Per-event webhook logs go through a sampled logger so they stay cheap at high event rates
+hot_logger = hot_path_logger(f"{__name__}.hot_path", float(os.getenv("LOG_HOT_PATH_SAMPLE_RATE", "0.1")))
+
 # ENV variables
 RECALL_API_KEY = os.getenv("RECALL_API_KEY")
 RECALL_REGION = os.getenv("RECALL_REGION", "us-west-2")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
 
-app = FastAPI(title="Recall.ai Real-time Transcription Bot")
+# Recall.ai HTTP client tuning (one pooled client is shared for the app lifetime)
+RECALL_HTTP_MAX_CONNECTIONS = int(os.getenv("RECALL_HTTP_MAX_CONNECTIONS", "100"))
+RECALL_HTTP_MAX_KEEPALIVE = int(os.getenv("RECALL_HTTP_MAX_KEEPALIVE", "20"))
+RECALL_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("RECALL_HTTP_KEEPALIVE_EXPIRY", "30"))
+RECALL_HTTP_TIMEOUT = float(os.getenv("RECALL_HTTP_TIMEOUT", "30"))
+RECALL_HTTP_CONNECT_TIMEOUT = float(os.getenv("RECALL_HTTP_CONNECT_TIMEOUT", "10"))
+RECALL_HTTP2 = os.getenv("RECALL_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Client-side Recall.ai rate limit (token bucket) and retries on 429 / 5xx
+RECALL_RATE_LIMIT = float(os.getenv("RECALL_RATE_LIMIT", "10"))  # requests per second, 0 disables
+RECALL_RATE_BURST = int(os.getenv("RECALL_RATE_BURST", "20"))
+RECALL_MAX_RETRIES = int(os.getenv("RECALL_MAX_RETRIES", "3"))
+RECALL_RETRY_BACKOFF = float(os.getenv("RECALL_RETRY_BACKOFF", "0.5"))
+RECALL_RETRY_MAX_BACKOFF = float(os.getenv("RECALL_RETRY_MAX_BACKOFF", "8"))
+
+# Bulk bot launch: max meetings per /start-bots call and concurrent create calls per batch
+START_BOTS_MAX_BATCH = int(os.getenv("START_BOTS_MAX_BATCH", "500"))
+START_BOTS_CONCURRENCY = int(os.getenv("START_BOTS_CONCURRENCY", "10"))
+
+# Bot status responses are cached this long; concurrent polls share one upstream call
+STATUS_CACHE_TTL = float(os.getenv("STATUS_CACHE_TTL", "2"))
+
+# Summary generation settings
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "gpt-4o-mini")
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))
+SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "256"))
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", "600"))
+FINAL_RESULTS_MAX_BOTS = int(os.getenv("FINAL_RESULTS_MAX_BOTS", "1000"))  # stopped bots whose final summary / analytics are kept
+
+# Chunked (map-reduce) summaries: transcript text above SUMMARY_CHUNK_TOKENS is split into
+# chunks of at most that size, summarized SUMMARY_CHUNK_CONCURRENCY at a time, then merged
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "6000"))
+SUMMARY_CHUNK_CONCURRENCY = int(os.getenv("SUMMARY_CHUNK_CONCURRENCY", "4"))
+SUMMARY_CHUNK_CACHE_SIZE = int(os.getenv("SUMMARY_CHUNK_CACHE_SIZE", "2048"))
+
+# Output caps of summary calls; merged summaries must fit back into a chunk
+SUMMARY_MAX_TOKENS = 1000
+CHUNK_SUMMARY_MAX_TOKENS = 500
+if SUMMARY_CHUNK_TOKENS < SUMMARY_MAX_TOKENS:
+    raise RuntimeError(f"SUMMARY_CHUNK_TOKENS must be at least {SUMMARY_MAX_TOKENS}, the output cap of one summary call")
+
+# Live transcript push (SSE / WebSocket) settings
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("SUBSCRIBER_QUEUE_SIZE", "256"))
+SUBSCRIBER_HEARTBEAT_SECONDS = float(os.getenv("SUBSCRIBER_HEARTBEAT_SECONDS", "15"))
+
+# Webhook ingest pipeline settings
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "4"))
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "10000"))
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "100"))
+
+# Admission control: INGEST_QUEUE_SIZE also caps events in flight. Partials are
+# shed once this share of it is used; finals get a 503 + Retry-After only when it is full.
+INGEST_PARTIAL_SHED_RATIO = float(os.getenv("INGEST_PARTIAL_SHED_RATIO", "0.5"))
+INGEST_RETRY_AFTER = int(os.getenv("INGEST_RETRY_AFTER", "2"))
+
+# Streamed exports are flushed to the client in chunks of roughly this many characters
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "65536"))
+EXPORT_BATCH_SEGMENTS = 500
+
+# Partial results: at most one partial per participant is pushed to subscribers per window;
+# the newest one held back is pushed when the window closes
+PARTIAL_COALESCE_WINDOW = float(os.getenv("PARTIAL_COALESCE_WINDOW", "0.25"))
+
+# Final segments remembered per bot to drop webhook retries delivering the same final twice
+WEBHOOK_DEDUP_WINDOW = int(os.getenv("WEBHOOK_DEDUP_WINDOW", "1024"))
+
+# Memory management: budget for hot transcript data, idle-bot eviction and disk spill
+MEMORY_BUDGET_MB = float(os.getenv("MEMORY_BUDGET_MB", "512"))
+MEMORY_CHECK_INTERVAL = float(os.getenv("MEMORY_CHECK_INTERVAL", "30"))
+BOT_IDLE_TTL = float(os.getenv("BOT_IDLE_TTL", "3600"))
+HOT_SEGMENTS_PER_BOT = int(os.getenv("HOT_SEGMENTS_PER_BOT", "500"))
+TRANSCRIPT_SPILL_DIR = os.getenv("TRANSCRIPT_SPILL_DIR", os.path.join(tempfile.gettempdir(), "transcript-spill"))
+
+# Transcript store backend: "memory" (this process only) or "redis" (shared by all workers)
+TRANSCRIPT_STORE = os.getenv("TRANSCRIPT_STORE", "memory").lower()
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+TRANSCRIPT_STORE_PREFIX = os.getenv("TRANSCRIPT_STORE_PREFIX", "transcript")
+TRANSCRIPT_STORE_TTL = int(os.getenv("TRANSCRIPT_STORE_TTL", str(int(BOT_IDLE_TTL))))
+# With the Redis store, /search first indexes what other workers stored, this many bots at a time
+SEARCH_REFRESH_CONCURRENCY = int(os.getenv("SEARCH_REFRESH_CONCURRENCY", "16"))
+
+# Write-ahead log for the in-memory store, off unless TRANSCRIPT_WAL_DIR is set. Each
+# process needs its own directory; a second process on the same one refuses to start.
+# Startup replays the whole snapshot + log before serving: a few hundred ms for small
+# states, but about 15.6 s for 200k segments, so plan readiness probes accordingly.
+TRANSCRIPT_WAL_DIR = os.getenv("TRANSCRIPT_WAL_DIR", "")
+WAL_FSYNC = os.getenv("WAL_FSYNC", "false").lower() in ("1", "true", "yes")
+WAL_SNAPSHOT_INTERVAL = float(os.getenv("WAL_SNAPSHOT_INTERVAL", "300"))
+
+# How long shutdown waits for queued webhooks to be processed
+INGEST_DRAIN_TIMEOUT = float(os.getenv("INGEST_DRAIN_TIMEOUT", "10"))
+
+# Shared Recall.ai client, created in the lifespan hook
+recall_client: Optional[httpx.AsyncClient] = None
+
+def create_recall_client() -> httpx.AsyncClient:
+    """
+    Build the pooled Recall.ai client. Connections are kept alive between calls
+    so bursts of bot launches reuse TCP/TLS sessions instead of re-handshaking.
+    """
+    http2 = RECALL_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("RECALL_HTTP2 is enabled but the 'h2' package is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        base_url=f"https://{RECALL_REGION}.recall.ai/api/v1",
+        headers={"Authorization": f"Token {RECALL_API_KEY}"},
+        limits=httpx.Limits(
+            max_connections=RECALL_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=RECALL_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=RECALL_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(RECALL_HTTP_TIMEOUT, connect=RECALL_HTTP_CONNECT_TIMEOUT),
+        http2=http2,
+    )
+
+def get_recall_client() -> httpx.AsyncClient:
+    """Return the shared Recall.ai client, creating it lazily if the lifespan hook has not run."""
+    global recall_client
+    if recall_client is None or recall_client.is_closed:
+        recall_client = create_recall_client()
+    return recall_client
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, holding at most `burst`.
+    acquire() waits until a token is available, so callers queue up
+    instead of exceeding the upstream rate limit.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+recall_rate_limiter = TokenBucket(RECALL_RATE_LIMIT, RECALL_RATE_BURST)
+
+# Methods that are safe to resend after a 5xx or a transport error
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+def retry_delay(attempt: int, resp: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retry number `attempt` (1-based): Retry-After if given, else jittered exponential backoff."""
+    if resp is not None:
+        retry_after = resp.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), RECALL_RETRY_MAX_BACKOFF)
+            except ValueError:
+                pass
+    return random.uniform(0, min(RECALL_RETRY_MAX_BACKOFF, RECALL_RETRY_BACKOFF * 2 ** (attempt - 1)))
+
+async def recall_request(endpoint: str, method: str, path: str, **kwargs) -> httpx.Response:
+    """
+    Send one request to the Recall.ai API through the shared client,
+    recording each attempt's latency under the given endpoint name.
+
+    Every attempt takes a token from the client-side rate limiter. 429s are
+    retried for any method (the request was not processed); 5xx responses
+    and transport errors only for idempotent methods, so a bot is never
+    created twice. Up to RECALL_MAX_RETRIES retries with backoff.
+    """
+    attempt = 0
+    while True:
+        await recall_rate_limiter.acquire()
+        started = time.perf_counter()
+        status = "error"
+        try:
+            resp = await get_recall_client().request(method, path, **kwargs)
+            status = str(resp.status_code)
+        except httpx.TransportError:
+            if attempt >= RECALL_MAX_RETRIES or method.upper() not in IDEMPOTENT_METHODS:
+                raise
+            resp = None
+        finally:
+            metrics.RECALL_REQUEST_LATENCY.labels(endpoint=endpoint, status=status).observe(time.perf_counter() - started)
+
+        if resp is not None:
+            retryable = resp.status_code == 429 or (resp.status_code >= 500 and method.upper() in IDEMPOTENT_METHODS)
+            if not retryable or attempt >= RECALL_MAX_RETRIES:
+                return resp
+
+        attempt += 1
+        delay = retry_delay(attempt, resp)
+        metrics.RECALL_RETRIES.labels(endpoint=endpoint, reason=status).inc()
+        logger.warning(f"Recall.ai {endpoint} returned {status}, retry {attempt}/{RECALL_MAX_RETRIES} in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    global recall_client
+    recall_client = create_recall_client()
+    logger.info(f"Recall.ai client ready (max_connections={RECALL_HTTP_MAX_CONNECTIONS}, http2={RECALL_HTTP2})")
+
+    # Bring back transcripts persisted before a restart, before any webhook is processed
+    now = time.monotonic()
+    for bot_id in transcript_store.restore():
+        bot_last_activity.setdefault(bot_id, now)
+        segments = await read_store_segments(bot_id)
+        search_index.add(bot_id, segments)
+        speaker_analytics.setdefault(bot_id, MeetingAnalytics()).add(segments)
+
+    ingest_pipeline.start()
+    memory_manager = asyncio.create_task(memory_manager_loop())
+    snapshotter = asyncio.create_task(snapshot_loop())
+    try:
+        yield
+    finally:
+        memory_manager.cancel()
+        snapshotter.cancel()
+        # Finish queued webhooks first so the final snapshot includes them
+        await ingest_pipeline.stop(timeout=INGEST_DRAIN_TIMEOUT)
+        try:
+            await transcript_store.snapshot()
+        except Exception as e:
+            logger.error(f"Shutdown snapshot failed: {str(e)}")
+        await transcript_store.close()
+        await recall_client.aclose()
+        recall_client = None
+
+app = FastAPI(title="Recall.ai Real-time Transcription Bot", lifespan=lifespan)
+
+# Initialize OpenAI client (async so LLM round trips never block the event loop)
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# Caps how many OpenAI calls this process runs at once
+summary_semaphore = asyncio.Semaphore(SUMMARY_MAX_CONCURRENCY)
+
+def create_transcript_store() -> TranscriptStore:
+    """Build the transcript store selected by TRANSCRIPT_STORE."""
+    if TRANSCRIPT_STORE == "redis":
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError("TRANSCRIPT_STORE=redis requires the 'redis' package")
+        logger.info(f"Using Redis transcript store (prefix={TRANSCRIPT_STORE_PREFIX}, ttl={TRANSCRIPT_STORE_TTL}s)")
+        return RedisTranscriptStore(aioredis.from_url(REDIS_URL), TRANSCRIPT_STORE_PREFIX, TRANSCRIPT_STORE_TTL)
+    wal = TranscriptWAL(TRANSCRIPT_WAL_DIR, fsync=WAL_FSYNC) if TRANSCRIPT_WAL_DIR else None
+    return InMemoryTranscriptStore(TRANSCRIPT_SPILL_DIR or None, wal)
+
+# Final segments and latest partials of every bot
+transcript_store = create_transcript_store()
+
+# End timestamp of the latest final segment per participant, used to discard stale partials
+final_end_timestamps: Dict[str, Dict[Any, float]] = {}
+
+# Memory manager counters
+memory_stats = {
+    "bots_evicted": 0,
+    "segments_spilled": 0
+}
+
+# Partial result counters
+partial_stats = {
+    "received": 0,
+    "applied": 0,
+    "coalesced": 0,
+    "dropped_stale": 0,
+    "published": 0
+}
+
+# Fingerprints of the most recent finals per bot, oldest first, for webhook deduplication
+final_fingerprints: Dict[str, "OrderedDict[int, None]"] = {}
+
+# Webhook deduplication counters
+dedup_stats = {
+    "finals_checked": 0,
+    "finals_duplicate": 0
+}
+
+# Full-text index over the final segments this process has ingested. With a shared
+# store it is filled from the store instead, and search_synced holds the seq each
+# bot is indexed up to.
+search_index = SearchIndex()
+search_synced: Dict[str, int] = {}
+
+# Monotonic time a partial was last pushed to subscribers, per bot and participant
+partial_published_at: Dict[str, Dict[Any, float]] = {}
+# Newest partial held back by the coalescing window, per bot and participant
+partial_pending: Dict[str, Dict[Any, PartialSlot]] = {}
+
+def event_end_timestamp(words: List[Dict]) -> Optional[float]:
+    """Relative end time of the last word in a webhook event."""
+    if not words:
+        return None
+    return (words[-1].get("end_timestamp") or {}).get("relative")
+
+def is_duplicate_final(bot_id: str, segment: TranscriptSegment) -> bool:
+    """
+    Whether the bot already received this final (same participant, timing
+    and text), remembering it if not. Only the last WEBHOOK_DEDUP_WINDOW
+    finals per bot are kept, so the check is O(1) and memory is bounded.
+    """
+    seen = final_fingerprints.setdefault(bot_id, OrderedDict())
+    fingerprint = hash((segment.participant_id, segment.start_timestamp, segment.end_timestamp, segment.text))
+    dedup_stats["finals_checked"] += 1
+    if fingerprint in seen:
+        dedup_stats["finals_duplicate"] += 1
+        return True
+    seen[fingerprint] = None
+    if len(seen) > WEBHOOK_DEDUP_WINDOW:
+        seen.popitem(last=False)
+    return False
+
+class BoundedDict(OrderedDict):
+    """Dict that keeps only the max_size most recently written entries."""
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_size:
+            self.popitem(last=False)
+
+# Rolling summary state: {"summary": str, "last_seq": int, "segment_count": int} per bot
+summary_checkpoints: Dict[str, Dict] = {}
+summary_locks: Dict[str, asyncio.Lock] = {}
+final_summaries: Dict[str, Dict] = BoundedDict(FINAL_RESULTS_MAX_BOTS)  # Consolidated summaries of stopped bots
+
+# Per-speaker talk statistics, updated as finals are ingested
+speaker_analytics: Dict[str, MeetingAnalytics] = {}
+final_analytics: Dict[str, Dict] = BoundedDict(FINAL_RESULTS_MAX_BOTS)  # Last analytics report of stopped bots
+
+# Monotonic time of the last webhook (or bot creation) per bot, for idle eviction.
+# Also the set of bots this process has state for.
+bot_last_activity: Dict[str, float] = {}
+
+class SummaryCache:
+    """
+    LRU cache of summary responses with a TTL, keyed by
+    (bot_id, transcript version, model, prompt hash).
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: tuple, value: Dict):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard_bot(self, bot_id: str):
+        for key in [k for k in self._entries if k[0] == bot_id]:
+            del self._entries[key]
+
+summary_cache = SummaryCache(SUMMARY_CACHE_SIZE, SUMMARY_CACHE_TTL)
+
+# Summaries of individual transcript chunks, keyed by (bot_id, chunk digest, model, prompt hash)
+chunk_summary_cache = SummaryCache(SUMMARY_CHUNK_CACHE_SIZE, SUMMARY_CACHE_TTL)
+
+async def init_bot_state(bot_id: str):
+    """Create empty transcript storage for a bot."""
+    await transcript_store.create_bot(bot_id)
+    bot_last_activity[bot_id] = time.monotonic()
+
+async def enforce_memory_budget():
+    """
+    Evict bots that have had no webhook for BOT_IDLE_TTL seconds, then, while
+    hot transcript data is over MEMORY_BUDGET_MB, spill the oldest finals of
+    the largest bots to disk (keeping HOT_SEGMENTS_PER_BOT recent ones in RAM).
+    With a shared store only this process' state is evicted; the store
+    expires idle bots itself.
+    """
+    now = time.monotonic()
+    for bot_id, last_activity in list(bot_last_activity.items()):
+        if now - last_activity > BOT_IDLE_TTL:
+            logger.info(f"Evicting idle bot {bot_id} (no webhooks for {int(now - last_activity)}s)")
+            await discard_bot_state(bot_id, local_only=transcript_store.shared)
+            memory_stats["bots_evicted"] += 1
+
+    memory_stats["segments_spilled"] += transcript_store.spill(MEMORY_BUDGET_MB * 1024 * 1024, HOT_SEGMENTS_PER_BOT)
+
+async def memory_manager_loop():
+    """Run enforce_memory_budget every MEMORY_CHECK_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(MEMORY_CHECK_INTERVAL)
+        try:
+            await enforce_memory_budget()
+        except Exception as e:
+            logger.error(f"Memory manager error: {str(e)}")
+
+async def snapshot_loop():
+    """Compact the transcript WAL into a snapshot every WAL_SNAPSHOT_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(WAL_SNAPSHOT_INTERVAL)
+        try:
+            started = time.perf_counter()
+            if await transcript_store.snapshot():
+                logger.info(f"Transcript snapshot written in {time.perf_counter() - started:.3f}s")
+        except Exception as e:
+            logger.error(f"Transcript snapshot error: {str(e)}")
+
+async def discard_bot_state(bot_id: str, close_log: bool = True, local_only: bool = False,
+                            keep_summary: bool = False) -> Optional[TranscriptLog]:
+    """
+    Drop all state of a bot. Returns its TranscriptLog; with close_log=False
+    the caller becomes responsible for closing it. local_only keeps the bot
+    in the transcript store and only forgets this process' state.
 
-# Initialize OpenAI client
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    Deleting the bot from the store restarts its seqs, so the rolling summary
+    checkpoint goes too, unless keep_summary hands it to finalize_summary.
+    """
+    transcripts = None
+    if not local_only:
+        transcripts = await transcript_store.delete_bot(bot_id)
+        if transcripts is not None and close_log:
+            transcripts.close()
+        if not keep_summary:
+            summary_checkpoints.pop(bot_id, None)
+            summary_locks.pop(bot_id, None)
+    partial_published_at.pop(bot_id, None)
+    partial_pending.pop(bot_id, None)
+    final_end_timestamps.pop(bot_id, None)
+    final_fingerprints.pop(bot_id, None)
+    bot_last_activity.pop(bot_id, None)
+    search_index.remove_bot(bot_id)
+    search_synced.pop(bot_id, None)
+    speaker_analytics.pop(bot_id, None)
+    bot_status_cache.pop(bot_id, None)
+    summary_cache.discard_bot(bot_id)
+    chunk_summary_cache.discard_bot(bot_id)
+    return transcripts
+
+class TranscriptSubscriber:
+    """
+    One live transcript listener (SSE stream or WebSocket) with its own bounded queue.
+    When the consumer falls behind, the oldest queued events are dropped so a
+    slow client can never hold up ingest or grow memory without limit.
+    """
 
-# Store live transcripts in memory (use Redis/DB in production)
-live_transcripts: Dict[str, List[Dict]] = {}
-partial_transcripts: Dict[str, Dict] = {}  # Store partial results
+    def __init__(self, include_partial: bool):
+        self.include_partial = include_partial
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.dropped = 0
+
+    def push(self, message: tuple):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            metrics.LIVE_EVENTS_DROPPED.inc()
+        self.queue.put_nowait(message)
+
+# Per-bot fan-out of live transcript events
+transcript_subscribers: Dict[str, Set[TranscriptSubscriber]] = {}
+
+def subscribe_transcript(bot_id: str, include_partial: bool) -> TranscriptSubscriber:
+    subscriber = TranscriptSubscriber(include_partial)
+    transcript_subscribers.setdefault(bot_id, set()).add(subscriber)
+    metrics.LIVE_SUBSCRIBERS.inc()
+    return subscriber
+
+def unsubscribe_transcript(bot_id: str, subscriber: TranscriptSubscriber):
+    subscribers = transcript_subscribers.get(bot_id)
+    if subscribers is None or subscriber not in subscribers:
+        return
+    subscribers.discard(subscriber)
+    metrics.LIVE_SUBSCRIBERS.dec()
+    if not subscribers:
+        del transcript_subscribers[bot_id]
+
+def has_partial_subscribers(bot_id: str) -> bool:
+    return any(subscriber.include_partial for subscriber in transcript_subscribers.get(bot_id, ()))
+
+def flush_pending_partial(bot_id: str, participant_id: Any):
+    """Push the partial the coalescing window held back, once the window has closed."""
+    pending = partial_pending.get(bot_id)
+    if not pending or participant_id not in pending:
+        return  # superseded by a published partial or a final, or the bot is gone
+    published_at = partial_published_at.setdefault(bot_id, {})
+    wait = published_at.get(participant_id, 0.0) + PARTIAL_COALESCE_WINDOW - time.monotonic()
+    if wait > 0:
+        asyncio.get_running_loop().call_later(wait, flush_pending_partial, bot_id, participant_id)
+        return
+
+    slot = pending.pop(participant_id)
+    if has_partial_subscribers(bot_id):
+        published_at[participant_id] = time.monotonic()
+        publish_transcript_event(bot_id, "transcript.partial_data", slot.segment)
+        partial_stats["published"] += 1
+
+def publish_transcript_event(bot_id: str, event_type: str, segment: TranscriptSegment):
+    """Fan a processed segment out to every live subscriber of the bot."""
+    subscribers = transcript_subscribers.get(bot_id)
+    if not subscribers:
+        return
+
+    is_partial = event_type == "transcript.partial_data"
+    message = None
+    for subscriber in subscribers:
+        if is_partial and not subscriber.include_partial:
+            continue
+        if message is None:
+            # Serialize once per event, not once per subscriber
+            message = ("partial" if is_partial else "final", dump_json({"event": event_type, "segment": segment.to_dict()}).decode("utf-8"))
+        subscriber.push(message)
 
 class MeetingRequest(BaseModel):
     meeting_url: str
@@ -40,19 +589,9 @@ class TranscriptWebhookPayload(BaseModel):
     event: str
     data: Dict[str, Any]
 
-@app.post("/start-bot")
-async def start_bot(req: MeetingRequest):
-    """
-    Start a Recall.ai bot with real-time transcription using Deepgram.
-    """
-    url = f"https://{RECALL_REGION}.recall.ai/api/v1/bot"
-    headers = {
-        "Authorization": f"Token {RECALL_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    # Configure real-time transcription with Deepgram
-    recording_config = {
+def build_recording_config() -> Dict:
+    """Default recording config: real-time Deepgram transcription pushed to our webhook."""
+    return {
         "transcript": {
             "provider": {
                 "deepgram_streaming": {
@@ -78,9 +617,16 @@ async def start_bot(req: MeetingRequest):
         }
     }
 
+async def create_bot(req: MeetingRequest, base_config: Dict) -> Dict:
+    """
+    Create one Recall.ai bot for a meeting. `base_config` is the shared
+    recording config; the request's own recording_config is merged over it.
+    Raises HTTPException if Recall rejects the bot.
+    """
+    recording_config = base_config
     # Merge with provided config if any
     if req.recording_config:
-        recording_config.update(req.recording_config)
+        recording_config = {**base_config, **req.recording_config}
 
     payload = {
         "meeting_url": req.meeting_url,
@@ -92,33 +638,71 @@ async def start_bot(req: MeetingRequest):
     if req.join_at:
         payload["join_at"] = req.join_at
 
-    logger.info(f"Creating bot with payload: {json.dumps(payload, indent=2)}")
+    logger.info("Creating bot for meeting %s", req.meeting_url)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Creating bot with payload: %s", json.dumps(payload))
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(url, json=payload, headers=headers)
+        resp = await recall_request("create_bot", "POST", "/bot", json=payload)
+    except httpx.RequestError as e:
+        logger.error(f"Request error: {e}")
+        raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
 
-        if resp.status_code != 201:
-            logger.error(f"Error creating bot: {resp.status_code} - {resp.text}")
-            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+    if resp.status_code != 201:
+        logger.error(f"Error creating bot: {resp.status_code} - {resp.text}")
+        raise HTTPException(status_code=resp.status_code, detail=resp.text)
 
-        bot_data = resp.json()
-        bot_id = bot_data.get("id")
+    bot_data = resp.json()
+    bot_id = bot_data.get("id")
 
-        # Initialize transcript storage for this bot
-        if bot_id:
-            live_transcripts[bot_id] = []
-            partial_transcripts[bot_id] = {}
-            logger.info(f"Bot created successfully: {bot_id}")
+    # Initialize transcript storage for this bot
+    if bot_id:
+        await init_bot_state(bot_id)
+        logger.info(f"Bot created successfully: {bot_id}")
 
-        return bot_data
+    return bot_data
 
-    except httpx.RequestError as e:
-        logger.error(f"Request error: {e}")
-        raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
+@app.post("/start-bot")
+async def start_bot(req: MeetingRequest):
+    """
+    Start a Recall.ai bot with real-time transcription using Deepgram.
+    """
+    return await create_bot(req, build_recording_config())
+
+@app.post("/start-bots")
+async def start_bots(reqs: List[MeetingRequest]):
+    """
+    Start bots for many meetings in one call. The recording config is built
+    once and shared, bots are created at most START_BOTS_CONCURRENCY at a
+    time, and each meeting gets its own result so one failure does not fail
+    the batch.
+    """
+    if len(reqs) > START_BOTS_MAX_BATCH:
+        raise HTTPException(status_code=413, detail=f"At most {START_BOTS_MAX_BATCH} meetings per batch")
+
+    base_config = build_recording_config()
+
+    async def start_one(index: int, req: MeetingRequest) -> Dict:
+        try:
+            bot = await create_bot(req, base_config)
+            return {"index": index, "meeting_url": req.meeting_url, "status": "created", "bot": bot}
+        except HTTPException as e:
+            return {"index": index, "meeting_url": req.meeting_url, "status": "error", "status_code": e.status_code, "error": e.detail}
+        except Exception as e:
+            logger.error(f"Unexpected error creating bot for {req.meeting_url}: {str(e)}")
+            return {"index": index, "meeting_url": req.meeting_url, "status": "error", "status_code": 500, "error": str(e)}
+
+    results = await gather_bounded([start_one(i, req) for i, req in enumerate(reqs)], START_BOTS_CONCURRENCY)
+    created = sum(1 for result in results if result["status"] == "created")
+    return {
+        "total": len(results),
+        "created": created,
+        "failed": len(results) - created,
+        "results": results
+    }
 
 @app.post("/api/webhook/recall/transcript")
-async def handle_transcript_webhook(request: Request, background_tasks: BackgroundTasks):
+async def handle_transcript_webhook(request: Request):
     """
     Handle real-time transcript webhooks from Recall.ai.
     Process both partial and final transcript data from Deepgram.
@@ -128,7 +712,8 @@ async def handle_transcript_webhook(request: Request, background_tasks: Backgrou
         event_type = payload.get("event")
         data = payload.get("data", {})
 
-        logger.info(f"Received transcript webhook: {event_type}")
+        hot_logger.info("Received transcript webhook: %s", event_type, extra={"event": event_type})
+        metrics.WEBHOOK_EVENTS.labels(event=metrics.webhook_event_label(event_type)).inc()
 
         # Extract relevant information
         bot_id = data.get("bot", {}).get("id")
@@ -140,13 +725,23 @@ async def handle_transcript_webhook(request: Request, background_tasks: Backgrou
             logger.warning("No bot_id found in webhook payload")
             return {"status": "no_bot_id"}
 
-        # Initialize storage if not exists
-        if bot_id not in live_transcripts:
-            live_transcripts[bot_id] = []
-            partial_transcripts[bot_id] = {}
-
-        # Process the transcript data
-        background_tasks.add_task(process_transcript_data, event_type, bot_id, words, participant, transcript_data)
+        # Hand the event to the ingest workers. Under overload partials are
+        # dropped (a newer one supersedes them anyway) long before finals are refused.
+        event = (event_type, words, participant, transcript_data)
+        if not ingest_pipeline.offer(bot_id, event, high_priority=event_type != "transcript.partial_data"):
+            metrics.WEBHOOK_EVENTS_SHED.labels(event=metrics.webhook_event_label(event_type)).inc()
+            if event_type == "transcript.partial_data":
+                return {"status": "shed"}
+            hot_logger.info("Ingest over capacity, refusing %s for bot %s", event_type, bot_id, extra={"event": event_type})
+            return JSONResponse(
+                status_code=503,
+                content={"status": "overloaded"},
+                headers={"Retry-After": str(INGEST_RETRY_AFTER)}
+            )
+
+        # Initialize storage if this process has not seen the bot yet
+        if bot_id not in bot_last_activity:
+            await init_bot_state(bot_id)
 
         return {"status": "received"}
 
@@ -154,242 +749,881 @@ async def handle_transcript_webhook(request: Request, background_tasks: Backgrou
         logger.error(f"Transcript webhook error: {str(e)}")
         return {"status": "error", "message": str(e)}
 
-async def process_transcript_data(event_type: str, bot_id: str, words: List[Dict], participant: Dict, transcript_data: Dict):
-    """
-    Process transcript data asynchronously to avoid blocking webhook responses.
+async def process_transcript_batch(bot_id: str, events: List[tuple]):
     """
-    try:
-        # Extract text from words
-        text_parts = [word.get("text", "") for word in words if word.get("text")]
-        full_text = " ".join(text_parts).strip()
-
-        if not full_text:
-            return
-
-        # Extract timestamps
-        start_timestamp = words[0].get("start_timestamp", {}).get("relative", 0) if words else 0
-        end_timestamp = words[-1].get("end_timestamp", {}).get("relative") if words else None
-
-        transcript_segment = {
-            "text": full_text,
-            "speaker": participant.get("name") or f"Participant {participant.get('id', 'Unknown')}",
-            "participant_id": participant.get("id"),
-            "is_host": participant.get("is_host", False),
-            "start_timestamp": start_timestamp,
-            "end_timestamp": end_timestamp,
-            "words": words,
-            "is_partial": event_type == "transcript.partial_data",
-            "timestamp": transcript_data.get("timestamp"),
-            "event_type": event_type
-        }
+    Process a micro-batch of transcript events for one bot.
+    Called by the bot's ingest worker, in arrival order; the finals and partial
+    updates of the batch are written to the transcript store in one append.
 
+    Partials are coalesced: only the newest one per participant in the batch
+    is kept, partials older than that participant's latest final are dropped,
+    and segments are only built for partials that a subscriber will receive.
+    """
+    started = time.perf_counter()
+    if bot_id not in bot_last_activity:
+        await init_bot_state(bot_id)
+    bot_last_activity[bot_id] = time.monotonic()
+
+    published_at = partial_published_at.setdefault(bot_id, {})
+    final_ends = final_end_timestamps.setdefault(bot_id, {})
+    finals: List[TranscriptSegment] = []
+    # Partial updates for the store: participant id -> latest slot, or None to clear
+    partials: Dict[Any, Optional[PartialSlot]] = {}
+
+    # Index of the newest partial per participant in this batch
+    latest_partial: Dict[Any, int] = {}
+    for index, (event_type, _, participant, _) in enumerate(events):
         if event_type == "transcript.partial_data":
-            # Handle partial results - store temporarily
-            participant_id = participant.get("id", "unknown")
-            partial_transcripts[bot_id][participant_id] = transcript_segment
-            logger.info(f"Partial transcript for bot {bot_id}: {full_text}")
-
-        elif event_type == "transcript.data":
-            # Handle final results - add to live transcript
-            live_transcripts[bot_id].append(transcript_segment)
-
-            # Remove corresponding partial result if exists
-            participant_id = participant.get("id", "unknown")
-            if participant_id in partial_transcripts[bot_id]:
-                del partial_transcripts[bot_id][participant_id]
-
-            logger.info(f"Final transcript for bot {bot_id}: {full_text}")
+            partial_stats["received"] += 1
+            latest_partial[participant.get("id", "unknown")] = index
+
+    for index, event in enumerate(events):
+        event_type, words, participant, transcript_data = event
+        participant_id = participant.get("id", "unknown")
+        try:
+            if event_type == "transcript.partial_data":
+                if latest_partial.get(participant_id) != index:
+                    partial_stats["coalesced"] += 1
+                    continue
+
+                end_timestamp = event_end_timestamp(words)
+                last_final_end = final_ends.get(participant_id)
+                if last_final_end is not None and end_timestamp is not None and end_timestamp <= last_final_end:
+                    partial_stats["dropped_stale"] += 1
+                    continue
+
+                # Handle partial results - store temporarily, built lazily on read
+                slot = PartialSlot(event, end_timestamp)
+                partials[participant_id] = slot
+                partial_stats["applied"] += 1
+
+                if has_partial_subscribers(bot_id) and slot.segment is not None:
+                    pending = partial_pending.setdefault(bot_id, {})
+                    now = time.monotonic()
+                    wait = published_at.get(participant_id, 0.0) + PARTIAL_COALESCE_WINDOW - now
+                    if wait <= 0:
+                        pending.pop(participant_id, None)
+                        published_at[participant_id] = now
+                        publish_transcript_event(bot_id, event_type, slot.segment)
+                        partial_stats["published"] += 1
+                    else:
+                        # Inside the window: hold the newest partial back until it closes
+                        if participant_id not in pending:
+                            asyncio.get_running_loop().call_later(wait, flush_pending_partial, bot_id, participant_id)
+                        pending[participant_id] = slot
+
+            elif event_type == "transcript.data":
+                transcript_segment = TranscriptSegment.from_webhook(event_type, words, participant, transcript_data)
+
+                # Remove corresponding partial result if exists
+                partials[participant_id] = None
+                partial_pending.get(bot_id, {}).pop(participant_id, None)
+                if transcript_segment is None or is_duplicate_final(bot_id, transcript_segment):
+                    continue
+
+                # Handle final results - add to live transcript
+                finals.append(transcript_segment)
+                if transcript_segment.end_timestamp is not None:
+                    final_ends[participant_id] = max(final_ends.get(participant_id, 0.0), transcript_segment.end_timestamp)
+
+        except Exception as e:
+            logger.error(f"Error processing transcript data: {str(e)}")
+
+    if finals or partials:
+        # One store write per batch; the store assigns each final its seq
+        await transcript_store.append(bot_id, finals, partials)
+        if not transcript_store.shared:
+            search_index.add(bot_id, finals)
+        if finals:
+            speaker_analytics.setdefault(bot_id, MeetingAnalytics()).add(finals)
+
+    for transcript_segment in finals:
+        hot_logger.info(
+            "Final transcript for bot %s: %s", bot_id, TranscriptText(transcript_segment.text),
+            extra={"bot_id": bot_id, "seq": transcript_segment.seq}
+        )
+        publish_transcript_event(bot_id, transcript_segment.event_type, transcript_segment)
+
+    metrics.TRANSCRIPT_BATCH_SIZE.observe(len(events))
+    metrics.TRANSCRIPT_PROCESSING.observe(time.perf_counter() - started)
+
+# Webhooks are queued here and drained by worker coroutines started in the lifespan hook
+ingest_pipeline = IngestPipeline(
+    process_transcript_batch,
+    workers=INGEST_WORKERS,
+    queue_size=INGEST_QUEUE_SIZE,
+    batch_size=INGEST_BATCH_SIZE,
+    low_priority_ratio=INGEST_PARTIAL_SHED_RATIO
+)
+
+# Gauges read live values at scrape time; nothing is recomputed per request
+metrics.INGEST_QUEUE_DEPTH.set_function(lambda: ingest_pipeline.queue_depth)
+metrics.ACTIVE_BOTS.set_function(lambda: len(bot_last_activity))
+metrics.SEGMENTS_IN_MEMORY.set_function(lambda: transcript_store.segments_in_memory)
+metrics.TRANSCRIPT_HOT_BYTES.set_function(lambda: sum(transcripts.hot_bytes for transcripts in transcript_store.local_logs()))
+metrics.register_stats("transcript_partials_total", "Partial transcript events, by outcome", "outcome", lambda: partial_stats)
+metrics.register_stats("transcript_finals_dedup_total", "Final transcript events checked for duplicates, by outcome", "outcome", lambda: dedup_stats)
+metrics.register_stats("memory_manager_total", "Memory manager actions, by kind", "action", lambda: memory_stats)
+
+def json_envelope(array_key: str, fragments: List[bytes], fields: Dict[str, Any]) -> Response:
+    """
+    Build a JSON object response whose `array_key` member is spliced together
+    from pre-serialized segment fragments; the other fields are encoded normally.
+    """
+    body = b"".join([
+        b'{"', array_key.encode("utf-8"), b'":[', b",".join(fragments), b"]",
+        b"," + dump_json(fields)[1:] if fields else b"}"
+    ])
+    return Response(content=body, media_type="application/json")
 
-    except Exception as e:
-        logger.error(f"Error processing transcript data: {str(e)}")
+def segment_filters(start_from: Optional[float], start_to: Optional[float], participant_id: Optional[str]) -> Dict[str, Any]:
+    """Keyword arguments for TranscriptStore.read / read_ordered from the from / to / participant_id query parameters."""
+    return {"start_from": start_from, "start_to": start_to, "participant_id": participant_id}
 
 @app.get("/bot/{bot_id}/live-transcript")
-async def get_live_transcript(bot_id: str, include_partial: bool = False):
+async def get_live_transcript(bot_id: str, include_partial: bool = False, since: int = 0, limit: Optional[int] = None,
+                              include_words: bool = True, start_from: Optional[float] = Query(None, alias="from"),
+                              to: Optional[float] = None, participant_id: Optional[str] = None):
     """
-    Get the current live transcript segments for a bot.
+    Get the current live transcript segments for a bot, in start-time order.
+    Pass the previous response's next_cursor as `since` to receive only newer
+    segments; a late final can then sort before ones already received.
+
+    `from` / `to` (seconds since the recording started) keep segments starting
+    in [from, to), and `participant_id` keeps one speaker's segments;
+    total_segments then counts the matching segments.
     """
-    if bot_id not in live_transcripts:
+    page = await transcript_store.read(bot_id, since, limit, **segment_filters(start_from, to, participant_id))
+    if page is None:
         return {"transcript": [], "message": "No live transcript available"}
 
-    final_transcripts = live_transcripts[bot_id]
     result = {
-        "transcript": final_transcripts,
-        "total_segments": len(final_transcripts)
+        "total_segments": page.total,
+        "next_cursor": page.next_cursor(since),
+        "has_more": page.has_more
     }
 
     if include_partial:
-        partials = list(partial_transcripts.get(bot_id, {}).values())
+        partials = [seg.to_dict(include_words) for seg in await transcript_store.partial_segments(bot_id)]
         result["partial_transcripts"] = partials
         result["total_partials"] = len(partials)
 
-    return result
+    # Finals are serialized once at ingest; splice the stored bytes (words are added only if asked for)
+    return json_envelope("transcript", page.fragments(include_words), result)
 
 @app.get("/bot/{bot_id}/live-transcript/stream")
-async def stream_live_transcript(bot_id: str):
+async def stream_live_transcript(bot_id: str, since: int = 0, limit: Optional[int] = None,
+                                 start_from: Optional[float] = Query(None, alias="from"),
+                                 to: Optional[float] = None, participant_id: Optional[str] = None):
     """
     Get a formatted stream of the live transcript with speaker labels.
+    Supports the same cursor and filter parameters as /live-transcript.
     """
-    if bot_id not in live_transcripts:
+    page = await transcript_store.read(bot_id, since, limit, **segment_filters(start_from, to, participant_id))
+    if page is None:
         return {"transcript": "", "message": "No live transcript available"}
 
-    transcripts = live_transcripts[bot_id]
+    # Lines are formatted once at ingest time where the store caches them; only join them here
+    return json_envelope("raw_transcript", page.fragments(), {
+        "formatted_transcript": "\n".join(page.stream_lines()),
+        "total_segments": page.total,
+        "next_cursor": page.next_cursor(since),
+        "has_more": page.has_more
+    })
 
-    # Format transcript with timestamps and speakers
-    formatted_transcript = []
-    for segment in transcripts:
-        timestamp = segment.get("start_timestamp", 0)
-        speaker = segment.get("speaker", "Unknown")
-        text = segment.get("text", "")
+@app.get("/bot/{bot_id}/live-transcript/events")
+async def live_transcript_events(bot_id: str, request: Request, include_partial: bool = False):
+    """
+    Push live transcript segments as Server-Sent Events as they are processed.
+    Final segments are sent as `final` events, partial updates as `partial` events.
+    """
+    subscriber = subscribe_transcript(bot_id, include_partial)
+
+    async def event_stream():
+        try:
+            while True:
+                try:
+                    event_name, data = await asyncio.wait_for(subscriber.queue.get(), timeout=SUBSCRIBER_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield f"event: {event_name}\ndata: {data}\n\n"
+        finally:
+            unsubscribe_transcript(bot_id, subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.websocket("/bot/{bot_id}/live-transcript/ws")
+async def live_transcript_websocket(websocket: WebSocket, bot_id: str, include_partial: bool = False):
+    """
+    Push live transcript segments over a WebSocket as they are processed.
+    """
+    await websocket.accept()
+    subscriber = subscribe_transcript(bot_id, include_partial)
 
-        # Format timestamp as MM:SS
-        minutes = int(timestamp // 60)
-        seconds = int(timestamp % 60)
-        time_str = f"{minutes:02d}:{seconds:02d}"
+    async def forward_events():
+        while True:
+            _, data = await subscriber.queue.get()
+            await websocket.send_text(data)
 
-        formatted_transcript.append(f"[{time_str}] {speaker}: {text}")
+    sender = asyncio.create_task(forward_events())
+    try:
+        # Reading is only used to notice the client going away
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        unsubscribe_transcript(bot_id, subscriber)
+
+async def refresh_search_index(bot_id: str):
+    """
+    Index the segments of a shared-store bot that this process has not
+    indexed yet, whichever worker ingested them.
+    """
+    version = await transcript_store.version(bot_id)
+    if version is None or version < search_synced.get(bot_id, 0):
+        # Gone, or deleted and started again with fresh seqs
+        search_index.remove_bot(bot_id)
+        search_synced.pop(bot_id, None)
+        if version is None:
+            return
+    synced = search_synced.get(bot_id, 0)
+    if version <= synced:
+        return
+
+    segments = await read_store_segments(bot_id, synced)
+    # A concurrent refresh may have indexed part of them meanwhile
+    synced = search_synced.get(bot_id, 0)
+    segments = [seg for seg in segments if seg.seq > synced]
+    if segments:
+        search_index.add(bot_id, segments)
+        search_synced[bot_id] = max(seg.seq for seg in segments)
+
+@app.get("/search")
+async def search_transcripts(q: str, bot_id: Optional[str] = None, limit: int = 10):
+    """
+    Full-text search over final transcript segments, ranked by BM25.
+    Scoped to one bot with `bot_id`, otherwise across every bot.
+
+    With a shared store the index is brought up to date from the store
+    first. A search across bots then only covers the bots this worker knows
+    of, and the response says so with "partial": true.
+    """
+    started = time.perf_counter()
+    partial = False
+    if transcript_store.shared:
+        if bot_id is not None:
+            await refresh_search_index(bot_id)
+        else:
+            known = set(bot_last_activity) | set(search_synced)
+            await gather_bounded([refresh_search_index(known_bot) for known_bot in known], SEARCH_REFRESH_CONCURRENCY)
+            partial = True
+    total, hits = search_index.search(q, bot_id, min(max(limit, 0), 100))
+
+    results = []
+    for score, hit_bot_id, seq in hits:
+        page = await transcript_store.read(hit_bot_id, seq - 1, 1)
+        if not page or page.seqs[0] != seq:
+            continue
+        seg = page.segments()[0]
+        results.append({
+            "bot_id": hit_bot_id,
+            "seq": seq,
+            "score": round(score, 4),
+            "speaker": seg.speaker,
+            "participant_id": seg.participant_id,
+            "start_timestamp": seg.start_timestamp,
+            "end_timestamp": seg.end_timestamp,
+            "snippet": make_snippet(seg.text, q)
+        })
 
     return {
-        "formatted_transcript": "\n".join(formatted_transcript),
-        "raw_transcript": transcripts,
-        "total_segments": len(transcripts)
+        "query": q,
+        "total_hits": total,
+        "partial": partial,
+        "results": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3)
     }
 
+# Short-lived bot status cache: bot_id -> (expires_at, status), plus in-flight upstream calls
+bot_status_cache: Dict[str, tuple] = {}
+bot_status_inflight: Dict[str, asyncio.Task] = {}
+status_stats = {
+    "hits": 0,
+    "misses": 0,
+    "coalesced": 0
+}
+metrics.register_stats("bot_status_requests_total", "Bot status requests, by cache outcome", "outcome", lambda: status_stats)
+
+async def fetch_bot_status(bot_id: str) -> Dict:
+    """Fetch a bot's status from Recall.ai and cache it for STATUS_CACHE_TTL seconds."""
+    try:
+        resp = await recall_request("get_bot", "GET", f"/bot/{bot_id}")
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
+
+    if resp.status_code != 200:
+        raise HTTPException(status_code=resp.status_code, detail=resp.text)
+
+    data = resp.json()
+    now = time.monotonic()
+    if len(bot_status_cache) >= 1024:
+        for key in [key for key, (expires_at, _) in bot_status_cache.items() if expires_at < now]:
+            del bot_status_cache[key]
+    bot_status_cache[bot_id] = (now + STATUS_CACHE_TTL, data)
+    return data
+
 @app.get("/bot/{bot_id}/status")
 async def get_bot_status(bot_id: str):
     """
-    Get bot status from Recall.ai
+    Get bot status from Recall.ai.
+    Responses are cached for STATUS_CACHE_TTL seconds, and concurrent polls
+    for the same bot share a single upstream request.
+    """
+    cached = bot_status_cache.get(bot_id)
+    if cached is not None and cached[0] > time.monotonic():
+        status_stats["hits"] += 1
+        return cached[1]
+
+    task = bot_status_inflight.get(bot_id)
+    if task is None:
+        status_stats["misses"] += 1
+        task = asyncio.create_task(fetch_bot_status(bot_id))
+        bot_status_inflight[bot_id] = task
+        task.add_done_callback(lambda done: forget_status_call(bot_id, done))
+    else:
+        status_stats["coalesced"] += 1
+
+    # Shielded so one caller going away does not cancel the call for the others
+    return await asyncio.shield(task)
+
+def forget_status_call(bot_id: str, task: asyncio.Task):
+    if bot_status_inflight.get(bot_id) is task:
+        del bot_status_inflight[bot_id]
+    if not task.cancelled():
+        task.exception()  # Mark as retrieved even if every waiter has gone away
+
+async def create_chat_completion(messages: List[Dict], max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
+    """
+    Run one chat completion against OpenAI. Calls are bounded by
+    SUMMARY_MAX_CONCURRENCY so a burst of summaries cannot exhaust the process.
+    """
+    async with summary_semaphore:
+        started = time.perf_counter()
+        response = await openai_client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.3
+        )
+        metrics.OPENAI_REQUEST_LATENCY.observe(time.perf_counter() - started)
+
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        metrics.OPENAI_TOKENS.labels(kind="prompt").inc(usage.prompt_tokens or 0)
+        metrics.OPENAI_TOKENS.labels(kind="completion").inc(usage.completion_tokens or 0)
+
+    return response.choices[0].message.content
+
+SUMMARY_SYSTEM_PROMPT = "Summarize the following meeting transcript. Include key discussion points, decisions made, action items, and main participants. Format the summary in clear sections."
+ROLLING_SUMMARY_SYSTEM_PROMPT = "You maintain a running summary of a meeting. Update the previous summary with the new transcript segments. Keep key discussion points, decisions made, action items, and main participants. Format the summary in clear sections."
+FINAL_SUMMARY_SYSTEM_PROMPT = "The meeting has ended. Consolidate the following running summary into a final meeting summary. Merge duplicate points, and include key discussion points, decisions made, action items, and main participants in clear sections."
+
+CHUNK_SUMMARY_SYSTEM_PROMPT = "Summarize this part of a longer meeting transcript. Keep key discussion points, decisions made, action items, and who raised them. Be concise; it will be merged with the summaries of the other parts."
+REDUCE_SUMMARY_SYSTEM_PROMPT = "Merge the following summaries of consecutive parts of one meeting, given in order, into a single summary. Merge duplicate points, and include key discussion points, decisions made, action items, and main participants in clear sections."
+
+# Identifies the prompt set in summary cache keys and ETags
+SUMMARY_PROMPT_HASH = hashlib.sha1(
+    (SUMMARY_SYSTEM_PROMPT + ROLLING_SUMMARY_SYSTEM_PROMPT + CHUNK_SUMMARY_SYSTEM_PROMPT + REDUCE_SUMMARY_SYSTEM_PROMPT).encode("utf-8")
+).hexdigest()[:12]
+
+def summary_etag(bot_id: str, version) -> str:
+    """Build the ETag for a bot's summary at a given transcript version."""
+    digest = hashlib.sha1(f"{bot_id}:{version}:{SUMMARY_MODEL}:{SUMMARY_PROMPT_HASH}".encode("utf-8")).hexdigest()[:16]
+    return f'"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates or "*" in candidates
+
+def format_summary_lines(segments: List[TranscriptSegment]) -> str:
+    """Combine transcript segments into speaker-labelled lines for the LLM."""
+    return "\n".join([
+        f"{seg.speaker}: {seg.text}"
+        for seg in segments
+        if seg.text.strip()
+    ])
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (about four characters per token)."""
+    return len(text) // 4 + 1
+
+def chunk_transcript(segments: List[TranscriptSegment], token_budget: int) -> List[str]:
+    """
+    Split segments into speaker-labelled text chunks of at most token_budget
+    estimated tokens. Chunks break between speaker turns; a single turn
+    longer than the budget is split between its segments.
     """
-    url = f"https://{RECALL_REGION}.recall.ai/api/v1/bot/{bot_id}"
-    headers = {"Authorization": f"Token {RECALL_API_KEY}"}
+    turns: List[List[str]] = []
+    speaker = None
+    for seg in segments:
+        if not seg.text.strip():
+            continue
+        line = f"{seg.speaker}: {seg.text}"
+        if turns and seg.speaker == speaker:
+            turns[-1].append(line)
+        else:
+            turns.append([line])
+            speaker = seg.speaker
+
+    chunks: List[List[str]] = []
+    size = 0
+    for turn in turns:
+        turn_tokens = sum(estimate_tokens(line) for line in turn)
+        pieces = [[line] for line in turn] if turn_tokens > token_budget else [turn]
+        for piece in pieces:
+            tokens = turn_tokens if piece is turn else estimate_tokens(piece[0])
+            if chunks and size + tokens <= token_budget:
+                chunks[-1].extend(piece)
+                size += tokens
+            else:
+                chunks.append(list(piece))
+                size = tokens
+    return ["\n".join(chunk) for chunk in chunks]
+
+async def gather_bounded(coros: List[Awaitable], limit: int) -> List:
+    """asyncio.gather that runs at most `limit` of the awaitables at a time."""
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[run(coro) for coro in coros])
+
+async def summarize_chunk(bot_id: str, chunk: str) -> str:
+    """Summarize one transcript chunk, reusing a cached summary of identical text."""
+    key = (bot_id, hashlib.sha1(chunk.encode("utf-8")).hexdigest(), SUMMARY_MODEL, SUMMARY_PROMPT_HASH)
+    cached = chunk_summary_cache.get(key)
+    if cached is not None:
+        return cached["summary"]
+
+    summary = await create_chat_completion(
+        [
+            {"role": "system", "content": CHUNK_SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": chunk}
+        ],
+        max_tokens=CHUNK_SUMMARY_MAX_TOKENS
+    )
+    chunk_summary_cache.set(key, {"summary": summary})
+    return summary
+
+async def reduce_summaries(summaries: List[str]) -> str:
+    """
+    Merge ordered partial summaries into one. If they do not fit in one
+    SUMMARY_CHUNK_TOKENS call, neighbouring summaries are merged in groups
+    first, until a single call can take the rest. When no two neighbours fit
+    together, they are merged in pairs anyway so every round shrinks the list.
+    """
+    while True:
+        groups: List[List[str]] = []
+        size = 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            if groups and size + tokens <= SUMMARY_CHUNK_TOKENS:
+                groups[-1].append(summary)
+                size += tokens
+            else:
+                groups.append([summary])
+                size = tokens
+        if len(groups) > 1 and len(groups) == len(summaries):
+            groups = [summaries[i:i + 2] for i in range(0, len(summaries), 2)]
+
+        async def merge(group: List[str]) -> str:
+            if len(group) == 1:
+                return group[0]
+            return await create_chat_completion(
+                [
+                    {"role": "system", "content": REDUCE_SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": "\n\n".join(f"Part {i}:\n{summary}" for i, summary in enumerate(group, 1))}
+                ],
+                max_tokens=SUMMARY_MAX_TOKENS
+            )
+
+        if len(groups) == 1:
+            return await merge(groups[0])
+        summaries = await gather_bounded([merge(group) for group in groups], SUMMARY_CHUNK_CONCURRENCY)
+
+async def chunked_summary(bot_id: str, segments: List[TranscriptSegment], previous_summary: Optional[str]) -> str:
+    """
+    Map-reduce summary for text too long for one call: summarize chunks
+    concurrently (bounded by SUMMARY_CHUNK_CONCURRENCY, and by the global
+    OpenAI semaphore inside each call), then merge the chunk summaries, led
+    by the previous rolling summary if there is one, into the final sections.
+    """
+    chunks = chunk_transcript(segments, SUMMARY_CHUNK_TOKENS)
+    summaries = await gather_bounded([summarize_chunk(bot_id, chunk) for chunk in chunks], SUMMARY_CHUNK_CONCURRENCY)
+    logger.info(f"Summarized {len(chunks)} transcript chunks for bot {bot_id}")
+    if previous_summary:
+        summaries.insert(0, previous_summary)
+    return await reduce_summaries(summaries)
+
+async def read_store_segments(bot_id: str, since: int = 0) -> List[TranscriptSegment]:
+    """All final segments of a bot with seq > since, from the transcript store."""
+    page = await transcript_store.read(bot_id, since)
+    return page.segments() if page is not None else []
+
+async def update_rolling_summary(bot_id: str, read_after: Callable[[int], Awaitable[List[TranscriptSegment]]]) -> Optional[Dict]:
+    """
+    Bring the bot's summary checkpoint up to date. Only segments with a seq
+    after the checkpoint's last_seq (as returned by read_after) are sent,
+    together with the previous summary, so each call costs roughly the size
+    of the new text. New text above SUMMARY_CHUNK_TOKENS goes through
+    chunked_summary instead of a single call.
+    """
+    lock = summary_locks.setdefault(bot_id, asyncio.Lock())
+    async with lock:
+        checkpoint = summary_checkpoints.get(bot_id)
+        new_segments = await read_after(checkpoint["last_seq"] if checkpoint else 0)
+        if not new_segments:
+            return checkpoint
+
+        new_text = format_summary_lines(new_segments)
+        # Segments come in start-time order; a late final can have the highest seq
+        last_seq = max(seg.seq for seg in new_segments)
+        segment_count = (checkpoint["segment_count"] if checkpoint else 0) + len(new_segments)
+
+        if not new_text.strip():
+            if checkpoint:
+                checkpoint["last_seq"] = last_seq
+                checkpoint["segment_count"] = segment_count
+            return checkpoint
+
+        if estimate_tokens(new_text) > SUMMARY_CHUNK_TOKENS:
+            # Too long for one call: map-reduce over chunks of the new segments
+            summary = await chunked_summary(bot_id, new_segments, checkpoint["summary"] if checkpoint else None)
+        else:
+            if checkpoint:
+                messages = [
+                    {"role": "system", "content": ROLLING_SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Previous summary:\n{checkpoint['summary']}\n\nNew transcript segments:\n{new_text}"}
+                ]
+            else:
+                messages = [
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": new_text}
+                ]
+            summary = await create_chat_completion(messages, max_tokens=SUMMARY_MAX_TOKENS)
+        checkpoint = {"summary": summary, "last_seq": last_seq, "segment_count": segment_count}
+        summary_checkpoints[bot_id] = checkpoint
+        return checkpoint
+
+async def finalize_summary(bot_id: str, segments: TranscriptLog):
+    """
+    Final consolidation pass, run once the bot has been stopped.
+    Folds any remaining segments into the rolling summary, then rewrites it
+    into a single final summary kept in final_summaries. Closes the bot's
+    transcript log when done.
+    """
+    async def read_after(since: int) -> List[TranscriptSegment]:
+        start = segments.index_after_seq(since)
+        indexes = segments.time_sorted(start, len(segments))
+        return segments.segments(start, len(segments)) if indexes is None else segments.segments_at(indexes)
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
+        checkpoint = await update_rolling_summary(bot_id, read_after)
+        if not checkpoint:
+            return
 
-        if resp.status_code != 200:
-            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+        summary = await create_chat_completion(
+            [
+                {"role": "system", "content": FINAL_SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": checkpoint["summary"]}
+            ],
+            max_tokens=SUMMARY_MAX_TOKENS
+        )
+        # stop_bot keeps the bot's analytics report, so the transcript is not scanned again
+        analytics = final_analytics.get(bot_id)
+        if analytics is None:
+            meeting = MeetingAnalytics()
+            meeting.add(segments)
+            analytics = meeting.report()
+        final_summaries[bot_id] = {
+            "summary": summary,
+            "transcript_length": len(segments),
+            "word_count": analytics["word_count"],
+            "participants": [speaker["speaker"] for speaker in analytics["speakers"]],
+            "final": True
+        }
+        logger.info(f"Final summary ready for bot {bot_id}")
 
-        return resp.json()
+    except Exception as e:
+        logger.error(f"Final summary failed for bot {bot_id}: {str(e)}")
 
-    except httpx.RequestError as e:
-        raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
+    finally:
+        summary_checkpoints.pop(bot_id, None)
+        summary_locks.pop(bot_id, None)
+        segments.close()
+
+async def bot_analytics(bot_id: str) -> Optional[MeetingAnalytics]:
+    """
+    Speaker analytics of a bot, or None if the bot is unknown. With a shared
+    store, webhooks for one bot can land on any worker, so the statistics
+    are rebuilt from the stored transcript instead of this process' totals.
+    """
+    if not transcript_store.shared:
+        if bot_id in speaker_analytics:
+            return speaker_analytics[bot_id]
+        return MeetingAnalytics() if await transcript_store.has_bot(bot_id) else None
+
+    page = await transcript_store.read(bot_id)
+    if page is None:
+        return None
+    analytics = MeetingAnalytics()
+    analytics.add(page.segments())
+    return analytics
+
+@app.get("/bot/{bot_id}/analytics")
+async def get_speaker_analytics(bot_id: str):
+    """
+    Per-speaker talk time, word count, words per minute, turns, interruptions
+    and overlaps, plus the host's share of talk time. Times are in seconds.
+    """
+    analytics = await bot_analytics(bot_id)
+    if analytics is None:
+        if bot_id in final_analytics:
+            return {"bot_id": bot_id, "final": True, **final_analytics[bot_id]}
+        raise HTTPException(status_code=404, detail="Bot transcript not found")
+    return {"bot_id": bot_id, "final": False, **analytics.report()}
 
 @app.get("/bot/{bot_id}/summary")
-async def summarize_meeting(bot_id: str):
+async def summarize_meeting(bot_id: str, request: Request, response: Response):
     """
     Summarize meeting using live transcript data and OpenAI.
+    Summaries are rolling: each call only sends segments that arrived since the last one.
+    Responses carry an ETag; polls with a matching If-None-Match get a 304 without any LLM call.
     """
-    if bot_id not in live_transcripts or not live_transcripts[bot_id]:
-        return {"summary": "No transcript available yet."}
+    # The store's version is the bot's latest seq; None means the bot is unknown
+    version = await transcript_store.version(bot_id)
 
-    transcript_segments = live_transcripts[bot_id]
+    if bot_id in final_summaries and version is None:
+        etag = summary_etag(bot_id, "final")
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return final_summaries[bot_id]
 
-    # Combine transcript text with speaker labels
-    transcript_text = "\n".join([
-        f"{seg.get('speaker', 'Unknown')}: {seg.get('text', '')}"
-        for seg in transcript_segments
-        if seg.get('text', '').strip()
-    ])
+    if not version:
+        return {"summary": "No transcript available yet."}
 
-    if not transcript_text.strip():
-        return {"summary": "No transcript text available."}
+    etag = summary_etag(bot_id, version)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-    try:
-        # Use OpenAI to summarize
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "Summarize the following meeting transcript. Include key discussion points, decisions made, action items, and main participants. Format the summary in clear sections."
-                },
-                {"role": "user", "content": transcript_text}
-            ],
-            max_tokens=1000,
-            temperature=0.3
-        )
+    cache_key = (bot_id, version, SUMMARY_MODEL, SUMMARY_PROMPT_HASH)
+    cached = summary_cache.get(cache_key)
+    if cached is not None:
+        response.headers["ETag"] = etag
+        return cached
 
-        summary = response.choices[0].message.content
+    previous_count = summary_checkpoints.get(bot_id, {}).get("segment_count", 0)
 
-        return {
-            "summary": summary,
-            "transcript_length": len(transcript_segments),
-            "word_count": len(transcript_text.split()),
-            "participants": list(set([seg.get('speaker', 'Unknown') for seg in transcript_segments]))
+    try:
+        checkpoint = await update_rolling_summary(bot_id, lambda since: read_store_segments(bot_id, since))
+        if not checkpoint:
+            return {"summary": "No transcript text available."}
+
+        analytics = await bot_analytics(bot_id) or MeetingAnalytics()
+        result = {
+            "summary": checkpoint["summary"],
+            "transcript_length": analytics.segment_count,
+            "segments_summarized": checkpoint["segment_count"] - previous_count,
+            "word_count": analytics.word_count,
+            "participants": analytics.participants()
         }
 
+        # Only cache if no new segment landed while the LLM call was in flight
+        if await transcript_store.version(bot_id) == version:
+            summary_cache.set(cache_key, result)
+            response.headers["ETag"] = etag
+        return result
+
     except Exception as e:
         logger.error(f"OpenAI API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Summary generation failed: {str(e)}")
 
 @app.delete("/bot/{bot_id}")
-async def stop_bot(bot_id: str):
+async def stop_bot(bot_id: str, background_tasks: BackgroundTasks):
     """
     Stop a Recall.ai bot and clean up transcript storage.
+    A final summary consolidation pass runs in the background afterwards.
     """
-    url = f"https://{RECALL_REGION}.recall.ai/api/v1/bot/{bot_id}"
-    headers = {"Authorization": f"Token {RECALL_API_KEY}"}
-
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.delete(url, headers=headers)
-
-        # Clean up transcript storage
-        if bot_id in live_transcripts:
-            del live_transcripts[bot_id]
-        if bot_id in partial_transcripts:
-            del partial_transcripts[bot_id]
+        resp = await recall_request("delete_bot", "DELETE", f"/bot/{bot_id}")
 
+        # Keep the bot's state while Recall still has the bot
         if resp.status_code not in [200, 204]:
             raise HTTPException(status_code=resp.status_code, detail=resp.text)
 
+        analytics = await bot_analytics(bot_id)
+        if analytics is not None:
+            final_analytics[bot_id] = analytics.report()
+
+        # Clean up transcript storage; the final summary pass closes the log when done
+        transcripts = await discard_bot_state(bot_id, close_log=False, keep_summary=True)
+        if transcripts is not None and len(transcripts):
+            background_tasks.add_task(finalize_summary, bot_id, transcripts)
+        else:
+            if transcripts is not None:
+                transcripts.close()
+            summary_checkpoints.pop(bot_id, None)
+            summary_locks.pop(bot_id, None)
+
         return {"message": f"Bot {bot_id} stopped successfully"}
 
     except httpx.RequestError as e:
         raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
 
+# Content types for streamed exports
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "txt": "text/plain; charset=utf-8",
+    "srt": "application/x-subrip",
+    "vtt": "text/vtt; charset=utf-8"
+}
+
+async def iter_export(bot_id: str, count: int, format: str, filters: Dict[str, Any]):
+    """
+    Yield the export document for the first `count` segments matching
+    `filters`, in start-time order, piece by piece, so it can either be
+    joined for the JSON envelope or streamed to the client. Segments are
+    read from the store EXPORT_BATCH_SEGMENTS at a time, and cached cues /
+    JSON bytes are used where the store has them.
+    """
+    if format == "vtt":
+        yield "WEBVTT\n\n"
+    elif format == "json":
+        yield b"["
+
+    start = 0
+    while start < count:
+        page = await transcript_store.read_ordered(bot_id, start, min(EXPORT_BATCH_SEGMENTS, count - start), **filters)
+        if not page:
+            break
+
+        if format == "txt":
+            # Plain text format
+            for i, seg in enumerate(page.segments(), start):
+                separator = "\n" if i else ""
+                yield f"{separator}{seg.speaker}: {seg.text}"
+
+        elif format == "srt":
+            # SRT subtitle format
+            for i, cue in enumerate(page.srt_cues(), start + 1):
+                separator = "\n" if i > 1 else ""
+                yield f"{separator}{i}\n{cue}"
+
+        elif format == "vtt":
+            # WebVTT subtitle format with voice tags for speakers
+            for cue in page.vtt_cues():
+                yield cue
+
+        elif format == "jsonl":
+            for fragment in page.fragments():
+                yield fragment + b"\n"
+
+        else:
+            for i, fragment in enumerate(page.fragments(), start):
+                yield (b"," if i else b"") + fragment
+
+        start += len(page)
+
+    if format == "json":
+        yield b"]"
+
+async def stream_export(pieces, compress: bool = False):
+    """
+    Group export pieces (str or bytes) into ~EXPORT_CHUNK_SIZE byte chunks, gzip-compressing
+    on the fly when requested. Memory stays bounded by the chunk size.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer: List[bytes] = []
+    size = 0
+
+    async for piece in pieces:
+        if isinstance(piece, str):
+            piece = piece.encode("utf-8")
+        buffer.append(piece)
+        size += len(piece)
+        if size >= EXPORT_CHUNK_SIZE:
+            chunk = b"".join(buffer)
+            buffer, size = [], 0
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+    chunk = b"".join(buffer)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
 @app.get("/bots/{bot_id}/transcript/export")
-async def export_transcript(bot_id: str, format: str = "json"):
+async def export_transcript(bot_id: str, format: str = "json", stream: bool = False, gzip: bool = False,
+                            start_from: Optional[float] = Query(None, alias="from"),
+                            to: Optional[float] = None, participant_id: Optional[str] = None):
     """
-    Export the transcript in various formats (json, txt, srt).
+    Export the transcript in various formats (json, jsonl, txt, srt, vtt).
+    With stream=true the document is sent progressively as a download instead
+    of inside a JSON envelope, optionally gzip-compressed on the fly.
+    Accepts the same from / to / participant_id filters as /live-transcript.
     """
-    if bot_id not in live_transcripts:
+    if format not in EXPORT_MEDIA_TYPES:
+        format = "json"
+    filters = segment_filters(start_from, to, participant_id)
+
+    if format == "json" and not stream:
+        page = await transcript_store.read_ordered(bot_id, **filters)
+        if page is None:
+            raise HTTPException(status_code=404, detail="Bot transcript not found")
+        return json_envelope("content", page.fragments(), {"format": "json"})
+
+    # Export the segments present now; ingest may keep appending while we stream
+    page = await transcript_store.read_ordered(bot_id, limit=0, **filters)
+    if page is None:
         raise HTTPException(status_code=404, detail="Bot transcript not found")
+    count = page.total
+
+    if stream:
+        headers = {"Content-Disposition": f'attachment; filename="{bot_id}.{format}"'}
+        if gzip:
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(
+            stream_export(iter_export(bot_id, count, format, filters), compress=gzip),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers=headers
+        )
 
-    transcripts = live_transcripts[bot_id]
-
-    if format == "txt":
-        # Plain text format
-        text_content = "\n".join([
-            f"{seg.get('speaker', 'Unknown')}: {seg.get('text', '')}"
-            for seg in transcripts
-        ])
-        return {"format": "txt", "content": text_content}
-
-    elif format == "srt":
-        # SRT subtitle format
-        srt_content = []
-        for i, seg in enumerate(transcripts, 1):
-            start_time = seg.get('start_timestamp', 0)
-            end_time = seg.get('end_timestamp', start_time + 5)  # Default 5 seconds if no end time
-
-            start_srt = format_srt_time(start_time)
-            end_srt = format_srt_time(end_time)
-
-            srt_content.append(f"{i}\n{start_srt} --> {end_srt}\n{seg.get('text', '')}\n")
-
-        return {"format": "srt", "content": "\n".join(srt_content)}
-
-    else:  # Default to JSON
-        return {"format": "json", "content": transcripts}
-
-def format_srt_time(seconds: float) -> str:
-    """Format seconds to SRT time format (HH:MM:SS,mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+    content = "".join([
+        piece.decode("utf-8") if isinstance(piece, bytes) else piece
+        async for piece in iter_export(bot_id, count, format, filters)
+    ])
+    return {"format": format, "content": content}
 
 @app.get("/")
 async def root():
@@ -401,7 +1635,10 @@ async def root():
             "Partial transcript support",
             "Live transcript streaming",
             "AI-powered meeting summaries",
-            "Multiple export formats"
+            "Multiple export formats",
+            "Full-text transcript search",
+            "Time-range and per-speaker transcript filters",
+            "Speaker analytics"
         ]
     }
 
@@ -410,10 +1647,22 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "active_bots": len(live_transcripts),
-        "total_transcripts": sum(len(transcripts) for transcripts in live_transcripts.values())
+        "active_bots": len(bot_last_activity),
+        "segments_in_memory": transcript_store.segments_in_memory,
+        "store": TRANSCRIPT_STORE,
+        "ingest": ingest_pipeline.stats(),
+        "partials": partial_stats,
+        "dedup": dedup_stats,
+        "memory": memory_stats,
+        "bot_status": status_stats,
+        "search": {"documents": len(search_index), "terms": len(search_index.postings)}
     }
 
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus metrics endpoint"""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,107 @@
+from typing import Callable, Dict, Iterable
+
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily
+
+# Webhook ingest
+WEBHOOK_EVENTS = Counter(
+    "webhook_events_total",
+    "Transcript webhook events received, by event type",
+    ["event"],
+)
+WEBHOOK_EVENTS_SHED = Counter(
+    "webhook_events_shed_total",
+    "Transcript webhook events refused by admission control, by event type",
+    ["event"],
+)
+INGEST_QUEUE_DEPTH = Gauge(
+    "ingest_queue_depth",
+    "Webhook events waiting in the ingest queue",
+)
+INGEST_QUEUE_WAIT = Histogram(
+    "ingest_queue_wait_seconds",
+    "Time a webhook event spends queued before it is processed",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+TRANSCRIPT_PROCESSING = Histogram(
+    "transcript_processing_seconds",
+    "Time spent processing one ingest batch for a bot",
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+TRANSCRIPT_BATCH_SIZE = Histogram(
+    "transcript_batch_events",
+    "Events handled per ingest batch",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250),
+)
+
+# Upstream APIs
+RECALL_REQUEST_LATENCY = Histogram(
+    "recall_api_request_seconds",
+    "Recall.ai API call latency, by endpoint",
+    ["endpoint", "status"],
+)
+RECALL_RETRIES = Counter(
+    "recall_api_retries_total",
+    "Recall.ai API calls retried, by endpoint and the status (or error) that caused the retry",
+    ["endpoint", "reason"],
+)
+OPENAI_REQUEST_LATENCY = Histogram(
+    "openai_summary_request_seconds",
+    "OpenAI chat completion latency for summaries",
+    buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0),
+)
+OPENAI_TOKENS = Counter(
+    "openai_summary_tokens_total",
+    "OpenAI tokens used for summaries, by kind",
+    ["kind"],
+)
+
+# In-memory state
+ACTIVE_BOTS = Gauge(
+    "active_bots",
+    "Bots with transcript state held by this process",
+)
+SEGMENTS_IN_MEMORY = Gauge(
+    "transcript_segments_in_memory",
+    "Final transcript segments held in memory",
+)
+TRANSCRIPT_HOT_BYTES = Gauge(
+    "transcript_hot_bytes",
+    "Estimated bytes of transcript data held in RAM (not spilled to disk)",
+)
+LIVE_SUBSCRIBERS = Gauge(
+    "live_transcript_subscribers",
+    "Open SSE / WebSocket live transcript subscribers",
+)
+LIVE_EVENTS_DROPPED = Counter(
+    "live_transcript_events_dropped_total",
+    "Live transcript events dropped for slow subscribers",
+)
+
+class StatsCollector:
+    """
+    Export an existing plain-dict counter set (e.g. partial_stats) as
+    Prometheus counters without double-counting at every increment site.
+    """
+
+    def __init__(self, name: str, documentation: str, label: str, source: Callable[[], Dict[str, float]]):
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.source = source
+
+    def collect(self) -> Iterable[CounterMetricFamily]:
+        family = CounterMetricFamily(self.name, self.documentation, labels=[self.label])
+        for key, value in self.source().items():
+            family.add_metric([key], value)
+        yield family
+
+# Event types that get their own label value; anything else a sender puts in
+# the body is counted as "other", so label cardinality stays fixed
+WEBHOOK_EVENT_LABELS = ("transcript.data", "transcript.partial_data")
+
+def webhook_event_label(event_type) -> str:
+    return event_type if event_type in WEBHOOK_EVENT_LABELS else "other"
+
+def register_stats(name: str, documentation: str, label: str, source: Callable[[], Dict[str, float]]):
+    REGISTRY.register(StatsCollector(name, documentation, label, source))
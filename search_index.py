@@ -0,0 +1,192 @@
+import heapq
+import math
+import re
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+
+from segments import TranscriptSegment
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+class SearchIndex:
+    """
+    Incremental BM25 inverted index over final transcript segments.
+
+    Every segment is a document identified by a process-wide doc id; only its
+    bot and seq are kept, so hits are rendered from the transcript store.
+    Postings are two parallel arrays per term (doc ids and term frequencies)
+    that only ever grow at the end, and a bot's postings are filtered out of
+    the terms it used when the bot is removed. Once removed docs make up
+    compact_ratio of all doc ids, the doc arrays are compacted and the
+    postings renumbered, so memory follows the live bots.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, compact_ratio: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.compact_ratio = compact_ratio
+
+        self.postings: Dict[str, array] = {}  # term -> doc ids ("I")
+        self.frequencies: Dict[str, array] = {}  # term -> term frequency per posting ("H")
+
+        self.doc_bot = array("I")  # bot number of every doc
+        self.doc_seq = array("q")  # seq of the segment within its bot
+        self.doc_length = array("I")  # tokens in the doc, 0 once removed
+
+        self.bot_numbers: Dict[str, int] = {}
+        self.bot_ids: List[Optional[str]] = []
+        self.bot_terms: Dict[str, Set[str]] = {}
+        self.bot_docs: Dict[str, array] = {}
+
+        self.doc_count = 0  # live docs
+        self.removed_docs = 0  # doc ids of removed bots, reclaimed by _compact
+        self.total_length = 0  # tokens across live docs
+
+    def __len__(self) -> int:
+        return self.doc_count
+
+    def add(self, bot_id: str, segments: List[TranscriptSegment]):
+        """Index final segments of a bot as they are appended."""
+        bot_number = self.bot_numbers.get(bot_id)
+        if bot_number is None:
+            bot_number = self.bot_numbers[bot_id] = len(self.bot_ids)
+            self.bot_ids.append(bot_id)
+            self.bot_terms[bot_id] = set()
+            self.bot_docs[bot_id] = array("I")
+        bot_terms = self.bot_terms[bot_id]
+        bot_docs = self.bot_docs[bot_id]
+
+        for seg in segments:
+            tokens = tokenize(seg.text)
+            if not tokens:
+                continue
+
+            doc = len(self.doc_seq)
+            self.doc_bot.append(bot_number)
+            self.doc_seq.append(seg.seq)
+            self.doc_length.append(len(tokens))
+            bot_docs.append(doc)
+            self.doc_count += 1
+            self.total_length += len(tokens)
+
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for term, count in counts.items():
+                postings = self.postings.get(term)
+                if postings is None:
+                    postings = self.postings[term] = array("I")
+                    self.frequencies[term] = array("H")
+                postings.append(doc)
+                self.frequencies[term].append(min(count, 0xFFFF))
+                bot_terms.add(term)
+
+    def remove_bot(self, bot_id: str):
+        """Drop every posting of a bot."""
+        bot_number = self.bot_numbers.pop(bot_id, None)
+        if bot_number is None:
+            return
+        self.bot_ids[bot_number] = None
+
+        doc_bot = self.doc_bot
+        for term in self.bot_terms.pop(bot_id, ()):
+            postings = self.postings[term]
+            frequencies = self.frequencies[term]
+            keep = [i for i, doc in enumerate(postings) if doc_bot[doc] != bot_number]
+            if not keep:
+                del self.postings[term]
+                del self.frequencies[term]
+                continue
+            self.postings[term] = array("I", [postings[i] for i in keep])
+            self.frequencies[term] = array("H", [frequencies[i] for i in keep])
+
+        for doc in self.bot_docs.pop(bot_id, ()):
+            self.doc_count -= 1
+            self.removed_docs += 1
+            self.total_length -= self.doc_length[doc]
+            self.doc_length[doc] = 0
+
+        if self.removed_docs > len(self.doc_seq) * self.compact_ratio:
+            self._compact()
+
+    def _compact(self):
+        """Renumber the live docs and bots densely, dropping removed ones."""
+        bot_remap: Dict[int, int] = {}
+        bot_ids: List[Optional[str]] = []
+        for bot_id, bot_number in self.bot_numbers.items():
+            bot_remap[bot_number] = len(bot_ids)
+            bot_ids.append(bot_id)
+
+        # Removed docs have length 0; live docs keep their relative order
+        doc_remap = array("i", [-1]) * len(self.doc_seq)
+        doc_bot, doc_seq, doc_length = array("I"), array("q"), array("I")
+        for doc, length in enumerate(self.doc_length):
+            if length:
+                doc_remap[doc] = len(doc_seq)
+                doc_bot.append(bot_remap[self.doc_bot[doc]])
+                doc_seq.append(self.doc_seq[doc])
+                doc_length.append(length)
+
+        # Postings only hold live docs by now, and the remap keeps them sorted
+        for term, postings in self.postings.items():
+            self.postings[term] = array("I", [doc_remap[doc] for doc in postings])
+        for bot_id, docs in self.bot_docs.items():
+            self.bot_docs[bot_id] = array("I", [doc_remap[doc] for doc in docs])
+
+        self.doc_bot, self.doc_seq, self.doc_length = doc_bot, doc_seq, doc_length
+        self.bot_ids = bot_ids
+        self.bot_numbers = {bot_id: number for number, bot_id in enumerate(bot_ids)}
+        self.removed_docs = 0
+
+    def search(self, query: str, bot_id: Optional[str] = None, limit: int = 10) -> Tuple[int, List[Tuple[float, str, int]]]:
+        """
+        Rank docs matching any query term by BM25.
+        Returns (matching docs, [(score, bot_id, seq)] best first).
+        """
+        terms = set(tokenize(query))
+        if not terms or not self.doc_count:
+            return 0, []
+
+        bot_number = None
+        if bot_id is not None:
+            bot_number = self.bot_numbers.get(bot_id)
+            if bot_number is None:
+                return 0, []
+
+        k1, b = self.k1, self.b
+        average_length = self.total_length / self.doc_count
+        doc_bot, doc_length = self.doc_bot, self.doc_length
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (self.doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, frequency in zip(postings, self.frequencies[term]):
+                if bot_number is not None and doc_bot[doc] != bot_number:
+                    continue
+                norm = k1 * (1 - b + b * doc_length[doc] / average_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(max(limit, 0), scores.items(), key=lambda item: item[1])
+        return len(scores), [(score, self.bot_ids[doc_bot[doc]], self.doc_seq[doc]) for doc, score in best]
+
+def make_snippet(text: str, query: str, width: int = 160) -> str:
+    """Cut a window of about `width` characters around the first query term in text."""
+    if len(text) <= width:
+        return text
+
+    terms = set(tokenize(query))
+    position = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.group().lower() in terms:
+            position = match.start()
+            break
+
+    start = max(0, min(position - width // 3, len(text) - width))
+    end = start + width
+    return ("..." if start else "") + text[start:end].strip() + ("..." if end < len(text) else "")
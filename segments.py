@@ -0,0 +1,239 @@
+import json
+from array import array
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used without it
+    orjson = None
+
+# Separates word texts inside TranscriptSegment.word_text
+WORD_SEPARATOR = "\x1f"
+
+class TranscriptSegment:
+    """
+    Compact in-memory transcript segment.
+
+    Webhook payloads carry one dict per word; keeping those around costs
+    several times the size of the text itself. Relative word timings are
+    packed into two array('d') buffers, the word texts and absolute timestamps
+    into joined strings, and any other word fields into one JSON string, and
+    the per-word dicts are rebuilt only when a caller asks for them (export / JSON).
+    """
+
+    __slots__ = (
+        "text",
+        "speaker",
+        "participant_id",
+        "is_host",
+        "start_timestamp",
+        "end_timestamp",
+        "is_partial",
+        "timestamp",
+        "event_type",
+        "seq",
+        "word_starts",
+        "word_ends",
+        "word_text",
+        "word_absolute",
+        "word_extra",
+    )
+
+    def __init__(self, text: str, speaker: str, participant_id, is_host: bool,
+                 start_timestamp: float, end_timestamp: Optional[float], is_partial: bool,
+                 timestamp, event_type: str, word_starts: array, word_ends: array, word_text: str,
+                 seq: int = 0, word_absolute: Optional[str] = None, word_extra: Optional[str] = None):
+        self.text = text
+        self.speaker = speaker
+        self.participant_id = participant_id
+        self.is_host = is_host
+        self.start_timestamp = start_timestamp
+        self.end_timestamp = end_timestamp
+        self.is_partial = is_partial
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.seq = seq
+        self.word_starts = word_starts
+        self.word_ends = word_ends
+        self.word_text = word_text
+        self.word_absolute = word_absolute  # start / end pairs, None if the webhook had none
+        self.word_extra = word_extra  # JSON list of the remaining fields per word, None if there are none
+
+    @classmethod
+    def from_webhook(cls, event_type: str, words: List[Dict], participant: Dict, transcript_data: Dict) -> Optional["TranscriptSegment"]:
+        """Build a segment from a Recall.ai transcript webhook, or None if it has no text."""
+        # Extract text from words
+        text_parts = [word.get("text", "") for word in words if word.get("text")]
+        full_text = " ".join(text_parts).strip()
+
+        if not full_text:
+            return None
+
+        # Extract timestamps
+        start_timestamp = words[0].get("start_timestamp", {}).get("relative", 0) if words else 0
+        end_timestamp = words[-1].get("end_timestamp", {}).get("relative") if words else None
+
+        return cls(
+            text=full_text,
+            speaker=participant.get("name") or f"Participant {participant.get('id', 'Unknown')}",
+            participant_id=participant.get("id"),
+            is_host=participant.get("is_host", False),
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            is_partial=event_type == "transcript.partial_data",
+            timestamp=transcript_data.get("timestamp"),
+            event_type=event_type,
+            **_pack_words(words),
+        )
+
+    @property
+    def word_count(self) -> int:
+        return len(self.word_starts)
+
+    def words(self) -> List[Dict]:
+        """Rebuild the webhook-style word dicts."""
+        if not self.word_starts:
+            return []
+        texts = self.word_text.split(WORD_SEPARATOR)
+        words = [
+            {
+                "text": text,
+                "start_timestamp": {"relative": start},
+                "end_timestamp": {"relative": None if end != end else end},
+            }
+            for text, start, end in zip(texts, self.word_starts, self.word_ends)
+        ]
+        if self.word_absolute is not None:
+            absolute = self.word_absolute.split(WORD_SEPARATOR)
+            for i, word in enumerate(words):
+                word["start_timestamp"]["absolute"] = absolute[2 * i] or None
+                word["end_timestamp"]["absolute"] = absolute[2 * i + 1] or None
+        if self.word_extra is not None:
+            for word, extra in zip(words, load_json(self.word_extra)):
+                if extra:
+                    word.update(extra)
+        return words
+
+    def to_dict(self, include_words: bool = True) -> Dict:
+        """Return the segment in the public JSON shape used by the API."""
+        result = {
+            "text": self.text,
+            "speaker": self.speaker,
+            "participant_id": self.participant_id,
+            "is_host": self.is_host,
+            "start_timestamp": self.start_timestamp,
+            "end_timestamp": self.end_timestamp,
+            "is_partial": self.is_partial,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "seq": self.seq,
+        }
+        if include_words:
+            result["words"] = self.words()
+        return result
+
+    def to_json(self, include_words: bool = True) -> bytes:
+        """Serialize the public JSON shape to bytes."""
+        return dump_json(self.to_dict(include_words))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TranscriptSegment":
+        """Rebuild a segment from its public JSON shape (see to_dict)."""
+        words = data.get("words") or []
+        return cls(
+            text=data.get("text", ""),
+            speaker=data.get("speaker", "Unknown"),
+            participant_id=data.get("participant_id"),
+            is_host=data.get("is_host", False),
+            start_timestamp=data.get("start_timestamp", 0),
+            end_timestamp=data.get("end_timestamp"),
+            is_partial=data.get("is_partial", False),
+            timestamp=data.get("timestamp"),
+            event_type=data.get("event_type", "transcript.data"),
+            seq=data.get("seq", 0),
+            **_pack_words(words),
+        )
+
+def splice_words(head: bytes, seg: TranscriptSegment) -> bytes:
+    """
+    Add a segment's words to its words-free JSON (seg.to_json(include_words=False)),
+    giving the same bytes as seg.to_json().
+    """
+    return b"".join((head[:-1], b',"words":', dump_json(seg.words()), b"}"))
+
+def dump_json(obj) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def load_json(data: bytes):
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def format_srt_time(seconds: float) -> str:
+    """Format seconds to SRT time format (HH:MM:SS,mmm)"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millisecs = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+
+def format_vtt_time(seconds: float) -> str:
+    """Format seconds to WebVTT time format (HH:MM:SS.mmm)"""
+    return format_srt_time(seconds).replace(",", ".")
+
+def format_stream_line(seg: TranscriptSegment) -> str:
+    """Format a segment as "[MM:SS] speaker: text"."""
+    minutes = int(seg.start_timestamp // 60)
+    seconds = int(seg.start_timestamp % 60)
+    return f"[{minutes:02d}:{seconds:02d}] {seg.speaker}: {seg.text}"
+
+def _cue_times(seg: TranscriptSegment):
+    start_time = seg.start_timestamp
+    end_time = seg.end_timestamp if seg.end_timestamp is not None else start_time + 5  # Default 5 seconds if no end time
+    return start_time, end_time
+
+def format_srt_cue(seg: TranscriptSegment) -> str:
+    """Format a segment as an SRT block, without its index number."""
+    start_time, end_time = _cue_times(seg)
+    return f"{format_srt_time(start_time)} --> {format_srt_time(end_time)}\n{seg.text}\n"
+
+def format_vtt_cue(seg: TranscriptSegment) -> str:
+    """Format a segment as a WebVTT cue with a voice tag for the speaker."""
+    start_time, end_time = _cue_times(seg)
+    return f"{format_vtt_time(start_time)} --> {format_vtt_time(end_time)}\n<v {seg.speaker}>{seg.text}\n\n"
+
+def _or_nan(value) -> float:
+    return float("nan") if value is None else value
+
+def _pack_words(words: List[Dict]) -> Dict:
+    """Pack webhook word dicts into the TranscriptSegment word buffers."""
+    starts = [word.get("start_timestamp") or {} for word in words]
+    ends = [word.get("end_timestamp") or {} for word in words]
+
+    absolute = None
+    if any("absolute" in timestamp for timestamp in starts + ends):
+        absolute = WORD_SEPARATOR.join(
+            value
+            for start, end in zip(starts, ends)
+            for value in (start.get("absolute") or "", end.get("absolute") or "")
+        )
+
+    extras = [
+        {key: value for key, value in word.items() if key not in _PACKED_WORD_FIELDS}
+        for word in words
+    ]
+
+    return {
+        # A missing end time is stored as NaN
+        "word_starts": array("d", [start.get("relative") or 0.0 for start in starts]),
+        "word_ends": array("d", [_or_nan(end.get("relative")) for end in ends]),
+        "word_text": WORD_SEPARATOR.join(word.get("text", "") for word in words),
+        "word_absolute": absolute,
+        "word_extra": dump_json(extras).decode("utf-8") if any(extras) else None,
+    }
+
+_PACKED_WORD_FIELDS = ("text", "start_timestamp", "end_timestamp")
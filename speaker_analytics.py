@@ -0,0 +1,167 @@
+import bisect
+from typing import Any, Dict, Iterable, List, Optional
+
+from segments import TranscriptSegment
+
+class SpeakerStats:
+    """Running totals of one participant."""
+
+    __slots__ = (
+        "participant_id",
+        "speaker",
+        "is_host",
+        "talk_time",
+        "word_count",
+        "segments",
+        "turns",
+        "interruptions",
+        "interrupted",
+        "overlap_time",
+    )
+
+    def __init__(self, participant_id, speaker: str, is_host: bool):
+        self.participant_id = participant_id
+        self.speaker = speaker
+        self.is_host = is_host
+        self.talk_time = 0.0  # seconds
+        self.word_count = 0
+        self.segments = 0
+        self.turns = 0  # times this participant took the floor from someone else
+        self.interruptions = 0  # times they started while someone else was still speaking
+        self.interrupted = 0  # times someone else started over them
+        self.overlap_time = 0.0  # seconds spoken over someone else
+
+    def to_dict(self, meeting_talk_time: float) -> Dict[str, Any]:
+        minutes = self.talk_time / 60
+        return {
+            "participant_id": self.participant_id,
+            "speaker": self.speaker,
+            "is_host": self.is_host,
+            "talk_time_seconds": round(self.talk_time, 3),
+            "talk_share": round(self.talk_time / meeting_talk_time, 4) if meeting_talk_time else 0.0,
+            "word_count": self.word_count,
+            "words_per_minute": round(self.word_count / minutes, 1) if minutes else 0.0,
+            "segments": self.segments,
+            "turns": self.turns,
+            "interruptions": self.interruptions,
+            "interrupted": self.interrupted,
+            "overlap_seconds": round(self.overlap_time, 3),
+        }
+
+class MeetingAnalytics:
+    """
+    Per-speaker statistics of one bot, updated incrementally as finals
+    arrive so reports never rescan the transcript.
+
+    Turns and overlaps compare each final with its neighbour in start-time
+    order: a final from another participant is a new turn, and one starting
+    before the previous speaker's run of finals ended is an interruption of
+    them. Finals arriving in order cost O(1); a late final undoes and replays
+    the turns of the finals that start after it, usually only the last few.
+    """
+
+    def __init__(self):
+        self.speakers: Dict[str, SpeakerStats] = {}  # keyed by str(participant_id)
+        self.segment_count = 0
+        self.word_count = 0
+        self.talk_time = 0.0
+        self.host_talk_time = 0.0
+        self.turns = 0
+        self.overlaps = 0
+        self.overlap_time = 0.0
+        self.first_start: Optional[float] = None
+        self.last_end: Optional[float] = None
+        # Finals by start time, and for each one (end, speaker, took the floor,
+        # speaker interrupted, overlap, end of the speaker's run so far)
+        self._starts: List[float] = []
+        self._timeline: List[tuple] = []
+
+    def add(self, segments: Iterable[TranscriptSegment]):
+        for seg in segments:
+            key = str(seg.participant_id)
+            stats = self.speakers.get(key)
+            if stats is None:
+                stats = self.speakers[key] = SpeakerStats(seg.participant_id, seg.speaker, seg.is_host)
+            else:
+                # Names and host flags can change mid-meeting; report the latest
+                stats.speaker = seg.speaker
+                stats.is_host = seg.is_host
+
+            start = seg.start_timestamp or 0.0
+            end = seg.end_timestamp if seg.end_timestamp is not None else start
+            duration = max(0.0, end - start)
+            words = seg.word_count or len(seg.text.split())
+
+            stats.segments += 1
+            stats.talk_time += duration
+            stats.word_count += words
+            self.segment_count += 1
+            self.word_count += words
+            self.talk_time += duration
+            if seg.is_host:
+                self.host_talk_time += duration
+            self.first_start = start if self.first_start is None else min(self.first_start, start)
+            self.last_end = end if self.last_end is None else max(self.last_end, end)
+
+            # Equal starts keep ingest order, as in TranscriptLog.time_sorted
+            index = bisect.bisect_right(self._starts, start)
+            later = [(self._starts[i], self._timeline[i][0], self._timeline[i][1]) for i in range(index, len(self._starts))]
+            for entry in self._timeline[index:]:
+                self._undo_turn(entry)
+            del self._starts[index:]
+            del self._timeline[index:]
+            self._add_turn(start, end, stats)
+            for later_start, later_end, later_stats in later:
+                self._add_turn(later_start, later_end, later_stats)
+
+    def _add_turn(self, start: float, end: float, stats: SpeakerStats):
+        previous, previous_end = (self._timeline[-1][1], self._timeline[-1][5]) if self._timeline else (None, 0.0)
+        took_floor = previous is not stats
+        interrupted = None
+        overlap = 0.0
+        if took_floor:
+            stats.turns += 1
+            self.turns += 1
+            if previous is not None and start < previous_end:
+                interrupted = previous
+                overlap = min(end, previous_end) - start
+                stats.interruptions += 1
+                stats.overlap_time += overlap
+                previous.interrupted += 1
+                self.overlaps += 1
+                self.overlap_time += overlap
+            previous_end = end
+        else:
+            previous_end = max(previous_end, end)
+        self._starts.append(start)
+        self._timeline.append((end, stats, took_floor, interrupted, overlap, previous_end))
+
+    def _undo_turn(self, entry: tuple):
+        _, stats, took_floor, interrupted, overlap = entry[:5]
+        if took_floor:
+            stats.turns -= 1
+            self.turns -= 1
+        if interrupted is not None:
+            stats.interruptions -= 1
+            stats.overlap_time -= overlap
+            interrupted.interrupted -= 1
+            self.overlaps -= 1
+            self.overlap_time -= overlap
+
+    def participants(self) -> List[str]:
+        return [stats.speaker for stats in self.speakers.values()]
+
+    def report(self) -> Dict[str, Any]:
+        duration = (self.last_end - self.first_start) if self.segment_count else 0.0
+        speakers = sorted(self.speakers.values(), key=lambda stats: stats.talk_time, reverse=True)
+        return {
+            "segment_count": self.segment_count,
+            "word_count": self.word_count,
+            "duration_seconds": round(duration, 3),
+            "talk_time_seconds": round(self.talk_time, 3),
+            "host_share": round(self.host_talk_time / self.talk_time, 4) if self.talk_time else 0.0,
+            "turns": self.turns,
+            "overlaps": self.overlaps,
+            "overlap_seconds": round(self.overlap_time, 3),
+            "speakers": [stats.to_dict(self.talk_time) for stats in speakers],
+        }
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("TRANSCRIPT_WAL_DIR", "")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from segments import TranscriptSegment  # noqa: E402
+
+class StubLLM:
+    """Stands in for the OpenAI chat completions API; records calls and their concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.delay = 0.0
+        self.reply = None  # fixed completion text, or None for "summary <n>"
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        number = len(self.calls)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        content = self.reply if self.reply is not None else f"summary {number}"
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5)
+        )
+
+    def prompts(self, system_prompt: str):
+        return [call for call in self.calls if call["messages"][0]["content"] == system_prompt]
+
+@pytest.fixture(autouse=True)
+def fresh_asyncio_state(monkeypatch):
+    """
+    asyncio queues, locks and semaphores bind to the first event loop that
+    waits on them, and every test (or TestClient) runs its own loop.
+    """
+    pipeline = main.ingest_pipeline
+    monkeypatch.setattr(pipeline, "queues", [asyncio.Queue() for _ in pipeline.queues])
+    monkeypatch.setattr(main, "summary_semaphore", asyncio.Semaphore(main.SUMMARY_MAX_CONCURRENCY))
+    monkeypatch.setattr(main, "summary_locks", {})
+    monkeypatch.setattr(main, "recall_rate_limiter", main.TokenBucket(main.RECALL_RATE_LIMIT, main.RECALL_RATE_BURST))
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    stub = StubLLM()
+    monkeypatch.setattr(main.openai_client.chat.completions, "create", stub.create)
+    return stub
+
+@pytest.fixture
+def fake_recall(monkeypatch):
+    """
+    Send Recall.ai API calls to `fake_recall.handler(request)` through an
+    httpx.MockTransport; the handler may be sync or async.
+    """
+    recall = SimpleNamespace(handler=lambda request: httpx.Response(404))
+
+    def create_client():
+        return httpx.AsyncClient(
+            base_url="https://recall.test/api/v1",
+            transport=httpx.MockTransport(lambda request: recall.handler(request))
+        )
+
+    monkeypatch.setattr(main, "create_recall_client", create_client)
+    monkeypatch.setattr(main, "recall_rate_limiter", main.TokenBucket(0, 1))
+    monkeypatch.setattr(main, "RECALL_RETRY_BACKOFF", 0.001)
+    monkeypatch.setattr(main, "RECALL_RETRY_MAX_BACKOFF", 0.001)
+    return recall
+
+def wait_for_segments(client, bot_id: str, count: int, timeout: float = 5.0):
+    """Poll the live transcript until the ingest workers have stored `count` finals."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.get(f"/bot/{bot_id}/live-transcript?limit=0").json().get("total_segments") == count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"bot {bot_id} did not reach {count} segments")
+
+def transcript_event(bot_id: str, text: str, start: float, end: float, participant_id: int = 1,
+                     name: str = "Alice", event: str = "transcript.data") -> dict:
+    """A Recall.ai transcript webhook payload with evenly spaced word timings."""
+    tokens = text.split()
+    step = (end - start) / max(len(tokens), 1)
+    words = [
+        {
+            "text": token,
+            "start_timestamp": {"relative": start + step * i},
+            "end_timestamp": {"relative": start + step * (i + 1)},
+        }
+        for i, token in enumerate(tokens)
+    ]
+    participant = {"id": participant_id, "name": name, "is_host": participant_id == 1}
+    return {"event": event, "data": {"bot": {"id": bot_id}, "data": {"words": words, "participant": participant}}}
+
+def make_segment(text: str, start: float, end: float, participant_id: int = 1, name: str = "Alice") -> TranscriptSegment:
+    data = transcript_event("bot", text, start, end, participant_id, name)["data"]["data"]
+    return TranscriptSegment.from_webhook("transcript.data", data["words"], data["participant"], {})
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import httpx
+
+import main
+from conftest import transcript_event
+
+CAPACITY = 200
+
+def test_overloaded_webhook_sheds_partials_and_keeps_latency_flat(monkeypatch, stub_llm):
+    """
+    Fire webhooks far faster than a deliberately slow ingest handler drains
+    them: responses stay fast, partials are shed, and every final is either
+    accepted or refused with a 503 + Retry-After, so a retrying sender loses none.
+    """
+    pipeline = main.ingest_pipeline
+    handle_batch = pipeline.handler
+
+    async def slow_handler(bot_id, events):
+        await asyncio.sleep(0.002 * len(events))
+        await handle_batch(bot_id, events)
+
+    monkeypatch.setattr(pipeline, "handler", slow_handler)
+    monkeypatch.setattr(pipeline, "capacity", CAPACITY)
+
+    latencies = []
+    statuses = {"received": 0, "shed": 0, "overloaded": 0}
+    finals_sent = 0
+
+    async def send(client, i):
+        nonlocal finals_sent
+        final = i % 5 == 0
+        event = "transcript.data" if final else "transcript.partial_data"
+        body = transcript_event(f"bot-load-{i % 20}", f"word {i}", i, i + 1, participant_id=i % 3, event=event)
+        for _ in range(50):
+            started = time.perf_counter()
+            resp = await client.post("/api/webhook/recall/transcript", json=body)
+            latencies.append(time.perf_counter() - started)
+            if resp.status_code == 503:
+                assert resp.headers["Retry-After"] == str(main.INGEST_RETRY_AFTER)
+                statuses["overloaded"] += 1
+                await asyncio.sleep(0.05)  # Retry-After, scaled down
+                continue
+            statuses[resp.json()["status"]] += 1
+            if final:
+                finals_sent += 1
+            return
+        raise AssertionError(f"final {i} was never accepted")
+
+    async def run():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                await asyncio.gather(*[send(client, i) for i in range(3000)])
+                await asyncio.wait_for(pipeline.join(), timeout=30)
+                return sum([
+                    (await client.get(f"/bot/bot-load-{b}/live-transcript?limit=0")).json()["total_segments"]
+                    for b in range(20)
+                ])
+
+    stored_finals = asyncio.run(run())
+
+    assert statuses["shed"] > 0
+    assert finals_sent == 600
+    assert stored_finals == 600
+    assert pipeline.in_flight == 0
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    assert p99 < 0.25, f"webhook p99 {p99 * 1e3:.1f} ms under overload"
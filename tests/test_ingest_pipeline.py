@@ -0,0 +1,46 @@
+import asyncio
+import random
+
+from ingest import IngestPipeline
+
+def test_each_bot_is_processed_in_arrival_order():
+    """Batches of one bot never overtake each other, even with several workers busy."""
+    processed = {}
+    rng = random.Random(8)
+
+    async def handler(bot_id, events):
+        await asyncio.sleep(rng.random() * 0.002)
+        processed.setdefault(bot_id, []).extend(events)
+
+    async def run():
+        pipeline = IngestPipeline(handler, workers=4, queue_size=10000, batch_size=5)
+        pipeline.start()
+        for i in range(2000):
+            assert pipeline.offer(f"bot-{i % 13}", i)
+            if i % 50 == 0:
+                await asyncio.sleep(0)
+        await pipeline.stop()
+        return pipeline
+
+    pipeline = asyncio.run(run())
+
+    assert pipeline.events_processed == 2000
+    assert pipeline.in_flight == 0
+    for b in range(13):
+        assert processed[f"bot-{b}"] == list(range(b, 2000, 13))
+
+def test_offer_sheds_low_priority_first():
+    async def handler(bot_id, events):
+        pass
+
+    async def run():
+        pipeline = IngestPipeline(handler, workers=2, queue_size=10, low_priority_ratio=0.5)
+        accepted = [pipeline.offer("bot", i, high_priority=False) for i in range(6)]
+        accepted += [pipeline.offer("bot", i) for i in range(6)]
+        return pipeline, accepted
+
+    pipeline, accepted = asyncio.run(run())
+
+    assert accepted == [True] * 5 + [False] + [True] * 5 + [False]
+    assert pipeline.events_shed == {"low_priority": 1, "high_priority": 1}
+    assert pipeline.queue_depth == 10
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+import main
+from conftest import transcript_event
+
+BOT = "bot-partials"
+
+def ingest_event(text: str, start: float, end: float, event: str = "transcript.partial_data") -> tuple:
+    data = transcript_event(BOT, text, start, end, event=event)["data"]["data"]
+    return (event, data["words"], data["participant"], data)
+
+def drain(subscriber):
+    messages = []
+    while not subscriber.queue.empty():
+        kind, body = subscriber.queue.get_nowait()
+        messages.append((kind, json.loads(body)["segment"]["text"]))
+    return messages
+
+def test_newest_partial_is_pushed_when_the_window_closes(monkeypatch):
+    monkeypatch.setattr(main, "PARTIAL_COALESCE_WINDOW", 0.05)
+
+    async def run():
+        subscriber = main.subscribe_transcript(BOT, include_partial=True)
+        try:
+            await main.process_transcript_batch(BOT, [ingest_event("one", 0, 1)])
+            await main.process_transcript_batch(BOT, [ingest_event("one two", 0, 2)])
+            await main.process_transcript_batch(BOT, [ingest_event("one two three", 0, 3)])
+            leading = drain(subscriber)
+            await asyncio.sleep(0.1)
+            trailing = drain(subscriber)
+
+            # A final supersedes the held-back partial, which is then never pushed
+            await main.process_transcript_batch(BOT, [ingest_event("four", 3, 4)])
+            await main.process_transcript_batch(BOT, [ingest_event("four five", 3, 5)])
+            await main.process_transcript_batch(BOT, [ingest_event("four five six", 3, 6, "transcript.data")])
+            await asyncio.sleep(0.1)
+            return leading, trailing, drain(subscriber)
+        finally:
+            main.unsubscribe_transcript(BOT, subscriber)
+            await main.discard_bot_state(BOT)
+
+    leading, trailing, after_final = asyncio.run(run())
+
+    assert leading == [("partial", "one")]
+    assert trailing == [("partial", "one two three")]
+    assert after_final == [("partial", "four"), ("final", "four five six")]
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from conftest import make_segment, transcript_event, wait_for_segments
+from search_index import SearchIndex
+from transcript_store import RedisTranscriptStore
+
+def segments(texts):
+    result = []
+    for seq, text in enumerate(texts, 1):
+        seg = make_segment(text, seq, seq + 1)
+        seg.seq = seq
+        result.append(seg)
+    return result
+
+def test_remove_bot_compacts_doc_arrays_past_the_ratio():
+    index = SearchIndex(compact_ratio=0.5)
+    index.add("bot-a", segments(["budget review today", "ship the release"]))
+    index.add("bot-b", segments(["budget planning", "hiring update", "release notes"]))
+    index.add("bot-c", segments(["release budget sign off"]))
+
+    # 2 of 6 docs removed: below the ratio, ids are only tombstoned
+    index.remove_bot("bot-a")
+    assert len(index.doc_seq) == 6
+    assert index.removed_docs == 2
+
+    # 5 of 6 removed: arrays shrink to the live docs and postings are renumbered
+    index.remove_bot("bot-b")
+    assert len(index.doc_seq) == len(index.doc_bot) == len(index.doc_length) == 1
+    assert index.removed_docs == 0
+    assert index.bot_ids == ["bot-c"]
+    assert all(list(postings) == [0] for postings in index.postings.values())
+
+    total, hits = index.search("budget release")
+    assert total == 1
+    assert [hit[1:] for hit in hits] == [("bot-c", 1)]
+    assert index.search("budget", bot_id="bot-c")[0] == 1
+    assert index.search("budget", bot_id="bot-a") == (0, [])
+
+    # Docs added after compaction get ids after the live ones
+    index.add("bot-d", segments(["budget follow up"]))
+    assert list(index.postings["budget"]) == [0, 1]
+    assert sorted(hit[1:] for hit in index.search("budget")[1]) == [("bot-c", 1), ("bot-d", 1)]
+
+def test_search_with_shared_store_finds_segments_of_other_workers(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(main, "transcript_store", RedisTranscriptStore(fakeredis.FakeAsyncRedis(server=server), ttl=60))
+
+    async def other_worker_append(bot_id, *segs):
+        store = RedisTranscriptStore(fakeredis.FakeAsyncRedis(server=server), ttl=60)
+        await store.append(bot_id, list(segs), {})
+        await store.close()
+
+    with TestClient(main.app) as client:
+        client.post("/api/webhook/recall/transcript", json=transcript_event("bot-shared", "budget review today", 0, 1))
+        wait_for_segments(client, "bot-shared", 1)
+        asyncio.run(other_worker_append("bot-shared", make_segment("budget sign off", 1, 2)))
+        asyncio.run(other_worker_append("bot-elsewhere", make_segment("budget of another bot", 0, 1)))
+
+        scoped = client.get("/search", params={"q": "budget", "bot_id": "bot-shared"}).json()
+        assert scoped["partial"] is False
+        assert sorted(hit["seq"] for hit in scoped["results"]) == [1, 2]
+
+        # Only bots this worker knows of are searched across, and the response says so
+        everywhere = client.get("/search", params={"q": "budget"}).json()
+        assert everywhere["partial"] is True
+        assert {hit["bot_id"] for hit in everywhere["results"]} == {"bot-shared"}
+        assert everywhere["total_hits"] == 2
@@ -0,0 +1,33 @@
+from segments import TranscriptSegment, load_json
+
+WORDS = [
+    {
+        "text": "hello",
+        "start_timestamp": {"relative": 1.0, "absolute": "2024-05-01T10:00:01.000Z"},
+        "end_timestamp": {"relative": 1.4, "absolute": "2024-05-01T10:00:01.400Z"},
+    },
+    {
+        "text": "there",
+        "start_timestamp": {"relative": 1.4, "absolute": "2024-05-01T10:00:01.400Z"},
+        "end_timestamp": {"relative": None, "absolute": None},
+        "confidence": 0.93,
+    },
+]
+
+def test_words_round_trip_the_webhook_shape():
+    seg = TranscriptSegment.from_webhook("transcript.data", WORDS, {"id": 7, "name": "Bob"}, {})
+
+    assert seg.words() == WORDS
+    assert seg.to_dict()["words"] == WORDS
+    assert TranscriptSegment.from_dict(load_json(seg.to_json())).to_dict() == seg.to_dict()
+
+def test_words_without_extra_fields_stay_compact():
+    words = [
+        {"text": "hello", "start_timestamp": {"relative": 1.0}, "end_timestamp": {"relative": 1.4}},
+        {"text": "there", "start_timestamp": {"relative": 1.4}, "end_timestamp": {"relative": None}},
+    ]
+    seg = TranscriptSegment.from_webhook("transcript.data", words, {"id": 7}, {})
+
+    assert seg.word_absolute is None
+    assert seg.word_extra is None
+    assert seg.words() == words
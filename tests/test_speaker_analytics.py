@@ -0,0 +1,36 @@
+import random
+
+from conftest import make_segment
+from speaker_analytics import MeetingAnalytics
+
+def test_late_final_is_judged_against_its_start_time_neighbours():
+    analytics = MeetingAnalytics()
+    analytics.add([make_segment("alice talks", 0, 5, 1, "Alice"), make_segment("bob replies", 6, 8, 2, "Bob")])
+    analytics.add([make_segment("alice finishes", 5, 6, 1, "Alice")])
+
+    report = analytics.report()
+    assert (report["turns"], report["overlaps"]) == (2, 0)
+    assert {speaker["speaker"]: speaker["turns"] for speaker in report["speakers"]} == {"Alice": 1, "Bob": 1}
+
+def test_report_does_not_depend_on_arrival_order():
+    rng = random.Random(24)
+    segments = []
+    start = 0.0
+    for i in range(300):
+        participant = rng.choice([1, 1, 2, 3])
+        length = rng.uniform(0.5, 4)
+        segments.append(make_segment(f"line {i}", start, start + length, participant, f"speaker {participant}"))
+        start += rng.uniform(-1, length + 0.5)  # some finals start before the previous one ends
+    segments.sort(key=lambda seg: seg.start_timestamp)
+
+    in_order = MeetingAnalytics()
+    in_order.add(segments)
+
+    # Finals delivered up to five positions late, in batches
+    arrival = sorted(range(len(segments)), key=lambda i: i + rng.uniform(0, 5))
+    late = MeetingAnalytics()
+    for batch in range(0, len(arrival), 7):
+        late.add([segments[i] for i in arrival[batch:batch + 7]])
+
+    assert arrival != sorted(arrival)
+    assert late.report() == in_order.report()
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+import main
+
+def meetings(count: int):
+    return [{"meeting_url": f"https://meet.test/{i}"} for i in range(count)]
+
+def test_start_bots_reports_each_meeting_and_bounds_concurrency(fake_recall):
+    concurrency = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        url = json.loads(request.content)["meeting_url"]
+        concurrency["active"] += 1
+        concurrency["peak"] = max(concurrency["peak"], concurrency["active"])
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            concurrency["active"] -= 1
+        index = int(url.rsplit("/", 1)[1])
+        if index % 7 == 3:
+            return httpx.Response(400, text="invalid meeting url")
+        if index % 7 == 5:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(201, json={"id": f"bot-start-{index}", "meeting_url": url})
+
+    fake_recall.handler = handler
+
+    with TestClient(main.app) as client:
+        resp = client.post("/start-bots", json=meetings(30))
+
+    assert resp.status_code == 200
+    body = resp.json()
+    results = body["results"]
+    assert [result["index"] for result in results] == list(range(30))
+    assert body["total"] == 30
+    assert body["failed"] == sum(1 for i in range(30) if i % 7 in (3, 5))
+    assert body["created"] == 30 - body["failed"]
+
+    for i, result in enumerate(results):
+        assert result["meeting_url"] == f"https://meet.test/{i}"
+        if i % 7 == 3:
+            assert result["status"] == "error"
+            assert result["status_code"] == 400
+            assert result["error"] == "invalid meeting url"
+        elif i % 7 == 5:
+            assert result["status"] == "error"
+            assert result["status_code"] == 500
+        else:
+            assert result["status"] == "created"
+            assert result["bot"]["id"] == f"bot-start-{i}"
+
+    assert 1 < concurrency["peak"] <= main.START_BOTS_CONCURRENCY
+
+def test_start_bots_rejects_oversized_batch(fake_recall, monkeypatch):
+    calls = []
+    fake_recall.handler = lambda request: calls.append(request) or httpx.Response(201, json={"id": "unused"})
+    monkeypatch.setattr(main, "START_BOTS_MAX_BATCH", 3)
+
+    with TestClient(main.app) as client:
+        resp = client.post("/start-bots", json=meetings(4))
+
+    assert resp.status_code == 413
+    assert calls == []
@@ -0,0 +1,28 @@
+import httpx
+from fastapi.testclient import TestClient
+
+import main
+from conftest import transcript_event, wait_for_segments
+
+def test_stop_bot_keeps_state_when_recall_refuses(fake_recall, stub_llm):
+    fake_recall.handler = lambda request: httpx.Response(500, text="recall is down")
+
+    with TestClient(main.app) as client:
+        client.post("/api/webhook/recall/transcript", json=transcript_event("bot-stop-refused", "hello there", 0, 1))
+        wait_for_segments(client, "bot-stop-refused", 1)
+
+        assert client.delete("/bot/bot-stop-refused").status_code == 500
+        assert client.get("/bot/bot-stop-refused/live-transcript").json()["total_segments"] == 1
+        assert "bot-stop-refused" not in main.final_summaries
+
+def test_stop_bot_discards_state_and_finalizes_summary(fake_recall, stub_llm):
+    fake_recall.handler = lambda request: httpx.Response(204)
+
+    with TestClient(main.app) as client:
+        client.post("/api/webhook/recall/transcript", json=transcript_event("bot-stop-ok", "hello there", 0, 1))
+        wait_for_segments(client, "bot-stop-ok", 1)
+
+        assert client.delete("/bot/bot-stop-ok").status_code == 200
+        assert main.final_summaries["bot-stop-ok"]["final"] is True
+        assert "bot-stop-ok" not in main.summary_checkpoints
+        assert client.get("/bot/bot-stop-ok/live-transcript").json()["transcript"] == []
@@ -0,0 +1,42 @@
+import asyncio
+
+import main
+from conftest import make_segment
+
+def test_chunk_transcript_breaks_between_speaker_turns():
+    segments = [
+        make_segment("one two three", 0, 1, 1, "Alice"),
+        make_segment("four five", 1, 2, 1, "Alice"),
+        make_segment("six seven", 2, 3, 2, "Bob"),
+    ]
+    alice_turn = "Alice: one two three\nAlice: four five"
+
+    assert main.chunk_transcript(segments, 1000) == [alice_turn + "\nBob: six seven"]
+    assert main.chunk_transcript(segments, main.estimate_tokens(alice_turn) + 1) == [alice_turn, "Bob: six seven"]
+
+def test_chunked_summary_runs_chunks_concurrently_and_caches_them(stub_llm, monkeypatch):
+    monkeypatch.setattr(main, "SUMMARY_CHUNK_TOKENS", 1000)
+    monkeypatch.setattr(main, "SUMMARY_CHUNK_CONCURRENCY", 3)
+    stub_llm.delay = 0.02
+    # Eight ~380-token turns: two fit in one chunk, so four chunks
+    segments = [make_segment(f"part {i} " + "word " * 300, i * 10, i * 10 + 9, 1 + i % 2, ["Alice", "Bob"][i % 2]) for i in range(8)]
+
+    summary = asyncio.run(main.chunked_summary("bot-chunked", segments, None))
+
+    assert summary
+    assert len(stub_llm.prompts(main.CHUNK_SUMMARY_SYSTEM_PROMPT)) == 4
+    assert len(stub_llm.prompts(main.REDUCE_SUMMARY_SYSTEM_PROMPT)) == 1
+    assert 1 < stub_llm.peak <= 3
+
+    asyncio.run(main.chunked_summary("bot-chunked", segments, None))
+    assert len(stub_llm.prompts(main.CHUNK_SUMMARY_SYSTEM_PROMPT)) == 4  # served from the chunk cache
+
+def test_reduce_summaries_terminates_when_no_two_summaries_fit(stub_llm, monkeypatch):
+    monkeypatch.setattr(main, "SUMMARY_CHUNK_TOKENS", 1000)
+    stub_llm.reply = "x" * 2400  # ~600 tokens: no two merged summaries fit one call either
+    summaries = ["y" * 2400] * 5
+
+    result = asyncio.run(asyncio.wait_for(main.reduce_summaries(summaries), timeout=5))
+
+    assert result == stub_llm.reply
+    assert len(stub_llm.calls) == 4  # 5 -> 3 -> 2 -> 1
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import httpx
+
+import main
+from conftest import transcript_event
+
+BOTS = 8
+
+async def post_webhooks(client, bot_id: str, count: int, offset: float):
+    """Post `count` final webhooks one after another, returning each request's latency."""
+    latencies = []
+    for i in range(count):
+        body = transcript_event(bot_id, f"update {i}", offset + i, offset + i + 1)
+        started = time.perf_counter()
+        resp = await client.post("/api/webhook/recall/transcript", json=body)
+        latencies.append(time.perf_counter() - started)
+        assert resp.json()["status"] == "received"
+    return latencies
+
+def test_webhook_latency_stays_flat_while_summaries_run(stub_llm):
+    """
+    Summaries await the LLM on the event loop instead of blocking it, so
+    webhooks are served at the same speed while slow summary calls are in flight.
+    """
+    stub_llm.delay = 0.5
+
+    async def run():
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                for b in range(BOTS):
+                    await post_webhooks(client, f"bot-latency-{b}", 5, 0)
+                await asyncio.wait_for(main.ingest_pipeline.join(), timeout=5)
+
+                idle = await post_webhooks(client, "bot-latency-webhooks", 50, 0)
+
+                summaries = [
+                    asyncio.create_task(client.get(f"/bot/bot-latency-{b}/summary"))
+                    for b in range(BOTS)
+                ]
+                while stub_llm.active < min(BOTS, main.SUMMARY_MAX_CONCURRENCY):
+                    await asyncio.sleep(0.001)
+                busy = await post_webhooks(client, "bot-latency-webhooks", 50, 100)
+                summaries_in_flight = stub_llm.active
+
+                responses = await asyncio.gather(*summaries)
+                return idle, busy, summaries_in_flight, responses
+
+    idle, busy, summaries_in_flight, responses = asyncio.run(run())
+
+    assert summaries_in_flight > 0
+    assert all(resp.status_code == 200 for resp in responses)
+    assert all(resp.json()["summary"].startswith("summary") for resp in responses)
+
+    # All 50 webhooks finished inside one LLM call, each about as fast as with no summary running
+    assert sum(busy) < stub_llm.delay
+    assert max(busy) < max(max(idle) * 5, 0.05)
@@ -0,0 +1,41 @@
+from conftest import make_segment
+from transcript_log import TranscriptLog
+
+def make_log(starts):
+    log = TranscriptLog("bot")
+    segments = []
+    for seq, start in enumerate(starts, 1):
+        seg = make_segment(f"segment {seq}", start, start + 0.5)
+        seg.seq = seq
+        segments.append(seg)
+    log.extend(segments)
+    return log
+
+def test_time_sorted_is_none_while_segments_arrive_in_order():
+    log = make_log([0, 1, 2, 3])
+
+    assert log.time_sorted(0, len(log)) is None
+    assert log.time_sorted(1, 3) is None
+
+def test_time_sorted_after_a_late_final():
+    log = make_log([0, 1, 3, 4, 2, 5, 6])
+
+    assert log.time_sorted(0, len(log)) == [0, 1, 4, 2, 3, 5, 6]
+    assert log.time_sorted(2, 5) == [4, 2, 3]
+    assert log.time_sorted(5, 7) is None
+
+def test_fragments_splice_words_into_cached_json(tmp_path):
+    log = TranscriptLog("bot", spill_dir=str(tmp_path))
+    segments = []
+    for seq in range(1, 5):
+        seg = make_segment(f"segment {seq} words", seq, seq + 0.5)
+        seg.seq = seq
+        segments.append(seg)
+    log.extend(segments)
+    log.spill_oldest(keep_hot=2)
+
+    assert log.spilled == 2
+    assert log.json_fragments(0, 4) == [seg.to_json() for seg in segments]
+    assert log.json_fragments(0, 4, include_words=False) == [seg.to_json(include_words=False) for seg in segments]
+    assert log.json_fragments_at([3, 0], include_words=False) == [segments[3].to_json(False), segments[0].to_json(False)]
+    log.close()
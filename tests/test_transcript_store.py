@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from conftest import make_segment
+from transcript_store import InMemoryTranscriptStore, PartialSlot, RedisTranscriptStore
+
+fakeredis = pytest.importorskip("fakeredis")
+
+BOT = "bot-store"
+
+def batches():
+    """Three ingest batches with two speakers and one late final (start 3.5 after 6)."""
+    return [
+        [make_segment("hello everyone", 0, 1, 1, "Alice"), make_segment("hi alice", 1, 2, 2, "Bob")],
+        [make_segment("agenda first", 2, 3, 1, "Alice"), make_segment("sounds good", 6, 7, 2, "Bob")],
+        [make_segment("late final", 3.5, 4, 1, "Alice"), make_segment("wrap up", 8, 9, 2, "Bob")],
+    ]
+
+def partial_slot(text: str, participant_id: int, name: str) -> PartialSlot:
+    words = [{"text": word, "start_timestamp": {"relative": 9}, "end_timestamp": {"relative": 10}} for word in text.split()]
+    return PartialSlot(("transcript.partial_data", words, {"id": participant_id, "name": name}, {}), 10)
+
+def page_view(page):
+    if page is None:
+        return None
+    return {
+        "seqs": page.seqs,
+        "texts": [seg.text for seg in page.segments()],
+        "fragments": page.fragments(),
+        "total": page.total,
+        "has_more": page.has_more,
+    }
+
+READS = [
+    ("read", {}),
+    ("read", {"since": 2}),
+    ("read", {"since": 1, "limit": 2}),
+    ("read", {"limit": 0}),
+    ("read", {"start_from": 2, "start_to": 7}),
+    ("read", {"participant_id": "1"}),
+    ("read", {"since": 3, "participant_id": "2", "limit": 1}),
+    ("read", {"participant_id": "9"}),
+    ("read_ordered", {}),
+    ("read_ordered", {"offset": 2, "limit": 3}),
+    ("read_ordered", {"offset": 1, "start_from": 1, "start_to": 8}),
+    ("read_ordered", {"participant_id": "1", "limit": 2}),
+    ("read_ordered", {"limit": 0}),
+]
+
+async def exercise(store):
+    """Run the same writes and reads against a store and collect everything observable."""
+    results = {"unknown": page_view(await store.read("bot-unknown")), "versions": []}
+    for batch in batches():
+        results["versions"].append(await store.append(BOT, batch, {}))
+    await store.append(BOT, [], {1: partial_slot("still talk", 1, "Alice"), 2: partial_slot("okay", 2, "Bob")})
+    await store.append(BOT, [], {2: None})
+
+    for name, kwargs in READS:
+        results[f"{name} {kwargs}"] = page_view(await getattr(store, name)(BOT, **kwargs))
+    results["partials"] = [seg.text for seg in await store.partial_segments(BOT)]
+
+    log = await store.delete_bot(BOT)
+    results["deleted"] = [(seg.seq, seg.text) for seg in log]
+    results["deleted ordered"] = log.ordered_indexes(0, len(log))
+    log.close()
+    results["after delete"] = (await store.version(BOT), page_view(await store.read(BOT)), await store.has_bot(BOT))
+    return results
+
+def test_redis_store_matches_in_memory_store():
+    async def run():
+        memory = await exercise(InMemoryTranscriptStore())
+        redis = RedisTranscriptStore(fakeredis.FakeAsyncRedis(), ttl=60)
+        try:
+            return memory, await exercise(redis)
+        finally:
+            await redis.close()
+
+    memory, redis = asyncio.run(run())
+
+    assert memory["versions"] == [2, 4, 6]
+    assert memory["read {}"]["texts"] == ["hello everyone", "hi alice", "agenda first", "late final", "sounds good", "wrap up"]
+    assert memory["after delete"] == (None, None, False)
+    for key in memory:
+        assert redis[key] == memory[key], key
+
+def test_concurrent_append_retries_with_fresh_seq(monkeypatch):
+    """A write to the bot between WATCH and EXEC makes the append retry instead of reusing a seq."""
+    server = fakeredis.FakeServer()
+    other_worker = fakeredis.FakeRedis(server=server)
+    store = RedisTranscriptStore(fakeredis.FakeAsyncRedis(server=server), ttl=60)
+    seq_key = store._keys(BOT)[0]
+    attempts = []
+
+    pipeline_class = type(store.client.pipeline())
+    multi = pipeline_class.multi
+
+    def interleaved_multi(pipe):
+        attempts.append(1)
+        if len(attempts) == 1:
+            other_worker.incr(seq_key)  # another worker reserves seq 1 meanwhile
+        return multi(pipe)
+
+    monkeypatch.setattr(pipeline_class, "multi", interleaved_multi)
+
+    async def run():
+        seg = make_segment("after the race", 0, 1)
+        version = await store.append(BOT, [seg], {})
+        page = await store.read(BOT)
+        await store.close()
+        return version, seg.seq, page.seqs
+
+    version, seq, seqs = asyncio.run(run())
+
+    assert len(attempts) == 2
+    assert (version, seq, seqs) == (2, 2, [2])
+
+def test_append_refreshes_ttl_of_every_bot_key():
+    async def run():
+        client = fakeredis.FakeAsyncRedis()
+        store = RedisTranscriptStore(client, ttl=600)
+        await store.append(BOT, [make_segment("alice speaks", 0, 1, 1, "Alice"), make_segment("bob speaks", 1, 2, 2, "Bob")], {})
+        keys = await client.keys(f"*{BOT}*")
+        for key in keys:
+            await client.expire(key, 5)
+
+        # Only Alice speaks now; Bob's keys must not be left to expire
+        await store.append(BOT, [make_segment("alice again", 2, 3, 1, "Alice")], {})
+        ttls = {key.decode(): await client.ttl(key) for key in keys}
+        await store.close()
+        return ttls
+
+    ttls = asyncio.run(run())
+
+    assert any(key.endswith(":participant:2") for key in ttls)
+    assert all(ttl > 500 for ttl in ttls.values()), ttls
@@ -0,0 +1,161 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+import wal
+from conftest import make_segment
+from transcript_store import InMemoryTranscriptStore
+from wal import TranscriptWAL
+
+def open_store(directory) -> InMemoryTranscriptStore:
+    store = InMemoryTranscriptStore(wal=TranscriptWAL(str(directory)))
+    store.restore()
+    return store
+
+async def append(store, bot_id: str, *texts: str):
+    start = len(store.logs[bot_id]) if bot_id in store.logs else 0
+    segments = [make_segment(text, start + i, start + i + 1) for i, text in enumerate(texts)]
+    await store.append(bot_id, segments, {})
+
+def contents(store):
+    """bot id -> [(seq, text)] of everything the store holds."""
+    return {bot_id: [(seg.seq, seg.text) for seg in log] for bot_id, log in store.logs.items()}
+
+def crash(store):
+    """Drop the store the way a killed process would: no snapshot, no close of the logs."""
+    store.wal.close()
+
+def test_restore_replays_log_after_crash(tmp_path):
+    store = open_store(tmp_path)
+    asyncio.run(append(store, "bot-a", "one", "two"))
+    asyncio.run(append(store, "bot-b", "hello"))
+    asyncio.run(append(store, "bot-a", "three"))
+    crash(store)
+
+    restored = open_store(tmp_path)
+    assert contents(restored) == {"bot-a": [(1, "one"), (2, "two"), (3, "three")], "bot-b": [(1, "hello")]}
+    assert restored.segments_in_memory == 4
+
+    # Seqs continue where the crashed process stopped
+    asyncio.run(append(restored, "bot-a", "four"))
+    assert contents(restored)["bot-a"][-1] == (4, "four")
+    asyncio.run(restored.close())
+
+def test_restore_ignores_torn_trailing_record(tmp_path):
+    store = open_store(tmp_path)
+    asyncio.run(append(store, "bot-a", "one", "two"))
+    crash(store)
+    with open(tmp_path / "wal.log", "ab") as log:
+        log.write(b'a\t"bot-a"\t{"text":"thr')
+
+    restored = open_store(tmp_path)
+    assert contents(restored) == {"bot-a": [(1, "one"), (2, "two")]}
+
+    # New records start on a fresh line, so the torn one does not swallow them
+    asyncio.run(append(restored, "bot-a", "three"))
+    crash(restored)
+    assert contents(open_store(tmp_path)) == {"bot-a": [(1, "one"), (2, "two"), (3, "three")]}
+
+def test_restore_after_interrupted_snapshot(tmp_path, monkeypatch):
+    store = open_store(tmp_path)
+    asyncio.run(append(store, "bot-a", "one", "two"))
+    asyncio.run(append(store, "bot-b", "hello"))
+
+    # Die after the new snapshot is in place but before the rotated log is removed
+    remove = os.remove
+
+    def crash_on_old_log(path):
+        if path == store.wal.old_path:
+            raise OSError("killed")
+        remove(path)
+
+    monkeypatch.setattr(wal.os, "remove", crash_on_old_log)
+    with pytest.raises(OSError):
+        asyncio.run(store.snapshot())
+    monkeypatch.undo()
+    asyncio.run(append(store, "bot-a", "three"))
+    crash(store)
+    assert os.path.exists(tmp_path / "wal.log.old") and os.path.exists(tmp_path / "snapshot.log")
+
+    # Snapshot and old log hold the same segments; each is restored once
+    restored = open_store(tmp_path)
+    expected = {"bot-a": [(1, "one"), (2, "two"), (3, "three")], "bot-b": [(1, "hello")]}
+    assert contents(restored) == expected
+    assert restored.segments_in_memory == 4
+
+    # The next snapshot completes and clears the leftover log
+    assert asyncio.run(restored.snapshot())
+    crash(restored)
+    assert not os.path.exists(tmp_path / "wal.log.old")
+    assert contents(open_store(tmp_path)) == expected
+
+def test_restore_bot_deleted_and_created_again(tmp_path):
+    store = open_store(tmp_path)
+    asyncio.run(append(store, "bot-a", "old one", "old two"))
+    asyncio.run(append(store, "bot-b", "kept"))
+    log = asyncio.run(store.delete_bot("bot-a"))
+    log.close()
+    asyncio.run(append(store, "bot-a", "new one"))
+    crash(store)
+
+    # The new bot-a reuses seq 1; replay must not drop it as a duplicate of the deleted one
+    expected = {"bot-b": [(1, "kept")], "bot-a": [(1, "new one")]}
+    restored = open_store(tmp_path)
+    assert contents(restored) == expected
+
+    assert asyncio.run(restored.snapshot())
+    crash(restored)
+    assert contents(open_store(tmp_path)) == expected
+
+def test_second_process_cannot_open_the_same_directory(tmp_path):
+    first = TranscriptWAL(str(tmp_path))
+    first.open()
+
+    with pytest.raises(RuntimeError, match="in use by another process"):
+        TranscriptWAL(str(tmp_path)).open()
+
+    first.close()
+    second = TranscriptWAL(str(tmp_path))
+    second.open()
+    second.close()
+
+def test_snapshot_and_fsync_run_off_the_event_loop(tmp_path, monkeypatch):
+    store = InMemoryTranscriptStore(wal=TranscriptWAL(str(tmp_path), fsync=True))
+    store.restore()
+    blocking = []
+
+    def slow(real):
+        def call(*args):
+            time.sleep(0.05)
+            blocking.append(real.__name__)
+            return real(*args)
+        return call
+
+    monkeypatch.setattr(wal.os, "fsync", slow(os.fsync))
+    monkeypatch.setattr(store.wal, "write_snapshot", slow(store.wal.write_snapshot))
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        await append(store, "bot-a", "one", "two")
+        written = await store.snapshot()
+        task.cancel()
+        return written, ticks
+
+    written, ticks = asyncio.run(run())
+
+    assert written
+    assert "write_snapshot" in blocking and "fsync" in blocking
+    assert ticks >= 10
+    crash(store)
+    assert contents(open_store(tmp_path)) == {"bot-a": [(1, "one"), (2, "two")]}
@@ -0,0 +1,21 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+import main
+from conftest import transcript_event
+
+def events_counted(event: str) -> float:
+    return REGISTRY.get_sample_value("webhook_events_total", {"event": event}) or 0.0
+
+def test_unknown_event_types_share_one_metric_label():
+    before = {event: events_counted(event) for event in ("transcript.data", "other")}
+
+    with TestClient(main.app) as client:
+        client.post("/api/webhook/recall/transcript", json=transcript_event("bot-metrics", "hello", 0, 1))
+        for event in ("x" * 200, "transcript.spam-1", None):
+            client.post("/api/webhook/recall/transcript", json={"event": event, "data": {}})
+        client.post("/api/webhook/recall/transcript", json={"event": {"nested": 1}, "data": {}})
+
+    assert events_counted("transcript.data") == before["transcript.data"] + 1
+    assert events_counted("other") == before["other"] + 4
+    assert events_counted("transcript.spam-1") == 0
@@ -0,0 +1,387 @@
+import bisect
+import mmap
+import os
+import re
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from segments import (
+    TranscriptSegment,
+    format_srt_cue,
+    format_stream_line,
+    format_vtt_cue,
+    load_json,
+    splice_words,
+)
+
+# Rough per-segment cost of the Python objects around the cached strings
+SEGMENT_OVERHEAD_BYTES = 400
+
+class SpillFile:
+    """
+    Append-only on-disk store of serialized final segments, one JSON
+    document per line. Reads go through a read-only mmap of the file, which
+    is re-mapped whenever the file has grown since the last mapping.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offsets = array("q", [0])  # offsets[i]..offsets[i + 1] is segment i
+        self._file = open(path, "w+b")
+        self._map: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, fragments: List[bytes]):
+        position = self.offsets[-1]
+        self._file.seek(position)
+        for fragment in fragments:
+            self._file.write(fragment)
+            self._file.write(b"\n")
+            position += len(fragment) + 1
+            self.offsets.append(position)
+        self._file.flush()
+
+    def _view(self) -> mmap.mmap:
+        size = self.offsets[-1]
+        if self._map is None or self._mapped_size < size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+        return self._map
+
+    def fragments(self, start: int, end: int) -> List[bytes]:
+        """Serialized segments start..end (exclusive), without the newline."""
+        if start >= end:
+            return []
+        view = self._view()
+        return [view[self.offsets[i]:self.offsets[i + 1] - 1] for i in range(start, end)]
+
+    def segments(self, start: int, end: int) -> List[TranscriptSegment]:
+        return [TranscriptSegment.from_dict(load_json(fragment)) for fragment in self.fragments(start, end)]
+
+    def close(self, remove: bool = True):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+class StartOrder:
+    """
+    Logical indexes of a log's segments sorted by (start_timestamp, seq),
+    with a parallel array of start times to bisect on.
+    """
+
+    __slots__ = ("indexes", "starts")
+
+    def __init__(self):
+        self.indexes = array("q")
+        self.starts = array("d")
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def insert(self, index: int, start: float) -> bool:
+        """Add a segment; returns False if it did not arrive in start-time order."""
+        if not self.starts or start >= self.starts[-1]:
+            self.indexes.append(index)
+            self.starts.append(start)
+            return True
+        position = bisect.bisect_right(self.starts, start)
+        self.indexes.insert(position, index)
+        self.starts.insert(position, start)
+        return False
+
+    def bounds(self, start_from: Optional[float] = None, start_to: Optional[float] = None) -> Tuple[int, int]:
+        """Positions lo..hi (exclusive) of segments starting in [start_from, start_to)."""
+        lo = 0 if start_from is None else bisect.bisect_left(self.starts, start_from)
+        hi = len(self.starts) if start_to is None else bisect.bisect_left(self.starts, start_to)
+        return lo, max(lo, hi)
+
+class TranscriptLog:
+    """
+    Final segments of one bot, in append order, behaving like a read-only list.
+
+    Recent ("hot") segments stay in RAM together with their pre-rendered JSON
+    bytes, stream line and SRT / WebVTT cues, so read endpoints only join
+    cached pieces. The cached JSON leaves out the words, which would take
+    more room than everything else together; they are spliced in from the
+    segment's compact word buffers when a read asks for them. Older segments can be spilled to a SpillFile; they keep
+    their logical index and are decoded from disk when read.
+
+    Segments can arrive out of start-time order (webhook retries, batches
+    finishing out of order), so the log also keeps `order`: logical indexes
+    sorted by (start_timestamp, seq). An in-order append extends it in O(1);
+    a late segment is placed with bisect. The same is kept per participant,
+    next to a posting list of the participant's indexes in append order, so
+    time-range and speaker filters never scan the whole log.
+    """
+
+    def __init__(self, bot_id: str, spill_dir: Optional[str] = None):
+        self.bot_id = bot_id
+        self.spill_dir = spill_dir
+        self.spill: Optional[SpillFile] = None
+        self.spilled = 0  # Segments moved to the spill file (a prefix of the log)
+        self.seqs = array("q")  # seq of every segment, spilled or hot
+        self.starts = array("d")  # start_timestamp of every segment, in append order
+        self.order = StartOrder()
+        self.participant_orders: Dict[str, StartOrder] = {}  # keyed by str(participant_id)
+        self.participant_postings: Dict[str, array] = {}  # logical indexes, ascending
+        self.reordered = 0  # segments that did not arrive in start-time order
+
+        self.hot: List[TranscriptSegment] = []
+        self.json_heads: List[bytes] = []  # Serialized segment without its words
+        self.lines: List[str] = []  # "[MM:SS] speaker: text" for /live-transcript/stream
+        self.srt_cues: List[str] = []  # SRT block without its index number
+        self.vtt_cues: List[str] = []  # WebVTT cue
+        self.hot_bytes = 0
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return self.spilled + len(self.hot)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            start, end, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, end, step)]
+            return self.segments(start, end)
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("transcript index out of range")
+        if index < self.spilled:
+            return self.spill.segments(index, index + 1)[0]
+        return self.hot[index - self.spilled]
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for start in range(0, len(self), 500):
+            yield from self.segments(start, min(start + 500, len(self)))
+
+    # Writes
+
+    def extend(self, segments: List[TranscriptSegment]):
+        """Append final segments and render their cached representations once."""
+        for seg in segments:
+            head = seg.to_json(include_words=False)
+            line = format_stream_line(seg)
+            srt_cue = format_srt_cue(seg)
+            vtt_cue = format_vtt_cue(seg)
+
+            index = len(self)
+            start = seg.start_timestamp or 0.0
+            if not self.order.insert(index, start):
+                self.reordered += 1
+            participant = str(seg.participant_id)
+            participant_order = self.participant_orders.get(participant)
+            if participant_order is None:
+                participant_order = self.participant_orders[participant] = StartOrder()
+                self.participant_postings[participant] = array("q")
+            participant_order.insert(index, start)
+            self.participant_postings[participant].append(index)
+
+            self.hot.append(seg)
+            self.seqs.append(seg.seq)
+            self.starts.append(start)
+            self.json_heads.append(head)
+            self.lines.append(line)
+            self.srt_cues.append(srt_cue)
+            self.vtt_cues.append(vtt_cue)
+            self.hot_bytes += self._hot_size(len(self.hot) - 1)
+
+    def _hot_size(self, hot_index: int) -> int:
+        """Approximate bytes held for one hot segment and its cached renderings."""
+        seg = self.hot[hot_index]
+        words = len(seg.word_text) + len(seg.word_absolute or "") + len(seg.word_extra or "") + 16 * seg.word_count
+        return (len(self.json_heads[hot_index]) + len(self.lines[hot_index]) + len(self.srt_cues[hot_index])
+                + len(self.vtt_cues[hot_index]) + len(seg.text) + words + SEGMENT_OVERHEAD_BYTES)
+
+    def spill_oldest(self, keep_hot: int) -> int:
+        """
+        Move all but the newest keep_hot segments to the spill file.
+        Returns the number of segments spilled.
+        """
+        count = len(self.hot) - keep_hot
+        if count <= 0 or not self.spill_dir:
+            return 0
+
+        if self.spill is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", self.bot_id)
+            self.spill = SpillFile(os.path.join(self.spill_dir, f"{safe_id}-{os.getpid()}.jsonl"))
+
+        self.spill.append([splice_words(self.json_heads[i], self.hot[i]) for i in range(count)])
+        freed = sum(self._hot_size(i) for i in range(count))
+        for cache in (self.hot, self.json_heads, self.lines, self.srt_cues, self.vtt_cues):
+            del cache[:count]
+        self.spilled += count
+        self.hot_bytes -= freed
+        return count
+
+    def close(self):
+        """Release the spill file, if any."""
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
+
+    # Reads (logical indexes across spilled and hot segments)
+
+    def index_after_seq(self, since: int) -> int:
+        """Index of the first segment with seq > since."""
+        return bisect.bisect_right(self.seqs, since) if since > 0 else 0
+
+    def time_sorted(self, start: int, end: int) -> Optional[List[int]]:
+        """
+        Indexes start..end (exclusive) sorted by start time, or None when
+        they already are (the common case), so callers can read contiguously.
+        """
+        if not self.reordered:
+            return None
+        if start == 0 and end == len(self):
+            # The start-time order already holds the whole log sorted, and once
+            # a segment arrived out of order it can never be the identity
+            return self.order.indexes.tolist()
+        starts = self.starts
+        indexes = sorted(range(start, end), key=lambda i: starts[i])
+        if all(index == i for i, index in enumerate(indexes, start)):
+            return None
+        return indexes
+
+    def ordered_indexes(self, offset: int, end: int) -> Optional[List[int]]:
+        """
+        Logical indexes at start-time positions offset..end (exclusive), or
+        None if they equal offset..end because nothing arrived out of order.
+        """
+        if not self.reordered:
+            return None
+        return self.order.indexes[offset:end].tolist()
+
+    def _filter_order(self, participant_id) -> Optional[StartOrder]:
+        if participant_id is None:
+            return self.order
+        return self.participant_orders.get(str(participant_id))
+
+    def filtered(self, first: int, start_from: Optional[float] = None, start_to: Optional[float] = None,
+                 participant_id=None) -> Tuple[List[int], int]:
+        """
+        Indexes >= first (ascending, i.e. in seq order) of segments starting in
+        [start_from, start_to) and, if given, spoken by participant_id, plus
+        how many segments match the filters regardless of `first`.
+
+        Walks whichever is shorter: the matching start-time range, or the
+        segments from `first` onwards (typically few for a polling client).
+        """
+        order = self._filter_order(participant_id)
+        if order is None:
+            return [], 0
+        lo, hi = order.bounds(start_from, start_to)
+
+        if participant_id is None:
+            candidates = range(first, len(self))
+        else:
+            postings = self.participant_postings[str(participant_id)]
+            candidates = postings[bisect.bisect_left(postings, first):]
+
+        if hi - lo <= len(candidates):
+            return sorted(i for i in order.indexes[lo:hi] if i >= first), hi - lo
+
+        low = float("-inf") if start_from is None else start_from
+        high = float("inf") if start_to is None else start_to
+        starts = self.starts
+        return [i for i in candidates if low <= starts[i] < high], hi - lo
+
+    def ordered_range(self, offset: int, limit: Optional[int], start_from: Optional[float] = None,
+                      start_to: Optional[float] = None, participant_id=None) -> Tuple[List[int], int]:
+        """
+        Indexes at positions offset.. (at most limit) of the segments matching
+        the filters in start-time order, plus how many match in total.
+        """
+        order = self._filter_order(participant_id)
+        if order is None:
+            return [], 0
+        lo, hi = order.bounds(start_from, start_to)
+        start = min(lo + max(offset, 0), hi)
+        end = hi if limit is None else min(hi, start + max(limit, 0))
+        return order.indexes[start:end].tolist(), hi - lo
+
+    def segments(self, start: int, end: int) -> List[TranscriptSegment]:
+        result: List[TranscriptSegment] = []
+        if start < self.spilled:
+            result.extend(self.spill.segments(start, min(end, self.spilled)))
+        if end > self.spilled:
+            result.extend(self.hot[max(start - self.spilled, 0):end - self.spilled])
+        return result
+
+    def json_fragments(self, start: int, end: int, include_words: bool = True) -> List[bytes]:
+        result: List[bytes] = []
+        if start < self.spilled:
+            if include_words:
+                result.extend(self.spill.fragments(start, min(end, self.spilled)))
+            else:
+                result.extend(seg.to_json(include_words=False) for seg in self.spill.segments(start, min(end, self.spilled)))
+        if end > self.spilled:
+            first = max(start - self.spilled, 0)
+            heads = self.json_heads[first:end - self.spilled]
+            if include_words:
+                heads = [splice_words(head, seg) for head, seg in zip(heads, self.hot[first:end - self.spilled])]
+            result.extend(heads)
+        return result
+
+    def _rendered(self, cache: List[str], render, start: int, end: int) -> List[str]:
+        result: List[str] = []
+        if start < self.spilled:
+            result.extend(render(seg) for seg in self.spill.segments(start, min(end, self.spilled)))
+        if end > self.spilled:
+            result.extend(cache[max(start - self.spilled, 0):end - self.spilled])
+        return result
+
+    def stream_lines(self, start: int, end: int) -> List[str]:
+        return self._rendered(self.lines, format_stream_line, start, end)
+
+    def srt_cue_range(self, start: int, end: int) -> List[str]:
+        return self._rendered(self.srt_cues, format_srt_cue, start, end)
+
+    def vtt_cue_range(self, start: int, end: int) -> List[str]:
+        return self._rendered(self.vtt_cues, format_vtt_cue, start, end)
+
+    # Reads of arbitrary logical indexes (e.g. in start-time order)
+
+    def segments_at(self, indexes: List[int]) -> List[TranscriptSegment]:
+        spilled = self.spilled
+        return [self.hot[i - spilled] if i >= spilled else self.spill.segments(i, i + 1)[0] for i in indexes]
+
+    def json_fragments_at(self, indexes: List[int], include_words: bool = True) -> List[bytes]:
+        spilled = self.spilled
+        hot, heads = self.hot, self.json_heads
+        result: List[bytes] = []
+        for i in indexes:
+            if i >= spilled:
+                head = heads[i - spilled]
+                result.append(splice_words(head, hot[i - spilled]) if include_words else head)
+            elif include_words:
+                result.append(self.spill.fragments(i, i + 1)[0])
+            else:
+                result.append(self.spill.segments(i, i + 1)[0].to_json(include_words=False))
+        return result
+
+    def _rendered_at(self, cache: List[str], render, indexes: List[int]) -> List[str]:
+        spilled = self.spilled
+        return [cache[i - spilled] if i >= spilled else render(self.spill.segments(i, i + 1)[0]) for i in indexes]
+
+    def stream_lines_at(self, indexes: List[int]) -> List[str]:
+        return self._rendered_at(self.lines, format_stream_line, indexes)
+
+    def srt_cues_at(self, indexes: List[int]) -> List[str]:
+        return self._rendered_at(self.srt_cues, format_srt_cue, indexes)
+
+    def vtt_cues_at(self, indexes: List[int]) -> List[str]:
+        return self._rendered_at(self.vtt_cues, format_vtt_cue, indexes)
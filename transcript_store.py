@@ -0,0 +1,644 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from segments import (
+    TranscriptSegment,
+    format_srt_cue,
+    format_stream_line,
+    format_vtt_cue,
+    load_json,
+)
+from transcript_log import TranscriptLog
+from wal import OP_APPEND, OP_CREATE, OP_DELETE, TranscriptWAL
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # redis is optional; only the Redis backend needs it
+    WatchError = None
+
+logger = logging.getLogger(__name__)
+
+class PartialSlot:
+    """
+    Latest partial result of one participant. Only the raw webhook event is
+    kept; the TranscriptSegment is built the first time someone reads it.
+    """
+
+    __slots__ = ("event", "end_timestamp", "_segment")
+
+    def __init__(self, event: tuple, end_timestamp: Optional[float]):
+        self.event = event
+        self.end_timestamp = end_timestamp
+        self._segment = None
+
+    @property
+    def segment(self) -> Optional[TranscriptSegment]:
+        if self._segment is None:
+            self._segment = TranscriptSegment.from_webhook(*self.event)
+        return self._segment
+
+class SegmentPage:
+    """
+    Final segments as returned by TranscriptStore.read / read_ordered, in
+    start-time order. Subclasses supply the serialized fragments and decoded segments; the
+    formatted views are derived from those unless a backend has them cached.
+    """
+
+    def __init__(self, seqs: List[int], total: int, has_more: bool):
+        self.seqs = seqs
+        self.total = total  # Final segments stored for the bot (matching the filters, if any)
+        self.has_more = has_more
+
+    def __len__(self) -> int:
+        return len(self.seqs)
+
+    def next_cursor(self, since: int) -> int:
+        # Pages are in start-time order, which is not always seq order
+        return max(self.seqs) if self.seqs else since
+
+    def fragments(self, include_words: bool = True) -> List[bytes]:
+        raise NotImplementedError
+
+    def segments(self) -> List[TranscriptSegment]:
+        raise NotImplementedError
+
+    def stream_lines(self) -> List[str]:
+        return [format_stream_line(seg) for seg in self.segments()]
+
+    def srt_cues(self) -> List[str]:
+        return [format_srt_cue(seg) for seg in self.segments()]
+
+    def vtt_cues(self) -> List[str]:
+        return [format_vtt_cue(seg) for seg in self.segments()]
+
+class LogPage(SegmentPage):
+    """
+    Segments of an in-process TranscriptLog; reads use the log's caches.
+    Covers logical indexes start..end, or exactly `indexes` (already in
+    start-time order) when those are not contiguous.
+    """
+
+    def __init__(self, log: TranscriptLog, start: int, end: int, indexes: Optional[List[int]] = None,
+                 total: Optional[int] = None, has_more: Optional[bool] = None):
+        if indexes is None:
+            seqs = log.seqs[start:end].tolist()
+        else:
+            seqs = [log.seqs[i] for i in indexes]
+        super().__init__(
+            seqs,
+            len(log) if total is None else total,
+            end < len(log) if has_more is None else has_more
+        )
+        self.log = log
+        self.start = start
+        self.end = end
+        self.indexes = indexes
+
+    def fragments(self, include_words: bool = True) -> List[bytes]:
+        if self.indexes is not None:
+            return self.log.json_fragments_at(self.indexes, include_words)
+        return self.log.json_fragments(self.start, self.end, include_words)
+
+    def segments(self) -> List[TranscriptSegment]:
+        if self.indexes is not None:
+            return self.log.segments_at(self.indexes)
+        return self.log.segments(self.start, self.end)
+
+    def stream_lines(self) -> List[str]:
+        if self.indexes is not None:
+            return self.log.stream_lines_at(self.indexes)
+        return self.log.stream_lines(self.start, self.end)
+
+    def srt_cues(self) -> List[str]:
+        if self.indexes is not None:
+            return self.log.srt_cues_at(self.indexes)
+        return self.log.srt_cue_range(self.start, self.end)
+
+    def vtt_cues(self) -> List[str]:
+        if self.indexes is not None:
+            return self.log.vtt_cues_at(self.indexes)
+        return self.log.vtt_cue_range(self.start, self.end)
+
+class FragmentPage(SegmentPage):
+    """A window read as serialized segments; decoded on first use."""
+
+    def __init__(self, fragments: List[bytes], seqs: List[int], total: int, has_more: bool):
+        super().__init__(seqs, total, has_more)
+        self._fragments = fragments
+        self._segments: Optional[List[TranscriptSegment]] = None
+
+    def fragments(self, include_words: bool = True) -> List[bytes]:
+        if not include_words:
+            return [seg.to_json(include_words=False) for seg in self.segments()]
+        return self._fragments
+
+    def segments(self) -> List[TranscriptSegment]:
+        if self._segments is None:
+            self._segments = [TranscriptSegment.from_dict(load_json(fragment)) for fragment in self._fragments]
+        return self._segments
+
+class TranscriptStore:
+    """
+    Storage for per-bot final segments and latest partials.
+
+    Final segments get their per-bot seq from the store when appended, so
+    cursors stay consistent across every process sharing the store. `shared`
+    is true for backends that other workers can see; those expire idle bots
+    themselves, and a process must not delete a bot just because it has not
+    seen traffic for it.
+    """
+
+    shared = False
+    segments_in_memory = 0
+
+    async def create_bot(self, bot_id: str):
+        raise NotImplementedError
+
+    async def has_bot(self, bot_id: str) -> bool:
+        raise NotImplementedError
+
+    async def append(self, bot_id: str, finals: List[TranscriptSegment],
+                     partials: Dict[Any, Optional[PartialSlot]]) -> int:
+        """
+        Store a batch for one bot: final segments (assigning their seq) and
+        partial updates (participant id -> latest slot, or None to clear).
+        Returns the bot's transcript version, i.e. its latest seq.
+        """
+        raise NotImplementedError
+
+    async def version(self, bot_id: str) -> Optional[int]:
+        """Latest seq of the bot, or None if the bot is unknown."""
+        raise NotImplementedError
+
+    async def read(self, bot_id: str, since: int = 0, limit: Optional[int] = None,
+                   start_from: Optional[float] = None, start_to: Optional[float] = None,
+                   participant_id: Optional[str] = None) -> Optional[SegmentPage]:
+        """
+        Final segments with seq > since (the first `limit` of them by seq),
+        sorted by start time, or None if the bot is unknown. The filters keep
+        segments starting in [start_from, start_to) and spoken by
+        participant_id; page.total then counts the segments matching them.
+        """
+        raise NotImplementedError
+
+    async def read_ordered(self, bot_id: str, offset: int = 0, limit: Optional[int] = None,
+                           start_from: Optional[float] = None, start_to: Optional[float] = None,
+                           participant_id: Optional[str] = None) -> Optional[SegmentPage]:
+        """
+        Final segments at positions offset.. of the transcript (or of the
+        segments matching the filters, as for read) sorted by start time, at
+        most limit, or None if the bot is unknown.
+        """
+        raise NotImplementedError
+
+    async def partial_segments(self, bot_id: str) -> List[TranscriptSegment]:
+        raise NotImplementedError
+
+    async def delete_bot(self, bot_id: str) -> Optional[TranscriptLog]:
+        """
+        Remove a bot and return its final segments as a TranscriptLog, which
+        the caller owns and must close.
+        """
+        raise NotImplementedError
+
+    def local_logs(self) -> List[TranscriptLog]:
+        """Transcript logs held in this process' memory."""
+        return []
+
+    def spill(self, budget_bytes: float, keep_hot: int) -> int:
+        """Spill in-process segments to disk until under budget; returns segments spilled."""
+        return 0
+
+    def restore(self) -> List[str]:
+        """Reload state persisted by an earlier process; returns the restored bot ids."""
+        return []
+
+    async def snapshot(self) -> bool:
+        """Compact persisted state, if the backend keeps any; returns whether a snapshot was written."""
+        return False
+
+    async def close(self):
+        pass
+
+class InMemoryTranscriptStore(TranscriptStore):
+    """
+    Single-process store: one TranscriptLog and partial dict per bot.
+    With a TranscriptWAL, bot creation, final segments and deletion are
+    logged as they happen and restore() rebuilds the logs after a restart.
+    Partials are not persisted.
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None, wal: Optional[TranscriptWAL] = None):
+        self.spill_dir = spill_dir
+        self.wal = wal
+        self.logs: Dict[str, TranscriptLog] = {}
+        self.partials: Dict[str, Dict[Any, PartialSlot]] = {}
+        self.versions: Dict[str, int] = {}
+        self._snapshot_write: Optional[asyncio.Future] = None
+
+    def _create(self, bot_id: str) -> bool:
+        if bot_id in self.logs:
+            return False
+        self.logs[bot_id] = TranscriptLog(bot_id, self.spill_dir)
+        self.partials[bot_id] = {}
+        self.versions[bot_id] = 0
+        return True
+
+    async def create_bot(self, bot_id: str):
+        if self._create(bot_id) and self.wal is not None:
+            await self.wal.log_create(bot_id)
+
+    async def has_bot(self, bot_id: str) -> bool:
+        return bot_id in self.logs
+
+    async def append(self, bot_id: str, finals: List[TranscriptSegment],
+                     partials: Dict[Any, Optional[PartialSlot]]) -> int:
+        await self.create_bot(bot_id)
+        slots = self.partials[bot_id]
+        for participant_id, slot in partials.items():
+            if slot is None:
+                slots.pop(participant_id, None)
+            else:
+                slots[participant_id] = slot
+
+        seq = self.versions[bot_id]
+        if finals:
+            for seg in finals:
+                seq += 1
+                seg.seq = seq
+            log = self.logs[bot_id]
+            log.extend(finals)
+            self.versions[bot_id] = seq
+            self.segments_in_memory += len(finals)
+            if self.wal is not None:
+                await self.wal.log_append(bot_id, log.json_fragments(len(log) - len(finals), len(log)))
+        return seq
+
+    async def version(self, bot_id: str) -> Optional[int]:
+        return self.versions.get(bot_id)
+
+    async def read(self, bot_id: str, since: int = 0, limit: Optional[int] = None,
+                   start_from: Optional[float] = None, start_to: Optional[float] = None,
+                   participant_id: Optional[str] = None) -> Optional[SegmentPage]:
+        log = self.logs.get(bot_id)
+        if log is None:
+            return None
+        start = log.index_after_seq(since)
+        if start_from is None and start_to is None and participant_id is None:
+            end = len(log) if limit is None else min(len(log), start + max(limit, 0))
+            return LogPage(log, start, end, log.time_sorted(start, end))
+
+        matches, total = log.filtered(start, start_from, start_to, participant_id)
+        has_more = limit is not None and len(matches) > max(limit, 0)
+        if limit is not None:
+            matches = matches[:max(limit, 0)]
+        starts = log.starts
+        matches.sort(key=lambda i: starts[i])
+        return LogPage(log, 0, 0, matches, total, has_more)
+
+    async def read_ordered(self, bot_id: str, offset: int = 0, limit: Optional[int] = None,
+                           start_from: Optional[float] = None, start_to: Optional[float] = None,
+                           participant_id: Optional[str] = None) -> Optional[SegmentPage]:
+        log = self.logs.get(bot_id)
+        if log is None:
+            return None
+        if start_from is None and start_to is None and participant_id is None:
+            start = min(max(offset, 0), len(log))
+            end = len(log) if limit is None else min(len(log), start + max(limit, 0))
+            return LogPage(log, start, end, log.ordered_indexes(start, end))
+
+        indexes, total = log.ordered_range(offset, limit, start_from, start_to, participant_id)
+        return LogPage(log, 0, 0, indexes, total, max(offset, 0) + len(indexes) < total)
+
+    async def partial_segments(self, bot_id: str) -> List[TranscriptSegment]:
+        return [
+            slot.segment
+            for slot in self.partials.get(bot_id, {}).values()
+            if slot.segment is not None
+        ]
+
+    async def delete_bot(self, bot_id: str) -> Optional[TranscriptLog]:
+        log = self._delete(bot_id)
+        if log is not None and self.wal is not None:
+            await self.wal.log_delete(bot_id)
+        return log
+
+    def _delete(self, bot_id: str) -> Optional[TranscriptLog]:
+        log = self.logs.pop(bot_id, None)
+        if log is not None:
+            self.segments_in_memory -= len(log.hot)
+        self.partials.pop(bot_id, None)
+        self.versions.pop(bot_id, None)
+        return log
+
+    def local_logs(self) -> List[TranscriptLog]:
+        return list(self.logs.values())
+
+    def spill(self, budget_bytes: float, keep_hot: int) -> int:
+        total = sum(log.hot_bytes for log in self.logs.values())
+        spilled = 0
+        if total <= budget_bytes:
+            return spilled
+
+        for log in sorted(self.logs.values(), key=lambda log: log.hot_bytes, reverse=True):
+            before = log.hot_bytes
+            spilled += log.spill_oldest(keep_hot)
+            total -= before - log.hot_bytes
+            if total <= budget_bytes:
+                break
+
+        self.segments_in_memory -= spilled
+        return spilled
+
+    def restore(self) -> List[str]:
+        if self.wal is None:
+            return []
+
+        # Locks the WAL directory before anything is read from it
+        self.wal.open()
+        records = 0
+        for op, bot_id, fragment in self.wal.replay():
+            records += 1
+            if op == OP_CREATE:
+                self._create(bot_id)
+            elif op == OP_DELETE:
+                log = self._delete(bot_id)
+                if log is not None:
+                    log.close()
+            elif op == OP_APPEND and fragment is not None:
+                try:
+                    seg = TranscriptSegment.from_dict(load_json(fragment))
+                except ValueError:
+                    logger.warning(f"Skipping unreadable WAL segment for bot {bot_id}")
+                    continue
+                self._create(bot_id)
+                # Snapshot and log can overlap after an interrupted snapshot; seq makes replay idempotent
+                if seg.seq <= self.versions[bot_id]:
+                    continue
+                self.logs[bot_id].extend([seg])
+                self.versions[bot_id] = seg.seq
+                self.segments_in_memory += 1
+
+        self.wal.records_since_snapshot = records
+        logger.info(f"Restored {len(self.logs)} bots ({self.segments_in_memory} segments) from {records} WAL records")
+        return list(self.logs)
+
+    async def snapshot(self) -> bool:
+        if self.wal is None:
+            return False
+        if self._snapshot_write is not None and not self._snapshot_write.done():
+            # A cancelled caller left its write running; it must finish before the next rotation
+            await asyncio.shield(self._snapshot_write)
+        if not self.wal.records_since_snapshot:
+            return False
+
+        # Rotate and collect the fragments without awaiting, so the snapshot matches the rotated log
+        self.wal.rotate()
+        bots = [(bot_id, [log.json_fragments(0, len(log))]) for bot_id, log in self.logs.items()]
+        # Writing and fsyncing a large state takes up to a second; keep it off the event loop
+        self._snapshot_write = asyncio.ensure_future(asyncio.to_thread(self.wal.write_snapshot, bots))
+        await asyncio.shield(self._snapshot_write)
+        return True
+
+    async def close(self):
+        for log in self.logs.values():
+            log.close()
+        if self.wal is not None:
+            if self._snapshot_write is not None and not self._snapshot_write.done():
+                await asyncio.shield(self._snapshot_write)
+            self.wal.close()
+
+class RedisTranscriptStore(TranscriptStore):
+    """
+    Store shared by every worker through Redis (or anything speaking its protocol).
+
+    Per bot, with the bot id as hash tag so a cluster keeps the keys together:
+      {prefix}:{bot_id}:seq       latest seq (also marks the bot as known)
+      {prefix}:{bot_id}:segments  stream of final segments, entry id "<seq>-0"
+      {prefix}:{bot_id}:order     sorted set of zero-padded seqs scored by start time
+      {prefix}:{bot_id}:participant:{participant_id}
+                                  the same, for one participant's segments
+      {prefix}:{bot_id}:participants  set of participant ids with such a key
+      {prefix}:{bot_id}:partials  hash of participant id -> partial segment JSON
+    Every write refreshes a TTL on all of them, so abandoned bots expire on their own.
+    """
+
+    shared = True
+
+    def __init__(self, client, prefix: str = "transcript", ttl: int = 3600):
+        if WatchError is None:
+            raise RuntimeError("The redis transcript store requires the 'redis' package")
+        self.client = client  # redis.asyncio.Redis, created with decode_responses=False
+        self.prefix = prefix
+        self.ttl = int(ttl)
+
+    def _keys(self, bot_id: str):
+        base = f"{self.prefix}:{{{bot_id}}}"
+        return f"{base}:seq", f"{base}:segments", f"{base}:order", f"{base}:partials"
+
+    def _participant_keys(self, bot_id: str, participant_ids) -> List[str]:
+        base = f"{self.prefix}:{{{bot_id}}}:participant"
+        return [f"{base}:{participant_id}" for participant_id in participant_ids]
+
+    def _participants_key(self, bot_id: str) -> str:
+        return f"{self.prefix}:{{{bot_id}}}:participants"
+
+    async def create_bot(self, bot_id: str):
+        seq_key, _, _, _ = self._keys(bot_id)
+        await self.client.set(seq_key, 0, ex=self.ttl, nx=True)
+
+    async def has_bot(self, bot_id: str) -> bool:
+        seq_key, _, _, _ = self._keys(bot_id)
+        return bool(await self.client.exists(seq_key))
+
+    def _queue_partials(self, pipe, partials_key: str, partials: Dict[Any, Optional[PartialSlot]]):
+        updates = {}
+        for participant_id, slot in partials.items():
+            segment = slot.segment if slot is not None else None
+            if segment is None:
+                pipe.hdel(partials_key, str(participant_id))
+            else:
+                updates[str(participant_id)] = segment.to_json()
+        if updates:
+            pipe.hset(partials_key, mapping=updates)
+        pipe.expire(partials_key, self.ttl)
+
+    async def append(self, bot_id: str, finals: List[TranscriptSegment],
+                     partials: Dict[Any, Optional[PartialSlot]]) -> int:
+        seq_key, stream_key, order_key, partials_key = self._keys(bot_id)
+
+        if not finals:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(seq_key, 0, ex=self.ttl, nx=True)
+                pipe.get(seq_key)
+                self._queue_partials(pipe, partials_key, partials)
+                pipe.expire(seq_key, self.ttl)
+                results = await pipe.execute()
+            return int(results[1] or 0)
+
+        participants_key = self._participants_key(bot_id)
+
+        # Seqs are reserved optimistically: if another worker appends to the
+        # same bot between WATCH and EXEC, the transaction is retried.
+        async with self.client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(seq_key, participants_key)
+                    seq = int(await pipe.get(seq_key) or 0)
+                    known = {member.decode() for member in await pipe.smembers(participants_key)}
+                    pipe.multi()
+                    order = {}
+                    speaker_order: Dict[str, Dict[str, float]] = {}
+                    for seg in finals:
+                        seq += 1
+                        seg.seq = seq
+                        start = seg.start_timestamp or 0.0
+                        pipe.xadd(stream_key, {"json": seg.to_json(), "start": repr(start)}, id=f"{seq}-0")
+                        order[f"{seq:012d}"] = start
+                        speaker_order.setdefault(str(seg.participant_id), {})[f"{seq:012d}"] = start
+                    pipe.zadd(order_key, order)
+                    for participant_id, members in speaker_order.items():
+                        pipe.zadd(self._participant_keys(bot_id, [participant_id])[0], members)
+                    pipe.sadd(participants_key, *speaker_order)
+                    pipe.set(seq_key, seq, ex=self.ttl)
+                    # Refresh every participant's key, not just this batch's speakers
+                    for key in [stream_key, order_key, participants_key] + self._participant_keys(bot_id, known | set(speaker_order)):
+                        pipe.expire(key, self.ttl)
+                    self._queue_partials(pipe, partials_key, partials)
+                    await pipe.execute()
+                    return seq
+                except WatchError:
+                    logger.debug(f"Concurrent append for bot {bot_id}, retrying")
+                    continue
+
+    async def version(self, bot_id: str) -> Optional[int]:
+        seq_key, _, _, _ = self._keys(bot_id)
+        value = await self.client.get(seq_key)
+        return None if value is None else int(value)
+
+    async def read(self, bot_id: str, since: int = 0, limit: Optional[int] = None,
+                   start_from: Optional[float] = None, start_to: Optional[float] = None,
+                   participant_id: Optional[str] = None) -> Optional[SegmentPage]:
+        if start_from is not None or start_to is not None or participant_id is not None:
+            return await self._read_filtered(bot_id, since, limit, start_from, start_to, participant_id)
+
+        seq_key, stream_key, _, _ = self._keys(bot_id)
+        if limit is not None and limit <= 0:
+            entries_count = 0
+        else:
+            entries_count = None if limit is None else limit + 1
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.exists(seq_key)
+            pipe.xlen(stream_key)
+            if entries_count != 0:
+                # One extra entry tells whether more remain after this page
+                pipe.xrange(stream_key, min=f"{since + 1}-0" if since > 0 else "-", max="+", count=entries_count)
+            results = await pipe.execute()
+
+        if not results[0]:
+            return None
+        entries = results[2] if entries_count != 0 else []
+        has_more = limit is not None and (len(entries) > limit or (limit <= 0 and results[1] > 0))
+        if limit is not None:
+            entries = entries[:max(limit, 0)]
+
+        # Stream entries are in seq order; a stable sort puts them in start-time order
+        entries.sort(key=self._entry_start)
+        seqs = [int(entry_id.split(b"-", 1)[0]) for entry_id, _ in entries]
+        fragments = [fields[b"json"] for _, fields in entries]
+        return FragmentPage(fragments, seqs, results[1], has_more)
+
+    @staticmethod
+    def _entry_start(entry) -> float:
+        fields = entry[1]
+        if b"start" in fields:
+            return float(fields[b"start"])
+        return load_json(fields[b"json"]).get("start_timestamp") or 0.0
+
+    def _order_query(self, bot_id: str, start_from: Optional[float], start_to: Optional[float], participant_id: Optional[str]):
+        """Sorted set to query and its score bounds; start_to is exclusive."""
+        _, _, order_key, _ = self._keys(bot_id)
+        key = order_key if participant_id is None else self._participant_keys(bot_id, [participant_id])[0]
+        low = "-inf" if start_from is None else repr(float(start_from))
+        high = "+inf" if start_to is None else f"({float(start_to)!r}"
+        return key, low, high
+
+    async def _fetch(self, stream_key: str, seqs: List[int]) -> FragmentPage:
+        """Stream entries of `seqs`, keeping their order; total / has_more are set by the caller."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            for seq in seqs:
+                pipe.xrange(stream_key, min=f"{seq}-0", max=f"{seq}-0")
+            results = await pipe.execute() if seqs else []
+
+        fragments = []
+        found = []
+        for seq, entries in zip(seqs, results):
+            if entries:  # Trimmed or expired between the two round trips
+                fragments.append(entries[0][1][b"json"])
+                found.append(seq)
+        return FragmentPage(fragments, found, 0, False)
+
+    async def _read_filtered(self, bot_id: str, since: int, limit: Optional[int], start_from: Optional[float],
+                             start_to: Optional[float], participant_id: Optional[str]) -> Optional[SegmentPage]:
+        seq_key, stream_key, _, _ = self._keys(bot_id)
+        key, low, high = self._order_query(bot_id, start_from, start_to, participant_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.exists(seq_key)
+            pipe.zrangebyscore(key, low, high)
+            exists, members = await pipe.execute()
+        if not exists:
+            return None
+
+        # Members come in start-time order; the page is the first `limit` newer than the cursor by seq
+        seqs = [seq for seq in map(int, members) if seq > since]
+        has_more = limit is not None and len(seqs) > max(limit, 0)
+        if has_more:
+            keep = set(sorted(seqs)[:max(limit, 0)])
+            seqs = [seq for seq in seqs if seq in keep]
+        page = await self._fetch(stream_key, seqs)
+        page.total = len(members)
+        page.has_more = has_more
+        return page
+
+    async def read_ordered(self, bot_id: str, offset: int = 0, limit: Optional[int] = None,
+                           start_from: Optional[float] = None, start_to: Optional[float] = None,
+                           participant_id: Optional[str] = None) -> Optional[SegmentPage]:
+        seq_key, stream_key, _, _ = self._keys(bot_id)
+        key, low, high = self._order_query(bot_id, start_from, start_to, participant_id)
+        offset = max(offset, 0)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.exists(seq_key)
+            pipe.zcount(key, low, high)
+            if limit is None or limit > 0:
+                pipe.zrangebyscore(key, low, high, start=offset, num=-1 if limit is None else limit)
+            results = await pipe.execute()
+        if not results[0]:
+            return None
+
+        seqs = [int(member) for member in results[2]] if len(results) > 2 else []
+        page = await self._fetch(stream_key, seqs)
+        page.total = results[1]
+        page.has_more = offset + len(seqs) < results[1]
+        return page
+
+    async def partial_segments(self, bot_id: str) -> List[TranscriptSegment]:
+        _, _, _, partials_key = self._keys(bot_id)
+        values = await self.client.hvals(partials_key)
+        return [TranscriptSegment.from_dict(load_json(value)) for value in values]
+
+    async def delete_bot(self, bot_id: str) -> Optional[TranscriptLog]:
+        page = await self.read(bot_id)
+        participants_key = self._participants_key(bot_id)
+        participants = [member.decode() for member in await self.client.smembers(participants_key)]
+        await self.client.delete(*self._keys(bot_id), participants_key, *self._participant_keys(bot_id, participants))
+        if page is None:
+            return None
+        log = TranscriptLog(bot_id)
+        # The log is kept in seq order; it sorts by start time itself
+        log.extend(sorted(page.segments(), key=lambda seg: seg.seq))
+        return log
+
+    async def close(self):
+        await self.client.aclose()
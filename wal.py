@@ -0,0 +1,173 @@
+import asyncio
+import fcntl
+import logging
+import os
+import shutil
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from segments import dump_json, load_json
+
+logger = logging.getLogger(__name__)
+
+# Record kinds
+OP_CREATE = b"c"
+OP_APPEND = b"a"
+OP_DELETE = b"d"
+
+class TranscriptWAL:
+    """
+    Append-only write-ahead log of transcript store writes, plus a compact
+    snapshot so the log does not grow without limit.
+
+    Records are one line each: op, bot id (JSON string) and, for appends, the
+    serialized segment, separated by tabs. JSON never contains a raw tab or
+    newline, so replay splits lines without parsing the segment twice, and
+    appends write the cached segment bytes as-is.
+
+    A snapshot is taken in two steps: rotate() moves the log to wal.log.old,
+    then write_snapshot() writes every bot into snapshot.log.tmp, renames it
+    over snapshot.log and only then deletes the old log. write_snapshot()
+    only touches those files, so it can run in a thread while new records
+    go to the fresh log. Replay reads snapshot, old log and current log in that order;
+    segments are applied idempotently by seq, so a crash at any point of a
+    snapshot loses nothing and duplicates nothing.
+
+    The directory belongs to one process: open() takes an exclusive flock on
+    its lock file and raises if another process holds it.
+    """
+
+    def __init__(self, directory: str, fsync: bool = False):
+        self.directory = directory
+        self.fsync = fsync
+        self.wal_path = os.path.join(directory, "wal.log")
+        self.old_path = self.wal_path + ".old"
+        self.snapshot_path = os.path.join(directory, "snapshot.log")
+        self.lock_path = os.path.join(directory, "lock")
+        self._file = None
+        self._lock = None
+        self.records_since_snapshot = 0
+
+    def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        if self._lock is None:
+            lock = open(self.lock_path, "ab")
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                raise RuntimeError(f"Transcript WAL directory {self.directory} is in use by another process")
+            self._lock = lock
+        if self._file is None:
+            self._file = open(self.wal_path, "ab")
+            if self._file.tell() and not self._ends_with_newline():
+                # Terminate a torn record so new records start on their own line
+                self._file.write(b"\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.wal_path, "rb") as records:
+            records.seek(-1, os.SEEK_END)
+            return records.read(1) == b"\n"
+
+    def _close_log(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """Close the log and release the directory lock."""
+        self._close_log()
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    # Writes
+
+    async def _write(self, data: bytes, records: int):
+        """
+        Append records. The write itself happens before the first await, so
+        records land in call order; with fsync on, the sync runs in a thread
+        on a duplicate descriptor, which stays valid if rotate() closes the log.
+        """
+        if self._file is None:
+            self.open()
+        self._file.write(data)
+        self._file.flush()
+        self.records_since_snapshot += records
+        if self.fsync:
+            fd = os.dup(self._file.fileno())
+            try:
+                await asyncio.to_thread(os.fsync, fd)
+            finally:
+                os.close(fd)
+
+    async def log_create(self, bot_id: str):
+        await self._write(OP_CREATE + b"\t" + dump_json(bot_id) + b"\n", 1)
+
+    async def log_append(self, bot_id: str, fragments: List[bytes]):
+        if not fragments:
+            return
+        prefix = OP_APPEND + b"\t" + dump_json(bot_id) + b"\t"
+        await self._write(b"".join(prefix + fragment + b"\n" for fragment in fragments), len(fragments))
+
+    async def log_delete(self, bot_id: str):
+        await self._write(OP_DELETE + b"\t" + dump_json(bot_id) + b"\n", 1)
+
+    def rotate(self):
+        """
+        Start a snapshot: move the log aside to wal.log.old and open a fresh
+        one. The caller must capture the state to snapshot before anything
+        else is written, then pass it to write_snapshot().
+        """
+        self.open()
+        self._close_log()
+        if os.path.exists(self.old_path):
+            # An earlier snapshot did not finish; keep its records until this one does
+            with open(self.old_path, "ab") as old, open(self.wal_path, "rb") as current:
+                shutil.copyfileobj(current, old)
+            os.remove(self.wal_path)
+        else:
+            os.replace(self.wal_path, self.old_path)
+        self.open()
+        self.records_since_snapshot = 0
+
+    def write_snapshot(self, bots: Iterable[Tuple[str, Iterable[List[bytes]]]]):
+        """
+        Finish a snapshot started by rotate(): replace snapshot + old log with
+        `bots`, (bot_id, batches of serialized segments) pairs describing the
+        complete state at rotation. Blocking file I/O; safe to run in a thread.
+        """
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as snapshot:
+            for bot_id, batches in bots:
+                bot_json = dump_json(bot_id)
+                snapshot.write(OP_CREATE + b"\t" + bot_json + b"\n")
+                prefix = OP_APPEND + b"\t" + bot_json + b"\t"
+                for fragments in batches:
+                    snapshot.write(b"".join(prefix + fragment + b"\n" for fragment in fragments))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        os.remove(self.old_path)
+
+    # Replay
+
+    def replay(self) -> Iterator[Tuple[bytes, str, Optional[bytes]]]:
+        """Yield (op, bot_id, segment bytes or None) for every stored record, oldest first."""
+        for path in (self.snapshot_path, self.old_path, self.wal_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as records:
+                for line_number, line in enumerate(records, 1):
+                    if not line.endswith(b"\n"):
+                        # Torn write at crash time; everything before it is intact
+                        logger.warning(f"Ignoring incomplete record at {path}:{line_number}")
+                        break
+                    if line == b"\n":
+                        continue
+                    parts = line[:-1].split(b"\t", 2)
+                    try:
+                        bot_id = load_json(parts[1])
+                    except (IndexError, ValueError):
+                        logger.warning(f"Ignoring malformed record at {path}:{line_number}")
+                        continue
+                    yield parts[0], bot_id, parts[2] if len(parts) > 2 else None